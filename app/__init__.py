@@ -1,3 +1,4 @@
+import atexit
 from flask import Flask
 from apscheduler.schedulers.background import BackgroundScheduler
 from flask_login import LoginManager
@@ -8,14 +9,29 @@ from config import Config
 from functools import partial
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-from app.models import db, User, Monitor, Settings, MyUserModelView, MyModelView
+from app.models import (
+    db,
+    User,
+    Monitor,
+    Settings,
+    AlertOutbox,
+    AlertRule,
+    MyUserModelView,
+    MyModelView,
+    AlertRuleModelView,
+)
 from app.utils.logging import logger
+from app.utils.sqlite_utils import configure_sqlite_engine, DEFAULT_SQLITE_PRAGMAS
 from typing import Optional
 
 app: Flask = Flask(__name__)
 app.config.from_object(Config)
 
 db.init_app(app)
+with app.app_context():
+    configure_sqlite_engine(
+        db.engine, app.config.get("SQLITE_PRAGMAS", DEFAULT_SQLITE_PRAGMAS)
+    )
 migrate: Migrate = Migrate(app, db)
 
 limiter = Limiter(
@@ -39,6 +55,8 @@ admin: Admin = Admin(
 admin.add_view(MyUserModelView(User, db.session))
 admin.add_view(MyModelView(Monitor, db.session))
 admin.add_view(MyModelView(Settings, db.session))
+admin.add_view(MyModelView(AlertOutbox, db.session))
+admin.add_view(AlertRuleModelView(AlertRule, db.session))
 
 
 @login_manager.user_loader
@@ -64,28 +82,57 @@ def run_job_with_context(func, *args, **kwargs):
             return result
         except Exception as e:
             logger.error(f"Error in run_job_with_context: job {func.__name__}: {e}")
-            with app.app_context():
-                from app.utils.email_utils import send_admin_email
+            from app.utils.error_aggregator import report_error
 
-                send_admin_email("Error in run_job_with_context", str(e))
+            report_error(f"Error in run_job_with_context: job {func.__name__}", str(e), e)
             raise
 
 
 def start_scheduler() -> None:
     """
     Starts the background scheduler that periodically checks system resources.
+
+    If `COLLECTOR_INTERVAL_S` is set, sampling runs on the high-frequency
+    collector thread and the scheduler only applies data retention every minute.
+    Alerts enqueued by the sampling are delivered by the `dispatch_alerts` job.
     """
     try:
-        from app.utils.system_monitor import check_resources
+        from app.utils.system_monitor import check_resources, remove_old_data
+        from app.utils.collector import start_collector
         from app.utils.logs_utils import send_logs_via_email_and_clear_logs
         from app.utils.db_utils import backup_database
+        from app.utils.rollup_utils import rollup_monitor_data
+        from app.utils.outbox_utils import dispatch_alerts
+        from app.utils.error_aggregator import error_aggregator
 
+        atexit.register(error_aggregator.close)
         scheduler: BackgroundScheduler = BackgroundScheduler()
+        collector = start_collector(app)
+        if collector is not None:
+            atexit.register(collector.stop)
+            scheduler.add_job(
+                func=partial(run_job_with_context, remove_old_data),
+                trigger="interval",
+                minutes=1,
+            )
+        else:
+            scheduler.add_job(
+                func=partial(run_job_with_context, check_resources),
+                trigger="interval",
+                minutes=1,
+            )
         scheduler.add_job(
-            func=partial(run_job_with_context, check_resources),
+            func=partial(run_job_with_context, rollup_monitor_data),
             trigger="interval",
             minutes=1,
         )
+        scheduler.add_job(
+            func=partial(run_job_with_context, dispatch_alerts),
+            trigger="interval",
+            seconds=app.config.get("ALERT_DISPATCH_INTERVAL_S", 10),
+            max_instances=1,
+            coalesce=True,
+        )
         scheduler.add_job(
             func=partial(run_job_with_context, send_logs_via_email_and_clear_logs),
             trigger="interval",
@@ -101,9 +148,9 @@ def start_scheduler() -> None:
     
     except Exception as e:
         logger.error(f"Error in start_scheduler: {e}")
-        with app.app_context():
-            from app.utils.email_utils import send_admin_email
-            send_admin_email("Error in start_scheduler", str(e))
+        from app.utils.error_aggregator import report_error
+
+        report_error("Error in start_scheduler", str(e), e)
 
 
 from app.routes import api, session, main
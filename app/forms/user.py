@@ -16,6 +16,9 @@ class UserForm(FlaskForm):
         telegram_chat_id (StringField): Telegram chat ID for sending alerts (optional).
         date_created (DateTimeField): The date and time the user account was created (optional).
         last_login (DateTimeField): The date and time of the user's last login (optional).
+        last_alert_time (DateTimeField): The date and time of the last alert on any channel (optional).
+        last_email_alert_time (DateTimeField): The date and time of the last email alert (optional).
+        last_telegram_alert_time (DateTimeField): The date and time of the last Telegram alert (optional).
         login_errors (IntegerField): The number of failed login attempts (optional).
         is_suspended (BooleanField): Indicates if the user account is suspended.
     """
@@ -29,5 +32,9 @@ class UserForm(FlaskForm):
     date_created = DateTimeField("date_created", validators=[Optional()])
     last_login = DateTimeField("last_login", validators=[Optional()])
     last_alert_time = DateTimeField("last_alert_time", validators=[Optional()])
+    last_email_alert_time = DateTimeField("last_email_alert_time", validators=[Optional()])
+    last_telegram_alert_time = DateTimeField(
+        "last_telegram_alert_time", validators=[Optional()]
+    )
     login_errors = IntegerField("login_errors", validators=[Optional()])
     is_suspended = BooleanField("is_suspended")
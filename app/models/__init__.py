@@ -4,5 +4,9 @@ db = SQLAlchemy()
 
 from .user import User
 from .monitor import Monitor
+from .rollup import MonitorRollup
+from .metric_sample import MetricSample
 from .settings import Settings
-from .admin import MyUserModelView, MyModelView
+from .alert_outbox import AlertOutbox
+from .alert_rule import AlertRule
+from .admin import MyUserModelView, MyModelView, AlertRuleModelView
@@ -47,3 +47,12 @@ class MyModelView(AdminProtectedModelView):
     Generic admin view for other models.
     """
     pass
+
+
+class AlertRuleModelView(AdminProtectedModelView):
+    """
+    Admin view for the AlertRule model, restricting the operator choices.
+    """
+    form_choices = {
+        "operator": [(">", ">"), (">=", ">="), ("<", "<"), ("<=", "<=")],
+    }
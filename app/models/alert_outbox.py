@@ -0,0 +1,46 @@
+from datetime import datetime
+from typing import Optional
+from app.models import db
+
+
+class AlertOutbox(db.Model):
+    """
+    A database model representing an alert waiting to be delivered to the users.
+
+    Alerts are enqueued by the sampling code and delivered by a separate
+    dispatcher job, so the sampling never waits for SMTP/Telegram and pending
+    alerts survive restarts.
+
+    Attributes:
+        id (int): The unique identifier of the alert.
+        subject (str): The alert title, used as the email subject.
+        body (str): The alert message content.
+        created_at (datetime): The time when the alert was enqueued.
+        attempts (int): The number of failed delivery attempts.
+        next_attempt_at (Optional[datetime]): The earliest time of the next delivery
+            attempt. None once the alert was sent or given up.
+        sent_at (Optional[datetime]): The time when the alert was delivered.
+        last_error (Optional[str]): The error of the last failed attempt.
+    """
+
+    __table_args__ = (
+        db.Index("ix_alert_outbox_next_attempt_at", "next_attempt_at"),
+    )
+
+    id: int = db.Column(db.Integer, primary_key=True)
+    subject: str = db.Column(db.String(255), nullable=False)
+    body: str = db.Column(db.Text, nullable=False)
+    created_at: datetime = db.Column(db.DateTime, nullable=False, default=datetime.now)
+    attempts: int = db.Column(db.Integer, nullable=False, default=0)
+    next_attempt_at: Optional[datetime] = db.Column(db.DateTime, nullable=True)
+    sent_at: Optional[datetime] = db.Column(db.DateTime, nullable=True)
+    last_error: Optional[str] = db.Column(db.Text, nullable=True)
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the AlertOutbox record.
+
+        Returns:
+            str: A string containing the id and subject of the alert.
+        """
+        return f"<AlertOutbox {self.id} {self.subject}>"
@@ -0,0 +1,43 @@
+from app.models import db
+
+
+class AlertRule(db.Model):
+    """
+    A database model representing a threshold alert rule over a stored metric.
+
+    The rule fires when the rolling average of the last `avg_window` values
+    compares true against the threshold for `for_samples` consecutive samples,
+    and resolves once the average moves back past the threshold by more than
+    `hysteresis`, so a noisy metric doesn't flap between the two.
+
+    Attributes:
+        id (int): The unique identifier of the rule.
+        name (str): The rule name, used in the alert subject.
+        metric (str): A `Monitor` column (e.g. "cpu_temp", "ram", "net_sent_rate")
+            or a `MetricSample` series (e.g. "load.1m").
+        operator (str): One of ">", ">=", "<", "<=".
+        threshold (float): The limit the average is compared against.
+        for_samples (int): Consecutive breaching samples needed to fire.
+        avg_window (int): Number of samples in the rolling average (1 = raw value).
+        hysteresis (float): Margin past the threshold needed to resolve.
+        enabled (bool): Disabled rules are not evaluated.
+    """
+
+    id: int = db.Column(db.Integer, primary_key=True)
+    name: str = db.Column(db.String(80), nullable=False)
+    metric: str = db.Column(db.String(128), nullable=False)
+    operator: str = db.Column(db.String(2), nullable=False, default=">=")
+    threshold: float = db.Column(db.Float, nullable=False)
+    for_samples: int = db.Column(db.Integer, nullable=False, default=1)
+    avg_window: int = db.Column(db.Integer, nullable=False, default=1)
+    hysteresis: float = db.Column(db.Float, nullable=False, default=0)
+    enabled: bool = db.Column(db.Boolean, nullable=False, default=True)
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the AlertRule record.
+
+        Returns:
+            str: A string containing the name and condition of the rule.
+        """
+        return f"<AlertRule {self.name}: {self.metric} {self.operator} {self.threshold}>"
@@ -0,0 +1,35 @@
+from datetime import datetime
+from app.models import db
+
+
+class MetricSample(db.Model):
+    """
+    A database model representing one value of a named metric series at a
+    specific point in time. Series produced by the pluggable metric collectors
+    (e.g. "load.1", "disk./home.percent") are stored here in a narrow layout,
+    so new metrics don't require a schema change.
+
+    Attributes:
+        id (int): The unique identifier of the record.
+        series (str): The name of the metric series.
+        timestamp (datetime): The time when the value was recorded.
+        value (float): The recorded value.
+    """
+
+    __table_args__ = (
+        db.Index("ix_metric_sample_series_timestamp", "series", "timestamp"),
+    )
+
+    id: int = db.Column(db.Integer, primary_key=True)
+    series: str = db.Column(db.String(128), nullable=False)
+    timestamp: datetime = db.Column(db.DateTime, nullable=False, index=True)
+    value: float = db.Column(db.Float, nullable=False)
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the MetricSample record.
+
+        Returns:
+            str: A string containing the series and timestamp of the record.
+        """
+        return f"<MetricSample {self.series} {self.timestamp}>"
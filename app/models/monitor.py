@@ -9,25 +9,37 @@ class Monitor(db.Model):
 
     Attributes:
         id (int): The unique identifier of the record.
-        timestamp (datetime): The time when the data was recorded.
+        timestamp (datetime): The time when the data was recorded (indexed).
         cpu (float): The CPU usage percentage.
+        cpu_iowait (Optional[float]): The percentage of CPU time spent waiting for I/O.
+        cpu_steal (Optional[float]): The percentage of CPU time stolen by the hypervisor.
         ram (float): The RAM usage percentage.
         disk (float): The disk usage percentage.
         net_sent (float): The amount of data sent over the network (in MB).
         net_recv (float): The amount of data received over the network (in MB).
-        cpu_temp (Optional[str]): The CPU temperature in degrees Celsius as a string (can be None).
+        net_sent_rate (Optional[float]): Bytes sent per second since the previous sample.
+        net_recv_rate (Optional[float]): Bytes received per second since the previous sample.
+        net_packets_sent_rate (Optional[float]): Packets sent per second since the previous sample.
+        net_packets_recv_rate (Optional[float]): Packets received per second since the previous sample.
+        cpu_temp (Optional[float]): The CPU temperature in degrees Celsius (None if unavailable).
     """
 
     id: int = db.Column(db.Integer, primary_key=True)
     timestamp: datetime = db.Column(
-        db.DateTime, nullable=False, default=datetime.now
+        db.DateTime, nullable=False, default=datetime.now, index=True
     )
     cpu: float = db.Column(db.Float, nullable=False)
+    cpu_iowait: Optional[float] = db.Column(db.Float, nullable=True)
+    cpu_steal: Optional[float] = db.Column(db.Float, nullable=True)
     ram: float = db.Column(db.Float, nullable=False)
     disk: float = db.Column(db.Float, nullable=False)
     net_sent: float = db.Column(db.Float, nullable=False)
     net_recv: float = db.Column(db.Float, nullable=False)
-    cpu_temp: Optional[str] = db.Column(db.Float, nullable=False)
+    net_sent_rate: Optional[float] = db.Column(db.Float, nullable=True)
+    net_recv_rate: Optional[float] = db.Column(db.Float, nullable=True)
+    net_packets_sent_rate: Optional[float] = db.Column(db.Float, nullable=True)
+    net_packets_recv_rate: Optional[float] = db.Column(db.Float, nullable=True)
+    cpu_temp: Optional[float] = db.Column(db.Float, nullable=True)
 
     def __repr__(self) -> str:
         """
@@ -0,0 +1,45 @@
+from datetime import datetime
+from app.models import db
+
+
+class MonitorRollup(db.Model):
+    """
+    A database model representing aggregated monitoring data for one metric
+    over a fixed-size time bucket (e.g. 1 minute, 15 minutes or 1 hour).
+
+    Attributes:
+        id (int): The unique identifier of the record.
+        resolution (int): The bucket size in seconds.
+        bucket_start (datetime): The start of the time bucket.
+        metric (str): The name of the aggregated `Monitor` column (e.g. "cpu").
+        count (int): The number of raw samples in the bucket.
+        min (float): The minimum value in the bucket.
+        max (float): The maximum value in the bucket.
+        avg (float): The average value in the bucket.
+        p95 (float): The 95th percentile of the values in the bucket.
+    """
+
+    __table_args__ = (
+        db.UniqueConstraint(
+            "resolution", "bucket_start", "metric", name="uq_monitor_rollup_bucket"
+        ),
+    )
+
+    id: int = db.Column(db.Integer, primary_key=True)
+    resolution: int = db.Column(db.Integer, nullable=False)
+    bucket_start: datetime = db.Column(db.DateTime, nullable=False)
+    metric: str = db.Column(db.String(32), nullable=False)
+    count: int = db.Column(db.Integer, nullable=False)
+    min: float = db.Column(db.Float, nullable=False)
+    max: float = db.Column(db.Float, nullable=False)
+    avg: float = db.Column(db.Float, nullable=False)
+    p95: float = db.Column(db.Float, nullable=False)
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the MonitorRollup record.
+
+        Returns:
+            str: A string containing the resolution, metric and bucket start of the record.
+        """
+        return f"<MonitorRollup {self.resolution}s {self.metric} {self.bucket_start}>"
@@ -4,12 +4,14 @@ from app.models import db
 class Settings(db.Model):
     """
     Represents threshold Settings for various system metrics, such as CPU temperature.
-    Used to store configuration values for system monitoring.
+    Used to store configuration values for system monitoring, including how long
+    raw monitoring records are kept (`data_retention_hrs`).
     """
 
     id: int = db.Column(db.Integer, primary_key=True)
     cpu_alert_temp: float = db.Column(db.Float, default=75, nullable=False)
     alerts_frequency_hrs: float = db.Column(db.Float, default=1, nullable=False)
+    data_retention_hrs: float = db.Column(db.Float, default=24, nullable=False)
 
     def __repr__(self) -> str:
         """
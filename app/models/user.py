@@ -20,6 +20,9 @@ class User(db.Model, UserMixin):
         telegram_chat_id (Optional[str]): The Telegram chat ID for alerts.
         date_created (Optional[datetime]): The timestamp of user account creation.
         last_login (Optional[datetime]): The timestamp of the user's last login.
+        last_alert_time (Optional[datetime]): The timestamp of the last alert sent on any channel.
+        last_email_alert_time (Optional[datetime]): The timestamp of the last email alert.
+        last_telegram_alert_time (Optional[datetime]): The timestamp of the last Telegram alert.
         login_errors (Optional[int]): Number of failed login attempts.
         is_suspended (Optional[bool]): If True, the account is suspended.
     """
@@ -43,6 +46,8 @@ class User(db.Model, UserMixin):
     )
     last_login: Optional[datetime] = db.Column(db.DateTime, nullable=True)
     last_alert_time: Optional[datetime] = db.Column(db.DateTime, nullable=True)
+    last_email_alert_time: Optional[datetime] = db.Column(db.DateTime, nullable=True)
+    last_telegram_alert_time: Optional[datetime] = db.Column(db.DateTime, nullable=True)
     login_errors: Optional[int] = db.Column(db.Integer, default=0, nullable=True)
     is_suspended: Optional[bool] = db.Column(db.Boolean, default=False, nullable=True)
 
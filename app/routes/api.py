@@ -1,8 +1,37 @@
-from flask import jsonify, Response
-from app.models import Monitor, Settings
+import time
+from datetime import datetime
+from flask import jsonify, request, Response, stream_with_context
+from sqlalchemy import func, select
+from app.models import db, Monitor, MetricSample, Settings
 from app import app
 from app.utils.exception_handler import exception_handler
-from typing import Any
+from app.utils.db_utils import read_session
+from app.utils.data_utils import (
+    AGGREGATIONS,
+    parse_cursor_param,
+    parse_datetime_param,
+    parse_points_param,
+    downsample,
+)
+from app.utils.rollup_utils import (
+    ROLLUP_METRICS,
+    select_rollup_tier,
+    get_rollup_series,
+)
+from app.utils.sample_buffer import get_sample_buffer
+from app.utils.live_stream import format_event, get_alert_states
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+# Default window in seconds of the averages returned by /api/latest.
+DEFAULT_LATEST_WINDOW_S: int = 10 * 60
+
+# Defaults of the /api/stream timing, see the STREAM_* settings in config.py.
+DEFAULT_STREAM_POLL_S: float = 1
+DEFAULT_STREAM_KEEPALIVE_S: float = 15
+DEFAULT_STREAM_MAX_S: float = 60 * 60
+DEFAULT_STREAM_RETRY_MS: int = 5000
+DEFAULT_STREAM_DB_POLL_S: float = 60
 
 
 @exception_handler()
@@ -11,7 +40,7 @@ def get_data() -> Response:
     """
     API endpoint to fetch monitoring data from the database.
 
-    Retrieves all monitor records, ordered by timestamp, and returns them
+    Retrieves monitor records, ordered by timestamp, and returns them
     as a JSON response containing the following fields:
         - timestamps (list of str)
         - cpu_usage (list of float)
@@ -21,33 +50,408 @@ def get_data() -> Response:
         - net_recv (list of float)
         - temperature (list of str or None)
         - temperature_limit (float or None)
+        - cursor (str or None): timestamp of the newest returned record, to be passed back as `since`
+        - resolution (int or None): rollup bucket size in seconds, None for raw records
+
+    Query parameters:
+        - from (str, optional): ISO 8601 datetime or Unix epoch seconds, inclusive lower bound.
+        - to (str, optional): ISO 8601 datetime or Unix epoch seconds, inclusive upper bound.
+        - points (int, optional): Maximum number of points per series. Larger results
+          are downsampled on the server into equal-size buckets.
+        - since (str, optional): Incremental cursor. A record id returns only records with
+          a greater id, an ISO 8601 datetime returns only records newer than that time.
+        - agg (str, optional): Bucket aggregation: avg (default), min, max or p95.
+
+    Ranges reaching past the raw data retention, or wide enough for the requested
+    number of points, are served from the rollup tier picked by `select_rollup_tier`.
+    Short raw ranges and `since` timestamps still held by the in-memory ring
+    buffer of recent samples are served without querying the database, other
+    queries use the read-only connection pool.
 
     Returns:
         Response: A Flask JSON response with monitoring data or an error message.
     """
     try:
-        settings = Settings.query.first()
-        data: list[Monitor] = Monitor.query.order_by(Monitor.timestamp).all()
+        start: Optional[datetime] = parse_datetime_param(request.args.get("from"))
+        end: Optional[datetime] = parse_datetime_param(request.args.get("to"))
+        points: Optional[int] = parse_points_param(request.args.get("points"))
+        since: Optional[Union[int, datetime]] = parse_cursor_param(
+            request.args.get("since")
+        )
+        agg: str = request.args.get("agg", "avg")
+        if agg not in AGGREGATIONS:
+            raise ValueError(f"agg must be one of {', '.join(AGGREGATIONS)}")
+    except ValueError as e:
+        return jsonify({"error": f"Invalid query parameter: {e}"}), 400
+
+    try:
+        with read_session() as session:
+            settings: Optional[Settings] = session.scalar(select(Settings).limit(1))
+            temperature_limit: float = settings.cpu_alert_temp
+            resolution: Optional[int] = (
+                None
+                if since is not None
+                else select_rollup_tier(start, end, points, settings.data_retention_hrs)
+            )
 
-        timestamps: list[str] = [record.timestamp.isoformat() for record in data]
-        cpu_usage: list[float] = [record.cpu for record in data]
-        ram: list[float] = [record.ram for record in data]
-        disk: list[float] = [record.disk for record in data]
-        net_sent: list[float] = [record.net_sent for record in data]
-        net_recv: list[float] = [record.net_recv for record in data]
-        temperature: list[Any] = [record.cpu_temp for record in data]
-        temperature_limit: float = settings.cpu_alert_temp
+            buffered = get_buffered_series(start, end, since) if resolution is None else None
+
+            if buffered is not None:
+                timestamps, series, cursor = buffered
+            elif resolution is None:
+                timestamps, series, cursor = get_raw_series(start, end, since, session)
+            else:
+                timestamps, series = get_rollup_series(resolution, start, end, agg, session)
+                cursor = None
+
+        timestamps, series = downsample(timestamps, series, points, agg)
 
         return jsonify(
             {
-                "timestamps": timestamps,
-                "cpu_usage": cpu_usage,
-                "ram": ram,
-                "disk": disk,
-                "net_sent": net_sent,
-                "net_recv": net_recv,
-                "temperature": temperature,
+                "timestamps": [timestamp.isoformat() for timestamp in timestamps],
+                **series,
                 "temperature_limit": temperature_limit,
+                "cursor": cursor,
+                "resolution": resolution,
+            }
+        )
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+def get_buffered_series(
+    start: Optional[datetime],
+    end: Optional[datetime],
+    since: Optional[Union[int, datetime]],
+) -> Optional[Tuple[list[datetime], Dict[str, list[Any]], Optional[str]]]:
+    """
+    Loads recent samples as /api/data series from the in-memory ring buffer.
+
+    Args:
+        start (Optional[datetime]): Inclusive lower bound of the sample timestamp.
+        end (Optional[datetime]): Inclusive upper bound of the sample timestamp.
+        since (Optional[Union[int, datetime]]): Only samples newer than this timestamp.
+
+    Returns:
+        Optional[Tuple[list[datetime], Dict[str, list[Any]], Optional[str]]]: The same
+            as `get_raw_series`, or None if the range isn't fully buffered.
+    """
+    if isinstance(since, int):
+        return None
+    sample_buffer = get_sample_buffer()
+    lower_bound: Optional[datetime] = max(
+        (bound for bound in (start, since) if bound is not None), default=None
+    )
+    if not sample_buffer.covers(lower_bound):
+        return None
+
+    timestamps, values = sample_buffer.series(start, end, since)
+    series: Dict[str, list[Any]] = {
+        key: values[column] for column, key in ROLLUP_METRICS.items()
+    }
+    cursor: Optional[str] = (
+        timestamps[-1].isoformat() if timestamps else since.isoformat() if since else None
+    )
+    return timestamps, series, cursor
+
+
+def get_raw_series(
+    start: Optional[datetime],
+    end: Optional[datetime],
+    since: Optional[Union[int, datetime]],
+    session: Optional[Session] = None,
+) -> Tuple[list[datetime], Dict[str, list[Any]], Optional[Union[int, str]]]:
+    """
+    Loads raw monitor records as /api/data series.
+
+    Args:
+        start (Optional[datetime]): Inclusive lower bound of the record timestamp.
+        end (Optional[datetime]): Inclusive upper bound of the record timestamp.
+        since (Optional[Union[int, datetime]]): Only records newer than this id or timestamp.
+        session (Optional[Session]): The session to query, defaults to `db.session`.
+
+    Returns:
+        Tuple[list[datetime], Dict[str, list[Any]], Optional[Union[int, str]]]: Record
+            timestamps, the series keyed like the /api/data response and the new cursor
+            (the timestamp of the newest record, or `since` if there is none).
+    """
+    query = select(Monitor)
+    if start is not None:
+        query = query.where(Monitor.timestamp >= start)
+    if end is not None:
+        query = query.where(Monitor.timestamp <= end)
+    if isinstance(since, int):
+        query = query.where(Monitor.id > since)
+    elif isinstance(since, datetime):
+        query = query.where(Monitor.timestamp > since)
+    data: list[Monitor] = (session or db.session).scalars(query.order_by(Monitor.timestamp)).all()
+
+    timestamps: list[datetime] = [record.timestamp for record in data]
+    series: Dict[str, list[Any]] = {
+        key: [getattr(record, column) for record in data]
+        for column, key in ROLLUP_METRICS.items()
+    }
+    cursor: Optional[Union[int, str]] = (
+        data[-1].timestamp.isoformat()
+        if data
+        else since.isoformat()
+        if isinstance(since, datetime)
+        else since
+    )
+
+    return (
+        timestamps,
+        series,
+        cursor,
+    )
+
+
+@exception_handler()
+@app.route("/api/latest")
+def get_latest() -> Response:
+    """
+    API endpoint returning the newest sample and short-window averages.
+
+    Returns a JSON response containing the following fields:
+        - timestamp (str or None): The time of the newest sample.
+        - cpu_usage, ram, disk, ... (float or None): The newest values, keyed like /api/data.
+        - averages (dict): The average of every metric over the window.
+        - window (int): The averaging window in seconds.
+
+    Query parameters:
+        - window (int, optional): Averaging window in seconds, 600 by default.
+
+    Served from the in-memory ring buffer of recent samples, or from the
+    newest database record (without averages) when the buffer is empty.
+
+    Returns:
+        Response: A Flask JSON response with the latest values or an error message.
+    """
+    try:
+        raw_window: Optional[str] = request.args.get("window")
+        window: int = int(raw_window) if raw_window else DEFAULT_LATEST_WINDOW_S
+        if window < 1:
+            raise ValueError(f"window must be a positive integer, got {window}")
+    except ValueError as e:
+        return jsonify({"error": f"Invalid query parameter: {e}"}), 400
+
+    try:
+        sample_buffer = get_sample_buffer()
+        latest: Optional[Dict[str, Any]] = sample_buffer.latest()
+        averages: Dict[str, Optional[float]] = {}
+        if latest is not None:
+            averages = {
+                key: sample_buffer.average(column, window, now=latest["timestamp"])
+                for column, key in ROLLUP_METRICS.items()
+            }
+        else:
+            with read_session() as session:
+                record: Optional[Monitor] = session.scalar(
+                    select(Monitor).order_by(Monitor.timestamp.desc()).limit(1)
+                )
+            if record is not None:
+                latest = {
+                    "timestamp": record.timestamp,
+                    **{column: getattr(record, column) for column in ROLLUP_METRICS},
+                }
+
+        return jsonify(
+            {
+                "timestamp": latest["timestamp"].isoformat() if latest else None,
+                **{
+                    key: latest[column] if latest else None
+                    for column, key in ROLLUP_METRICS.items()
+                },
+                "averages": averages,
+                "window": window,
+            }
+        )
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@exception_handler()
+@app.route("/api/stream")
+def stream() -> Response:
+    """
+    API endpoint streaming live monitoring data as Server-Sent Events.
+
+    Sends the following events:
+        - samples: New samples, keyed like the /api/data response (timestamps,
+          cpu_usage, ram, ...) with the new cursor, which is also the event id.
+        - alerts: The firing alert rules ({"firing": [...]}, see
+          `RulesEngine.firing()`), sent on connect and whenever they change.
+    A keepalive comment is sent when the stream was idle for `STREAM_KEEPALIVE_S`.
+
+    Query parameters:
+        - since (str, optional): The cursor returned by /api/data, only newer
+          samples are sent. Defaults to the newest sample. A `Last-Event-ID`
+          header sent by a reconnecting browser takes precedence.
+
+    New samples are read from the shared ring buffer of recent samples, so an
+    idle connection doesn't query the database. The connection is closed after
+    `STREAM_MAX_S` seconds, the browser reconnects and resumes from the last event.
+
+    Returns:
+        Response: A `text/event-stream` response, or a JSON error message.
+    """
+    try:
+        since: Optional[Union[int, datetime]] = parse_cursor_param(
+            request.headers.get("Last-Event-ID") or request.args.get("since")
+        )
+    except ValueError as e:
+        return jsonify({"error": f"Invalid query parameter: {e}"}), 400
+
+    return Response(
+        stream_with_context(stream_events(since)),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def stream_events(since: Optional[Union[int, datetime]]) -> Iterator[str]:
+    """
+    Generates the /api/stream events. Must run within an application context.
+
+    Args:
+        since (Optional[Union[int, datetime]]): Only samples newer than this record
+            id or timestamp are sent, None for samples newer than the newest one.
+
+    Yields:
+        str: Server-Sent Events in the `text/event-stream` format.
+    """
+    config = app.config
+    poll_s: float = config.get("STREAM_POLL_S", DEFAULT_STREAM_POLL_S)
+    keepalive_s: float = config.get("STREAM_KEEPALIVE_S", DEFAULT_STREAM_KEEPALIVE_S)
+    max_s: float = config.get("STREAM_MAX_S", DEFAULT_STREAM_MAX_S)
+    retry_ms: int = config.get("STREAM_RETRY_MS", DEFAULT_STREAM_RETRY_MS)
+    db_poll_s: float = config.get("STREAM_DB_POLL_S", DEFAULT_STREAM_DB_POLL_S)
+
+    yield f"retry: {retry_ms}\n\n"
+
+    cursor: Optional[Union[int, datetime]] = since
+    if cursor is None:
+        latest: Optional[Dict[str, Any]] = get_sample_buffer().latest()
+        if latest is not None:
+            cursor = latest["timestamp"]
+        else:
+            with read_session() as session:
+                cursor = session.scalar(select(func.max(Monitor.timestamp)))
+
+    alerts: Optional[List[Dict[str, Any]]] = None
+    started: float = time.monotonic()
+    last_event: float = started
+    last_db_poll: Optional[float] = None
+
+    while time.monotonic() - started < max_s:
+        now = time.monotonic()
+        batch = get_buffered_series(None, None, cursor)
+        if batch is None and (last_db_poll is None or now - last_db_poll >= db_poll_s):
+            with read_session() as session:
+                batch = get_raw_series(None, None, cursor, session)
+            last_db_poll = now
+
+        if batch is not None and batch[0]:
+            timestamps, series, batch_cursor = batch
+            cursor = timestamps[-1]
+            yield format_event(
+                "samples",
+                {
+                    "timestamps": [timestamp.isoformat() for timestamp in timestamps],
+                    **series,
+                    "cursor": batch_cursor,
+                },
+                batch_cursor,
+            )
+            last_event = now
+
+        states: List[Dict[str, Any]] = get_alert_states()
+        if states != alerts:
+            alerts = states
+            yield format_event("alerts", {"firing": states})
+            last_event = now
+
+        if now - last_event >= keepalive_s:
+            yield ": keepalive\n\n"
+            last_event = now
+
+        time.sleep(poll_s)
+
+
+@exception_handler()
+@app.route("/api/series")
+def get_series_names() -> Response:
+    """
+    API endpoint listing the metric series stored by the pluggable metric collectors.
+
+    Returns:
+        Response: A Flask JSON response with the sorted series names
+            ({"series": [...]}) or an error message.
+    """
+    try:
+        with read_session() as session:
+            names: list[str] = list(
+                session.scalars(
+                    select(MetricSample.series).distinct().order_by(MetricSample.series)
+                )
+            )
+        return jsonify({"series": names})
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@exception_handler()
+@app.route("/api/series/<path:name>")
+def get_series(name: str) -> Response:
+    """
+    API endpoint to fetch the history of one metric series.
+
+    Returns a JSON response containing the following fields:
+        - series (str): The series name.
+        - timestamps (list of str)
+        - values (list of float)
+
+    Query parameters:
+        - from, to, points, agg: The same as for /api/data.
+
+    Args:
+        name (str): The series name, e.g. "load.1" or "disk./home.percent".
+
+    Returns:
+        Response: A Flask JSON response with the series history or an error message.
+    """
+    try:
+        start: Optional[datetime] = parse_datetime_param(request.args.get("from"))
+        end: Optional[datetime] = parse_datetime_param(request.args.get("to"))
+        points: Optional[int] = parse_points_param(request.args.get("points"))
+        agg: str = request.args.get("agg", "avg")
+        if agg not in AGGREGATIONS:
+            raise ValueError(f"agg must be one of {', '.join(AGGREGATIONS)}")
+    except ValueError as e:
+        return jsonify({"error": f"Invalid query parameter: {e}"}), 400
+
+    try:
+        query = select(MetricSample.timestamp, MetricSample.value).where(
+            MetricSample.series == name
+        )
+        if start is not None:
+            query = query.where(MetricSample.timestamp >= start)
+        if end is not None:
+            query = query.where(MetricSample.timestamp <= end)
+        with read_session() as session:
+            rows = session.execute(query.order_by(MetricSample.timestamp)).all()
+
+        timestamps, series = downsample(
+            [row.timestamp for row in rows],
+            {"values": [row.value for row in rows]},
+            points,
+            agg,
+        )
+        return jsonify(
+            {
+                "series": name,
+                "timestamps": [timestamp.isoformat() for timestamp in timestamps],
+                "values": series["values"],
             }
         )
     except Exception as e:
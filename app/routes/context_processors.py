@@ -1,13 +1,102 @@
-from flask import request, __version__ as flask_version
+from flask import request
 from flask_login import current_user
 from datetime import datetime as dt
-import subprocess
+from functools import lru_cache
+from importlib.metadata import version
 import platform
 import sys
+import time
+import psutil
 import pytz
 from app import app, db, login_manager
 
 
+@lru_cache(maxsize=None)
+def get_system_info() -> str:
+    """
+    Returns the system's name, release and version. Computed once per process.
+
+    Returns:
+        str: The system information string, or an error message if the retrieval fails.
+    """
+    try:
+        return f"{platform.system()} {platform.release()} {platform.version()}"
+    except Exception as e:
+        return f"Error retrieving system info: {e}"
+
+
+@lru_cache(maxsize=None)
+def get_boot_time() -> float:
+    """
+    Returns the system boot time. Computed once per process.
+
+    Returns:
+        float: The boot time as a Unix timestamp.
+    """
+    return psutil.boot_time()
+
+
+def format_uptime(seconds: float) -> str:
+    """
+    Formats an uptime in the style of the `uptime` command, e.g. "up 1 day, 2:34".
+
+    Args:
+        seconds (float): The uptime in seconds.
+
+    Returns:
+        str: The formatted uptime.
+    """
+    minutes_total: int = int(seconds // 60)
+    days, minutes_in_day = divmod(minutes_total, 24 * 60)
+    hours, minutes = divmod(minutes_in_day, 60)
+
+    parts: list[str] = []
+    if days:
+        parts.append(f"{days} day{'s' if days != 1 else ''}")
+    parts.append(f"{hours}:{minutes:02d}" if hours else f"{minutes} min")
+    return "up " + ", ".join(parts)
+
+
+@lru_cache(maxsize=None)
+def get_python_version() -> str:
+    """
+    Returns the Python version. Computed once per process.
+
+    Returns:
+        str: The Python version string.
+    """
+    return sys.version
+
+
+@lru_cache(maxsize=None)
+def get_flask_version() -> str:
+    """
+    Returns the installed Flask version. Computed once per process.
+
+    Returns:
+        str: The Flask version string, or an error message if the retrieval fails.
+    """
+    try:
+        return version("flask")
+    except Exception as e:
+        return f"Error retrieving flask version: {e}"
+
+
+@lru_cache(maxsize=None)
+def get_db_dialect() -> str:
+    """
+    Returns the database dialect name. Computed once per process, the first time
+    it is needed within an application context.
+
+    Returns:
+        str: The database dialect name, or an error message if the retrieval fails.
+    """
+    try:
+        return db.engine.dialect.name
+    except Exception as e:
+        return f"Error retrieving db info: {e}"
+
+
 @login_manager.user_loader
 def inject_user(user_id: int) -> object:
     """
@@ -95,29 +184,23 @@ def inject_system_info() -> dict:
     Injects the system's name, version, and release information into the context for use in templates.
 
     Returns:
-        dict: A dictionary with the key 'system_info' containing the system information string,
-              or an error message if the system information retrieval fails.
+        dict: A dictionary with the key 'system_info' containing the cached system information string.
     """
-    try:
-        system_name = platform.system()
-        system_version = platform.version()
-        release = platform.release()
-    except Exception as e:
-        system_name = f"Error retrieving system info: {e}"
-    return dict(system_info=f"{system_name} {release} {system_version}")
+    return dict(system_info=get_system_info())
 
 
 @app.context_processor
 def inject_system_uptime() -> dict:
     """
-    Injects the system's uptime into the context for use in templates.
+    Injects the system's uptime into the context for use in templates. The uptime
+    is computed in-process from the cached boot time, without spawning `uptime`.
 
     Returns:
         dict: A dictionary with the key 'system_uptime' containing the system uptime string,
               or an error message if the uptime retrieval fails.
     """
     try:
-        uptime = subprocess.check_output(["/usr/bin/uptime"], text=True).strip()
+        uptime = format_uptime(time.time() - get_boot_time())
     except Exception as e:
         uptime = f"Error retrieving system uptime: {e}"
     return dict(system_uptime=uptime)
@@ -129,14 +212,9 @@ def inject_python_version() -> dict:
     Injects the Python version into the context for use in templates.
 
     Returns:
-        dict: A dictionary with the key 'python_version' containing the Python version string,
-              or an error message if the Python version retrieval fails.
+        dict: A dictionary with the key 'python_version' containing the cached Python version string.
     """
-    try:
-        python_version = sys.version
-    except Exception as e:
-        python_version = f"Error retrieving python version: {e}"
-    return dict(python_version=python_version)
+    return dict(python_version=get_python_version())
 
 
 @app.context_processor
@@ -145,14 +223,9 @@ def inject_flask_version() -> dict:
     Injects the Flask version into the context for use in templates.
 
     Returns:
-        dict: A dictionary with the key 'flask_version' containing the Flask version string,
-              or an error message if the Flask version retrieval fails.
+        dict: A dictionary with the key 'flask_version' containing the cached Flask version string.
     """
-    try:
-        flask_info = flask_version
-    except Exception as e:
-        flask_info = f"Error retrieving flask version: {e}"
-    return dict(flask_version=flask_info)
+    return dict(flask_version=get_flask_version())
 
 
 @app.context_processor
@@ -161,15 +234,9 @@ def inject_db_info() -> dict:
     Injects the database engine type into the context for use in templates.
 
     Returns:
-        dict: A dictionary with the key 'db_engine' containing the database engine type string,
-              or an error message if the database engine retrieval fails.
+        dict: A dictionary with the key 'db_engine' containing the cached database dialect name.
     """
-    try:
-        engine = db.get_engine()
-        db_dialect = engine.dialect.name
-    except Exception as e:
-        db_dialect = f"Error retrieving db info: {e}"
-    return dict(db_engine=db_dialect)
+    return dict(db_engine=get_db_dialect())
 
 
 @app.shell_context_processor
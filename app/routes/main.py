@@ -2,19 +2,23 @@ from flask import render_template, Response
 from app import app
 from app.models import Monitor, Settings
 from app.utils.exception_handler import exception_handler
+from app.utils.sample_buffer import get_sample_buffer
 
 
 @exception_handler()
 @app.route("/")
 def dashboard() -> Response:
     """
-    Renders the main dashboard page.
+    Renders the main dashboard page. The latest sample comes from the
+    in-memory ring buffer, the database is only queried when it's empty.
 
     Returns:
         Response: Rendered HTML page for the dashboard.
     """
     settings = Settings.query.first()
-    last_record = Monitor.query.order_by(Monitor.timestamp.desc()).first()
+    last_record = get_sample_buffer().latest() or Monitor.query.order_by(
+        Monitor.timestamp.desc()
+    ).first()
 
     return render_template(
         "dashboard/dashboard.html", 
@@ -35,6 +35,19 @@ class ChartCreator {
         this.chart.data.datasets[0].data = data;
         this.chart.update();
     }
+
+    appendChart(timestamps, data, dropCount = 0) {
+        const labels = this.chart.data.labels;
+        const values = this.chart.data.datasets[0].data;
+
+        if (dropCount > 0) {
+            labels.splice(0, dropCount);
+            values.splice(0, dropCount);
+        }
+        labels.push(...timestamps);
+        values.push(...data);
+        this.chart.update();
+    }
 }
 
 export default ChartCreator;
@@ -1,5 +1,23 @@
 import ChartCreator from './charts.js';
 
+const HISTORY_WINDOW_MS = 24 * 60 * 60 * 1000;
+const INITIAL_POINTS = 1440;
+
+const chartData = [
+    { id: 'cpuChart', color: 'rgba(255, 99, 132, 1)', key: 'cpu_usage' },
+    { id: 'ramChart', color: 'rgba(54, 162, 235, 1)', key: 'ram' },
+    { id: 'diskChart', color: 'rgba(75, 192, 192, 1)', key: 'disk' },
+    { id: 'netSentChart', color: 'rgba(153, 102, 255, 1)', key: 'net_sent_rate' },
+    { id: 'netRecvChart', color: 'rgba(255, 159, 64, 1)', key: 'net_recv_rate' },
+    { id: 'temperatureChart', color: 'rgba(255, 205, 86, 1)', key: 'temperature' }
+];
+
+let charts = null;
+let cursor = null;
+let history = null;
+let temperatureLimit = null;
+let stream = null;
+
 function calculateAverage(dataArray, timestamps) {
     const now = Date.now();
     const tenMinutesAgo = now - (10 * 60 * 1000);
@@ -15,57 +33,145 @@ function calculateAverage(dataArray, timestamps) {
     return (sum / recentValues.length);
 }
 
-function fetchData() {
-    fetch("/api/data")
-        .then(response => response.json())
-        .then(data => {
-            if (data.error) {
-                console.error(data.error);
-                return;
-            }
+function formatRate(bytesPerSecond) {
+    if (bytesPerSecond === null || bytesPerSecond === undefined) return 'N/A';
+    return `${(bytesPerSecond / 1024).toFixed(2)} KB/s`;
+}
+
+function resetData() {
+    if (stream !== null) {
+        stream.close();
+        stream = null;
+    }
+    charts = null;
+    cursor = null;
+    history = null;
+    temperatureLimit = null;
+}
+
+function createCharts(data) {
+    const { timestamps } = data;
+
+    history = { timestamps: [...timestamps] };
+    charts = chartData.map(({ id, color, key }) => {
+        history[key] = [...data[key]];
+        const chart = new ChartCreator(id, color, key);
+        chart.createChart();
+        chart.updateChart([...timestamps], [...data[key]]);
+        return chart;
+    });
+}
+
+function appendToCharts(data) {
+    const { timestamps } = data;
+    const cutoff = Date.now() - HISTORY_WINDOW_MS;
+
+    let dropCount = 0;
+    while (dropCount < history.timestamps.length
+        && new Date(history.timestamps[dropCount]).getTime() < cutoff) {
+        dropCount++;
+    }
+
+    history.timestamps.splice(0, dropCount);
+    history.timestamps.push(...timestamps);
+
+    chartData.forEach(({ key }, index) => {
+        history[key].splice(0, dropCount);
+        history[key].push(...data[key]);
+        charts[index].appendChart(timestamps, data[key], dropCount);
+    });
+}
+
+function updateValues(limit) {
+    const { timestamps } = history;
+    if (timestamps.length === 0) return;
+
+    const last = key => history[key][history[key].length - 1];
+
+    const currentTemp = last('temperature');
+    const avgTemp = calculateAverage(history.temperature, timestamps);
+    const limitTemp = limit ?? 95;
+
+    document.getElementById('cpuUsageValue').textContent = `${last('cpu_usage').toFixed(2)}%`;
+    document.getElementById('ramUsageValue').textContent = `${last('ram').toFixed(2)}%`;
+    document.getElementById('diskUsageValue').textContent = `${last('disk').toFixed(2)}%`;
+    document.getElementById('netSentValue').textContent = formatRate(last('net_sent_rate'));
+    document.getElementById('netRecvValue').textContent = formatRate(last('net_recv_rate'));
+
+    const temperatureValueEl = document.getElementById('temperatureValue');
+    const temperatureAverageValueEl = document.getElementById('temperatureAverageValue');
 
-            const { timestamps } = data;
-            const chartData = [
-                { id: 'cpuChart', color: 'rgba(255, 99, 132, 1)', key: 'cpu_usage' },
-                { id: 'ramChart', color: 'rgba(54, 162, 235, 1)', key: 'ram' },
-                { id: 'diskChart', color: 'rgba(75, 192, 192, 1)', key: 'disk' },
-                { id: 'netSentChart', color: 'rgba(153, 102, 255, 1)', key: 'net_sent' },
-                { id: 'netRecvChart', color: 'rgba(255, 159, 64, 1)', key: 'net_recv' },
-                { id: 'temperatureChart', color: 'rgba(255, 205, 86, 1)', key: 'temperature' }
-            ];
+    temperatureValueEl.textContent = `${currentTemp}°C`;
+    temperatureAverageValueEl.textContent = `${avgTemp.toFixed(2)}°C`;
 
-            chartData.forEach(({ id, color, key }) => {
-                const chart = new ChartCreator(id, color, key);
-                chart.createChart();
-                chart.updateChart(timestamps, data[key]);
-            });
+    temperatureValueEl.className = currentTemp > limitTemp ? 'text-danger' : 'text-success';
+    temperatureAverageValueEl.className = avgTemp > limitTemp ? 'text-danger' : 'text-success';
 
-            const currentTemp = data.temperature[data.temperature.length - 1];
-            const avgTemp = calculateAverage(data.temperature, timestamps);
-            const limitTemp = data.temperature_limit ?? 95;
+    document.getElementById('cpuAverageValue').textContent = `${calculateAverage(history.cpu_usage, timestamps).toFixed(2)}%`;
+    document.getElementById('ramAverageValue').textContent = `${calculateAverage(history.ram, timestamps).toFixed(2)}%`;
+}
+
+function updateAlerts(firing) {
+    const alertStatusEl = document.getElementById('alertStatus');
+    if (alertStatusEl === null) return;
+
+    if (firing.length === 0) {
+        alertStatusEl.textContent = 'No active alerts';
+        alertStatusEl.className = 'text-success';
+        return;
+    }
+
+    alertStatusEl.textContent = firing
+        .map(({ name, value, since }) => `${name}: ${value.toFixed(2)} since ${new Date(since).toLocaleTimeString()}`)
+        .join(', ');
+    alertStatusEl.className = 'text-danger';
+}
 
-            document.getElementById('cpuUsageValue').textContent = `${data.cpu_usage[data.cpu_usage.length - 1].toFixed(2)}%`;
-            document.getElementById('ramUsageValue').textContent = `${data.ram[data.ram.length - 1].toFixed(2)}%`;
-            document.getElementById('diskUsageValue').textContent = `${data.disk[data.disk.length - 1].toFixed(2)}%`;
-            document.getElementById('netSentValue').textContent = `${data.net_sent[data.net_sent.length - 1].toFixed(2)} MB`;
-            document.getElementById('netRecvValue').textContent = `${data.net_recv[data.net_recv.length - 1].toFixed(2)} MB`;
+function applyData(data) {
+    if (charts === null) {
+        createCharts(data);
+    } else if (data.timestamps.length > 0) {
+        appendToCharts(data);
+    }
 
-            const temperatureValueEl = document.getElementById('temperatureValue');
-            const temperatureAverageValueEl = document.getElementById('temperatureAverageValue');
+    if (data.cursor !== null && data.cursor !== undefined) {
+        cursor = data.cursor;
+    }
 
-            temperatureValueEl.textContent = `${currentTemp}°C`;
-            temperatureAverageValueEl.textContent = `${avgTemp.toFixed(2)}°C`;
+    updateValues(temperatureLimit);
+}
 
-            temperatureValueEl.className = currentTemp > limitTemp ? 'text-danger' : 'text-success';
-            temperatureAverageValueEl.className = avgTemp > limitTemp ? 'text-danger' : 'text-success';
+function fetchData() {
+    const url = cursor === null ? `/api/data?points=${INITIAL_POINTS}` : `/api/data?since=${encodeURIComponent(cursor)}`;
 
-            document.getElementById('cpuAverageValue').textContent = `${calculateAverage(data.cpu_usage, timestamps).toFixed(2)}%`;
-            document.getElementById('ramAverageValue').textContent = `${calculateAverage(data.ram, timestamps).toFixed(2)}%`;
+    return fetch(url)
+        .then(response => response.json())
+        .then(data => {
+            if (data.error) {
+                console.error(data.error);
+                return;
+            }
 
+            temperatureLimit = data.temperature_limit;
+            applyData(data);
         })
         .catch(() => {
             console.error("Error fetching data");
         });
 }
 
+// Pushes new samples and alert changes from /api/stream into the charts. The
+// browser reconnects on its own and resumes after the last received sample.
+// Returns false if the stream can't be used and the caller should poll instead.
+function startStream() {
+    if (typeof EventSource === 'undefined' || charts === null) return false;
+
+    const url = cursor === null ? '/api/stream' : `/api/stream?since=${encodeURIComponent(cursor)}`;
+    stream = new EventSource(url);
+    stream.addEventListener('samples', event => applyData(JSON.parse(event.data)));
+    stream.addEventListener('alerts', event => updateAlerts(JSON.parse(event.data).firing));
+    return true;
+}
+
+export { resetData, startStream };
 export default fetchData;
@@ -1,3 +1,9 @@
-import fetchData from './fetch.js';
+import fetchData, { startStream } from './fetch.js';
 
-fetchData();
+const POLL_INTERVAL_MS = 60 * 1000;
+
+fetchData().then(() => {
+    if (!startStream()) {
+        setInterval(fetchData, POLL_INTERVAL_MS);
+    }
+});
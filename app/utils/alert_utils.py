@@ -0,0 +1,136 @@
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from flask import current_app
+from sqlalchemy import or_, select, update
+from app.models import db, User, Settings
+from app.utils.logging import logger
+
+DEFAULT_ALERT_DEADLINE_S: float = 30
+DEFAULT_ALERT_MAX_WORKERS: int = 8
+
+# Per-channel throttling state of the alert receivers.
+ALERT_TIME_COLUMNS: Dict[str, str] = {
+    "email": "last_email_alert_time",
+    "telegram": "last_telegram_alert_time",
+}
+
+
+def is_alert_due(last_alert_time: Optional[datetime], alerts_frequency_hrs: float) -> bool:
+    """
+    Checks whether the last alert on a channel is older than the alert frequency.
+
+    Args:
+        last_alert_time (Optional[datetime]): The user's last alert on the channel.
+        alerts_frequency_hrs (float): Minimum time in hours between two alerts.
+
+    Returns:
+        bool: True if the user should receive the alert now.
+    """
+    return last_alert_time is None or datetime.now() - last_alert_time >= timedelta(
+        hours=alerts_frequency_hrs
+    )
+
+
+def load_alert_receivers() -> Tuple[List[User], float]:
+    """
+    Loads the users receiving alerts on any channel and the alert frequency,
+    so one alert dispatch costs two queries regardless of the channels.
+
+    Returns:
+        Tuple[List[User], float]: The receivers and `Settings.alerts_frequency_hrs`.
+    """
+    receivers: List[User] = db.session.scalars(
+        select(User).where(
+            or_(User.email_alerts_receiver.is_(True), User.telegram_alerts_receiver.is_(True))
+        )
+    ).all()
+    settings = Settings.query.first()
+    return receivers, settings.alerts_frequency_hrs
+
+
+def mark_alerts_sent(
+    channel: str, users: List[User], sent_at: Optional[datetime] = None
+) -> None:
+    """
+    Sets the last alert time on the channel (and the overall one) of the users
+    in a single UPDATE statement. The caller commits.
+
+    Args:
+        channel (str): "email" or "telegram", see `ALERT_TIME_COLUMNS`.
+        users (List[User]): The users the alert was sent to.
+        sent_at (Optional[datetime]): The time of the alert, defaults to `datetime.now()`.
+    """
+    if not users:
+        return
+    sent_at = sent_at or datetime.now()
+    db.session.execute(
+        update(User)
+        .where(User.id.in_([user.id for user in users]))
+        .values({ALERT_TIME_COLUMNS[channel]: sent_at, "last_alert_time": sent_at})
+    )
+
+
+def send_concurrently(
+    tasks: Dict[Hashable, Callable[[], Any]],
+    deadline_s: Optional[float] = None,
+    max_workers: Optional[int] = None,
+) -> Dict[Hashable, Any]:
+    """
+    Runs alert sends on a bounded thread pool and waits for them until an
+    overall deadline. Must be called within an application context, every send
+    runs in its own context of the same application.
+
+    Workers only send, so the caller keeps all database bookkeeping in its own
+    thread. Sends still running at the deadline (e.g. retrying a slow SMTP
+    server) are reported as failed and left to finish in the background, so
+    the alert latency is bounded by the slowest send, not the sum of them.
+
+    Args:
+        tasks (Dict[Hashable, Callable[[], Any]]): Send callables keyed by recipient
+            (or by channel for batched sends).
+        deadline_s (Optional[float]): Maximum time in seconds to wait, defaults to
+            `ALERT_DEADLINE_S`.
+        max_workers (Optional[int]): Maximum number of concurrent sends, defaults to
+            `ALERT_MAX_WORKERS`.
+
+    Returns:
+        Dict[Hashable, Any]: The result of every task, False if it failed or
+            didn't finish in time.
+    """
+    if not tasks:
+        return {}
+
+    flask_app = current_app._get_current_object()
+    deadline_s = deadline_s or current_app.config.get(
+        "ALERT_DEADLINE_S", DEFAULT_ALERT_DEADLINE_S
+    )
+    max_workers = max_workers or current_app.config.get(
+        "ALERT_MAX_WORKERS", DEFAULT_ALERT_MAX_WORKERS
+    )
+
+    def run_in_context(task: Callable[[], Any]) -> Any:
+        with flask_app.app_context():
+            return task()
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(tasks)), thread_name_prefix="AlertSender"
+    )
+    futures: Dict[Hashable, Future] = {
+        key: executor.submit(run_in_context, task) for key, task in tasks.items()
+    }
+    done, not_done = wait(futures.values(), timeout=deadline_s)
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    results: Dict[Hashable, Any] = {}
+    for key, future in futures.items():
+        if future in not_done:
+            logger.error(f"send_concurrently() alert to {key} not sent within {deadline_s}s.")
+            results[key] = False
+            continue
+        try:
+            results[key] = future.result()
+        except Exception as e:
+            logger.error(f"send_concurrently() alert to {key} failed: {e}")
+            results[key] = False
+    return results
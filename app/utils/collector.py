@@ -0,0 +1,167 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from flask import Flask
+from app.utils.logging import logger
+from app.utils.exception_handler import exception_handler
+
+
+class SampleCollector:
+    """
+    Samples system resources at a high frequency on a dedicated thread and
+    writes them to the database in batches.
+
+    Samples are kept in an in-memory buffer and flushed in one transaction once
+    `batch_size` samples are buffered or `flush_s` seconds have passed since the
+    last flush, so a short sampling interval doesn't multiply the SQLite
+    commit/fsync cost. Every sample is checked for alerts as soon as it is read.
+
+    Attributes:
+        flask_app (Flask): The application whose context is used for database access.
+        interval_s (float): Time in seconds between samples.
+        batch_size (int): Number of buffered samples that triggers a flush.
+        flush_s (float): Maximum time in seconds between flushes.
+        max_buffer (int): Maximum number of samples kept while the database is unavailable.
+    """
+
+    def __init__(
+        self,
+        flask_app: Flask,
+        interval_s: float,
+        batch_size: int,
+        flush_s: float,
+        max_buffer: Optional[int] = None,
+    ) -> None:
+        self.flask_app = flask_app
+        self.interval_s = interval_s
+        self.batch_size = batch_size
+        self.flush_s = flush_s
+        self.max_buffer = max_buffer or batch_size * 10
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_flush: float = time.monotonic()
+
+    def start(self) -> None:
+        """
+        Starts the collector thread.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="SampleCollector", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"SampleCollector started: interval {self.interval_s}s, batch {self.batch_size}, flush {self.flush_s}s."
+        )
+
+    def stop(self) -> None:
+        """
+        Stops the collector thread and flushes the buffered samples.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval_s + 5)
+            self._thread = None
+        with self.flask_app.app_context():
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"SampleCollector.stop() final flush failed: {e}")
+
+    def _run(self) -> None:
+        """
+        Collector loop. Ticks are scheduled on a fixed grid, so a slow sample
+        doesn't shift every later one; ticks that are missed are skipped.
+        """
+        next_tick: float = time.monotonic()
+        while not self._stop_event.is_set():
+            self.collect_once()
+            next_tick += self.interval_s
+            delay: float = next_tick - time.monotonic()
+            if delay < 0:
+                next_tick = time.monotonic()
+                delay = 0
+            self._stop_event.wait(delay)
+
+    @exception_handler()
+    def collect_once(self) -> None:
+        """
+        Reads one sample, adds it to the ring buffer of recent samples, checks
+        it for alerts and flushes the buffer when due.
+        """
+        from app.utils.system_monitor import read_resources, check_alerts
+        from app.utils.sample_buffer import get_sample_buffer
+
+        with self.flask_app.app_context():
+            sample: Dict[str, Any] = read_resources()
+            get_sample_buffer(writable=True).append(sample)
+            with self._lock:
+                self._buffer.append(sample)
+                flush_due: bool = (
+                    len(self._buffer) >= self.batch_size
+                    or time.monotonic() - self._last_flush >= self.flush_s
+                )
+
+            check_alerts(sample)
+
+            if flush_due:
+                self.flush()
+
+    def flush(self) -> int:
+        """
+        Writes the buffered samples to the database in a single transaction.
+        Must be called within an application context. On failure the samples
+        stay buffered (up to `max_buffer`) and are retried on the next flush.
+
+        Returns:
+            int: The number of samples written.
+        """
+        from app.utils.system_monitor import write_samples_to_db
+
+        with self._lock:
+            samples: List[Dict[str, Any]] = self._buffer
+            self._buffer = []
+            self._last_flush = time.monotonic()
+
+        try:
+            write_samples_to_db(samples)
+        except Exception:
+            with self._lock:
+                self._buffer = (samples + self._buffer)[-self.max_buffer :]
+            raise
+        return len(samples)
+
+
+collector: Optional[SampleCollector] = None
+
+
+def start_collector(flask_app: Flask) -> Optional[SampleCollector]:
+    """
+    Creates and starts the process-wide collector from the application config.
+
+    Args:
+        flask_app (Flask): The application providing `COLLECTOR_*` settings.
+
+    Returns:
+        Optional[SampleCollector]: The running collector, or None if
+            `COLLECTOR_INTERVAL_S` is 0 (per-minute `check_resources` job instead).
+    """
+    global collector
+
+    interval_s: float = flask_app.config.get("COLLECTOR_INTERVAL_S", 0)
+    if not interval_s:
+        return None
+
+    if collector is None:
+        collector = SampleCollector(
+            flask_app,
+            interval_s=interval_s,
+            batch_size=flask_app.config.get("COLLECTOR_BATCH_SIZE", 12),
+            flush_s=flask_app.config.get("COLLECTOR_FLUSH_S", 60),
+        )
+    collector.start()
+    return collector
@@ -0,0 +1,183 @@
+import math
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+AGGREGATIONS = ("avg", "min", "max", "p95")
+
+
+def _parse_iso_datetime(value: str) -> datetime:
+    """
+    Parses an ISO 8601 string into a naive local datetime.
+
+    Args:
+        value (str): The ISO 8601 string, optionally with a timezone or "Z" suffix.
+
+    Returns:
+        datetime: The parsed naive local datetime.
+    """
+    parsed: datetime = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def parse_datetime_param(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parses a datetime query parameter.
+
+    Accepts either an ISO 8601 string (e.g. "2025-05-20T12:00:00") or a Unix epoch
+    in seconds (e.g. "1747735200"). Timezone-aware values are converted to naive
+    local time, which is how `Monitor.timestamp` is stored.
+
+    Args:
+        value (Optional[str]): The raw query parameter value.
+
+    Returns:
+        Optional[datetime]: The parsed datetime, or None if the value is empty.
+
+    Raises:
+        ValueError: If the value cannot be parsed.
+    """
+    if value is None or value.strip() == "":
+        return None
+
+    value = value.strip()
+    try:
+        return datetime.fromtimestamp(float(value))
+    except ValueError:
+        pass
+
+    return _parse_iso_datetime(value)
+
+
+def parse_points_param(value: Optional[str]) -> Optional[int]:
+    """
+    Parses the maximum number of points per series requested by the client.
+
+    Args:
+        value (Optional[str]): The raw query parameter value.
+
+    Returns:
+        Optional[int]: The number of points, or None if the value is empty.
+
+    Raises:
+        ValueError: If the value is not a positive integer.
+    """
+    if value is None or value.strip() == "":
+        return None
+
+    points: int = int(value)
+    if points < 1:
+        raise ValueError(f"points must be a positive integer, got {points}")
+    return points
+
+
+def parse_cursor_param(value: Optional[str]) -> Optional[Union[int, datetime]]:
+    """
+    Parses the incremental `since` cursor.
+
+    A plain integer is treated as a `Monitor.id` (the `cursor` value returned by
+    the API), anything else as an ISO 8601 datetime.
+
+    Args:
+        value (Optional[str]): The raw query parameter value.
+
+    Returns:
+        Optional[Union[int, datetime]]: The record id or datetime, or None if the value is empty.
+
+    Raises:
+        ValueError: If the value is neither an integer nor a valid datetime.
+    """
+    if value is None or value.strip() == "":
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+
+    return _parse_iso_datetime(value)
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """
+    Computes a percentile using the nearest-rank method.
+
+    Args:
+        values (Sequence[float]): A non-empty sequence of values.
+        q (float): The percentile to compute, between 0 and 100.
+
+    Returns:
+        float: The smallest value such that at least q percent of values are less or equal to it.
+    """
+    ordered: List[float] = sorted(values)
+    rank: int = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def _aggregate(values: Sequence[Optional[float]], agg: str) -> Optional[float]:
+    """
+    Aggregates a bucket of values, ignoring missing and non-numeric ones
+    (e.g. "Brak danych" stored when the CPU temperature is unavailable).
+
+    Args:
+        values (Sequence[Optional[float]]): The values in the bucket.
+        agg (str): One of "avg", "min", "max" or "p95".
+
+    Returns:
+        Optional[float]: The aggregated value, or None if the bucket has no values.
+    """
+    present: List[float] = [
+        value for value in values if isinstance(value, (int, float))
+    ]
+    if not present:
+        return None
+    if agg == "min":
+        return min(present)
+    if agg == "max":
+        return max(present)
+    if agg == "p95":
+        return percentile(present, 95)
+    return sum(present) / len(present)
+
+
+def downsample(
+    timestamps: Sequence[Any],
+    series: Dict[str, Sequence[Optional[float]]],
+    points: Optional[int],
+    agg: str = "avg",
+) -> Tuple[List[Any], Dict[str, List[Optional[float]]]]:
+    """
+    Reduces every series to at most `points` values using equal-size buckets.
+
+    The samples are split into `points` consecutive buckets. Each bucket is
+    represented by the timestamp of its first sample and the min, max, average
+    or 95th percentile of its values, so spikes survive with `agg="max"`.
+
+    Args:
+        timestamps (Sequence[Any]): Sample timestamps in ascending order.
+        series (Dict[str, Sequence[Optional[float]]]): Series aligned with `timestamps`.
+        points (Optional[int]): Maximum number of points per series. None disables downsampling.
+        agg (str): Bucket aggregation, one of "avg", "min", "max" or "p95".
+
+    Returns:
+        Tuple[List[Any], Dict[str, List[Optional[float]]]]: The downsampled timestamps and series.
+
+    Raises:
+        ValueError: If `agg` is not supported.
+    """
+    if agg not in AGGREGATIONS:
+        raise ValueError(f"agg must be one of {', '.join(AGGREGATIONS)}, got {agg}")
+
+    total: int = len(timestamps)
+    if points is None or total <= points:
+        return list(timestamps), {key: list(values) for key, values in series.items()}
+
+    bounds: List[int] = [total * i // points for i in range(points + 1)]
+    sampled_timestamps: List[Any] = [timestamps[bounds[i]] for i in range(points)]
+    sampled_series: Dict[str, List[Optional[float]]] = {
+        key: [
+            _aggregate(values[bounds[i] : bounds[i + 1]], agg) for i in range(points)
+        ]
+        for key, values in series.items()
+    }
+    return sampled_timestamps, sampled_series
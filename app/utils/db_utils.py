@@ -1,38 +1,179 @@
+import glob
+import gzip
 import shutil
 import os
+import sqlite3
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, List, Optional
+from flask import current_app
+from sqlalchemy.orm import Session
+from app.models import db
 from .logging import logger
 from .exception_handler import exception_handler
 from .email_utils import send_admin_email
+from .sqlite_utils import get_read_engine
+
+DEFAULT_BACKUP_GENERATIONS: int = 7
+DEFAULT_BACKUP_PAGES_PER_STEP: int = 1024
+DEFAULT_BACKUP_STEP_SLEEP_S: float = 0.01
+COMPRESS_CHUNK_SIZE: int = 1024 * 1024
+
+
+@contextmanager
+def read_session() -> Iterator[Session]:
+    """
+    Opens a session on the read-only connection pool of this process (see
+    `get_read_engine()`), so read paths such as the API routes never compete
+    with the collector for the write lock. Falls back to `db.session` when the
+    pool is disabled or unavailable. Must be called within an application context.
+
+    Yields:
+        Session: The session, closed (or left to the application context) on exit.
+    """
+    engine = get_read_engine()
+    if engine is None:
+        yield db.session
+        return
+    with Session(engine) as session:
+        yield session
+
+
+def snapshot_database(
+    db_path: str, snapshot_path: str, pages_per_step: int, step_sleep_s: float
+) -> int:
+    """
+    Copies a consistent snapshot of a live SQLite database with the online
+    backup API. The pages are copied in steps of `pages_per_step`, the source
+    is only read-locked during a step, and the writer can proceed between
+    steps (with WAL it is never blocked). SQLite restarts the copy if another
+    connection writes to the source during it, so the snapshot is never torn.
+
+    Args:
+        db_path (str): The live database file.
+        snapshot_path (str): The snapshot file to create.
+        pages_per_step (int): Pages copied per step.
+        step_sleep_s (float): Seconds to pause between steps.
+
+    Returns:
+        int: The number of pages in the snapshot.
+    """
+    page_count: int = 0
+
+    def progress(status: int, remaining: int, total: int) -> None:
+        nonlocal page_count
+        page_count = total
+        if remaining and step_sleep_s:
+            time.sleep(step_sleep_s)
+
+    source = sqlite3.connect(db_path, timeout=30)
+    target = sqlite3.connect(snapshot_path)
+    try:
+        source.backup(target, pages=pages_per_step, progress=progress)
+    finally:
+        target.close()
+        source.close()
+    return page_count
+
+
+def compress_file(path: str, compressed_path: str) -> int:
+    """
+    Compresses a file with gzip in fixed-size chunks, so memory use doesn't
+    grow with the file. The compressed file only appears once it is complete.
+
+    Args:
+        path (str): The file to compress.
+        compressed_path (str): The gzip file to create.
+
+    Returns:
+        int: The size of the compressed file in bytes.
+    """
+    temp_path: str = f"{compressed_path}.tmp"
+    try:
+        with open(path, "rb") as source, gzip.open(temp_path, "wb", compresslevel=6) as target:
+            shutil.copyfileobj(source, target, COMPRESS_CHUNK_SIZE)
+        os.replace(temp_path, compressed_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return os.path.getsize(compressed_path)
+
+
+def rotate_backups(backup_dir: str, db_name: str, generations: int) -> List[str]:
+    """
+    Removes the oldest backups of a database, keeping the newest `generations`.
+
+    Args:
+        backup_dir (str): The backup directory.
+        db_name (str): The database name without extension, e.g. "pulse".
+        generations (int): The number of backups to keep.
+
+    Returns:
+        List[str]: The removed backup paths.
+    """
+    backups: List[str] = sorted(
+        glob.glob(os.path.join(backup_dir, f"backup_{glob.escape(db_name)}_*.db.gz"))
+    )
+    expired: List[str] = backups[: max(len(backups) - generations, 0)]
+    for path in expired:
+        os.remove(path)
+    return expired
 
 
 @exception_handler()
 def backup_database() -> Optional[str]:
     """
-    Creates a backup of the database file by copying it to a backup directory.
-    The backup file will overwrite any previous backup.
+    Creates a consistent, gzip-compressed backup of the live database in the
+    backup directory next to it (`instance/backup`) while the scheduler keeps
+    writing, and removes the oldest backups beyond `BACKUP_GENERATIONS`.
+    Must be called within an application context.
 
     :return: Path to the backup file if successful, None if an error occurs.
     """
-    db_path: str = "instance/pulse.db"
-    backup_dir: str = "instance/backup"
+    config = current_app.config
+    db_path: Optional[str] = db.engine.url.database
     now: datetime = datetime.now()
     formatted_now: str = now.strftime("%Y-%m-%d %H:%M:%S")
 
-    if not os.path.exists(db_path):
+    if not db_path or not os.path.exists(db_path):
         raise FileNotFoundError(f"Database file '{db_path}' does not exist.")
 
-    if not os.path.exists(backup_dir):
-        os.makedirs(backup_dir)
+    backup_dir: str = os.path.join(os.path.dirname(os.path.abspath(db_path)), "backup")
+    os.makedirs(backup_dir, exist_ok=True)
 
-    db_name: str = os.path.basename(db_path)
-    backup_path: str = os.path.join(backup_dir, f"backup_{db_name}")
+    db_name: str = os.path.splitext(os.path.basename(db_path))[0]
+    backup_path: str = os.path.join(
+        backup_dir, f"backup_{db_name}_{now.strftime('%Y%m%d_%H%M%S')}.db.gz"
+    )
+    snapshot_path: str = os.path.join(backup_dir, f".snapshot_{db_name}.db")
 
-    shutil.copy2(db_path, backup_path)
-    logger.info(f"Database backup saved: {backup_path}")
+    started: float = time.monotonic()
+    try:
+        pages: int = snapshot_database(
+            db_path,
+            snapshot_path,
+            config.get("BACKUP_PAGES_PER_STEP", DEFAULT_BACKUP_PAGES_PER_STEP),
+            config.get("BACKUP_STEP_SLEEP_S", DEFAULT_BACKUP_STEP_SLEEP_S),
+        )
+        snapshot_size: int = os.path.getsize(snapshot_path)
+        backup_size: int = compress_file(snapshot_path, backup_path)
+    finally:
+        if os.path.exists(snapshot_path):
+            os.remove(snapshot_path)
+    removed: List[str] = rotate_backups(
+        backup_dir,
+        db_name,
+        config.get("BACKUP_GENERATIONS", DEFAULT_BACKUP_GENERATIONS),
+    )
+    elapsed: float = time.monotonic() - started
+
+    logger.info(
+        f"Database backup saved: {backup_path} ({pages} pages, {snapshot_size} -> {backup_size} bytes, "
+        f"{elapsed:.1f} s, {len(removed)} old backup(s) removed)"
+    )
     send_admin_email(
         "Database backup saved",
-        f"PulseSystemMonitoringStation\nDaily backup_database report.\n{formatted_now}\n\nDatabase backup saved successfully.\nDatabase backup path: {backup_path}",
+        f"PulseSystemMonitoringStation\nDaily backup_database report.\n{formatted_now}\n\nDatabase backup saved successfully.\nDatabase backup path: {backup_path}\nDatabase size: {snapshot_size} bytes, compressed: {backup_size} bytes",
     )
     return backup_path
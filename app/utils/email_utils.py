@@ -1,12 +1,13 @@
 from flask import current_app
 from flask_mail import Message
-import time
-from datetime import datetime, timedelta
-from typing import Any
-from app.models import User, Settings
+import smtplib
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+from app.models import db, User, Settings
 from app.utils.logging import logger
 from app.utils.exception_handler import exception_handler
 from app.utils.retry_connection import retry_connection
+from app.utils.alert_utils import is_alert_due, mark_alerts_sent
 
 
 @exception_handler(default_return=False)
@@ -40,13 +41,78 @@ def send_email(email: str, subject: str, body: str) -> bool:
         return True
 
 
+@retry_connection()
+def _send_pending_emails(
+    pending: Deque[str], results: Dict[str, bool], subject: str, body: str
+) -> None:
+    """
+    Sends the email to the pending recipients over a single SMTP connection.
+
+    Recipients are removed from `pending` as soon as the server accepted or
+    refused their message, so a retry after a dropped connection only sends
+    to the remaining ones.
+
+    Args:
+        pending (Deque[str]): The recipients' email addresses still to be sent to.
+        results (Dict[str, bool]): Whether the email was sent, updated in place.
+        subject (str): The subject of the email.
+        body (str): The body content of the email.
+    """
+    from app import mail
+
+    with mail.connect() as connection:
+        while pending:
+            email = pending[0]
+            message = Message(subject=subject, recipients=[email])
+            message.body = body
+            try:
+                connection.send(message)
+                results[email] = True
+                logger.info(f'Email "{subject}" to {email} sent succesfully.')
+            except smtplib.SMTPRecipientsRefused as e:
+                logger.error(f"send_bulk_email() recipient {email} refused: {e.recipients}")
+            pending.popleft()
+
+
+def send_bulk_email(emails: List[str], subject: str, body: str) -> Dict[str, bool]:
+    """
+    Sends the same email to several recipients over one SMTP connection.
+
+    Every recipient still gets their own message, so the addresses are not
+    disclosed to each other and the result is known per recipient, but the
+    connection and TLS handshake are paid once per batch instead of once per
+    recipient. A dropped connection is reopened (see `retry_connection()`)
+    and only the unsent recipients are retried.
+
+    Args:
+        emails (List[str]): The recipients' email addresses.
+        subject (str): The subject of the email.
+        body (str): The body content of the email.
+
+    Returns:
+        Dict[str, bool]: Whether the email was sent, for every recipient.
+    """
+    results: Dict[str, bool] = dict.fromkeys(emails, False)
+    if not results:
+        return results
+
+    try:
+        with current_app.app_context():
+            _send_pending_emails(deque(results), results, subject, body)
+    except Exception as e:
+        logger.error(
+            f'send_bulk_email() email "{subject}" sent to {sum(results.values())} of {len(results)} recipients: {e}'
+        )
+    return results
+
+
 def send_admin_email(subject: str, body: str) -> Any:
     """
     Sends an email notification to all users with admin panel access.
 
     This function retrieves all users who have `admin_panel_access=True`
-    and sends them an email with the given subject and body. If an exception
-    occurs, it logs the error.
+    and sends them an email with the given subject and body over a single
+    SMTP connection. If an exception occurs, it logs the error.
 
     Args:
         subject (str): The subject of the email.
@@ -58,24 +124,102 @@ def send_admin_email(subject: str, body: str) -> Any:
     try:
         with current_app.app_context():
             users = User.query.filter_by(is_admin=True).all()
-            for user in users:
-                success = send_email(user.email, subject, body)
+            results = send_bulk_email([user.email for user in users], subject, body)
+            for email, success in results.items():
                 if not success:
-                    logger.error(
-                        f"Failed to send admin email to {user.email}. {subject} {body}"
-                    )
+                    logger.error(f"Failed to send admin email to {email}. {subject} {body}")
     except Exception as e:
         logger.error(f"Exception in send_admin_email: {str(e)}")
 
 
+def prepare_alert_email(
+    subject: str,
+    body: str,
+    receivers: Optional[List[User]] = None,
+    alerts_frequency_hrs: Optional[float] = None,
+) -> List[User]:
+    """
+    Selects the users with email alerts enabled whose last email alert is
+    older than `Settings.alerts_frequency_hrs`.
+
+    Args:
+        subject (str): The subject of the email.
+        body (str): The body content of the email.
+        receivers (Optional[List[User]]): Preloaded alert receivers of any
+            channel (see `load_alert_receivers()`), queried if not given.
+        alerts_frequency_hrs (Optional[float]): Preloaded alert frequency,
+            queried if not given.
+
+    Returns:
+        List[User]: The receivers of the alert email, see `send_alert_email()`.
+    """
+    if receivers is None:
+        email_alerts_receivers = User.query.filter_by(email_alerts_receiver=True).all()
+    else:
+        email_alerts_receivers = [user for user in receivers if user.email_alerts_receiver]
+
+    if alerts_frequency_hrs is None:
+        settings = Settings.query.first()
+        alerts_frequency_hrs = settings.alerts_frequency_hrs
+
+    receivers: List[User] = []
+    for user in email_alerts_receivers:
+        if is_alert_due(user.last_email_alert_time, alerts_frequency_hrs):
+            receivers.append(user)
+        else:
+            logger.warning(
+                f"Email alert not sent: Less than a {alerts_frequency_hrs} hour(s) since last alert."
+            )
+    return receivers
+
+
+def send_alert_email(users: List[User], subject: str, body: str) -> Dict[User, bool]:
+    """
+    Sends the alert email to the receivers over a single SMTP connection.
+
+    Args:
+        users (List[User]): The receivers returned by `prepare_alert_email()`.
+        subject (str): The subject of the email.
+        body (str): The body content of the email.
+
+    Returns:
+        Dict[User, bool]: Whether the email was sent, for every receiver.
+    """
+    results = send_bulk_email([user.email for user in users], subject, body)
+    return {user: results[user.email] for user in users}
+
+
+def record_alert_email_results(results: Dict[User, bool], subject: str, body: str) -> None:
+    """
+    Updates the last email alert time of the users the alert email was sent
+    to (in one statement, the caller commits) and reports the failed ones to
+    the admins.
+
+    Args:
+        results (Dict[User, bool]): Whether the email was sent, for every receiver.
+        subject (str): The subject of the email.
+        body (str): The body content of the email.
+    """
+    mark_alerts_sent("email", [user for user, success in results.items() if success])
+    for user, success in results.items():
+        if not success:
+            logger.error(
+                f"Failed to send trade info email to {user.email}. {subject} {body}"
+            )
+            send_admin_email(
+                f"Error in filter_users_and_send_trade_emails",
+                f"Failed to send trade info email to {user.email}",
+            )
+
+
 @exception_handler()
 def filter_users_and_send_alert_email(subject: str, body: str) -> Any:
     """
     Sends trade-related notifications via email.
 
-    This function retrieves all users who have `email_trades_receiver=True`
-    and sends them an email with the given subject and body. If an exception
-    occurs, it logs the error.
+    This function retrieves all users who have `email_alerts_receiver=True`
+    and sends them an email with the given subject and body over a single
+    SMTP connection. If an exception occurs, it logs the error.
 
     Args:
         subject (str): The subject of the email.
@@ -85,28 +229,7 @@ def filter_users_and_send_alert_email(subject: str, body: str) -> Any:
         Logs any exceptions encountered.
     """
     with current_app.app_context():
-        email_alerts_receivers = User.query.filter_by(email_alerts_receiver=True).all()
-
-        settings = Settings.query.first()
-        alerts_frequency_hrs = settings.alerts_frequency_hrs
-        
-        for user in email_alerts_receivers:
-            if (
-                user.last_alert_time is None
-                or datetime.now() - user.last_alert_time >= timedelta(hours=alerts_frequency_hrs)
-            ):
-                success = send_email(user.email, subject, body)
-                if success:
-                    user.update_last_alert_time()
-                else:
-                    logger.error(
-                        f"Failed to send trade info email to {user.email}. {subject} {body}"
-                    )
-                    send_admin_email(
-                        f"Error in filter_users_and_send_trade_emails",
-                        f"Failed to send trade info email to {user.email}",
-                    )
-            else:
-                logger.warning(
-                    f"Email alert not sent: Less than a {alerts_frequency_hrs} hour(s) since last alert."
-                )
+        receivers = prepare_alert_email(subject, body)
+        results = send_alert_email(receivers, subject, body)
+        record_alert_email_results(results, subject, body)
+        db.session.commit()
@@ -0,0 +1,227 @@
+import hashlib
+import threading
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from flask import current_app, has_app_context
+from app.utils.logging import logger
+
+DEFAULT_ERROR_DIGEST_WINDOW_S: float = 15 * 60
+
+
+@dataclass
+class ErrorRecord:
+    """
+    Occurrences of one error fingerprint within the current digest window.
+
+    Attributes:
+        subject (str): The admin email subject of the error.
+        body (str): The admin email body of the latest occurrence.
+        first_seen (datetime): The time of the first occurrence.
+        last_seen (datetime): The time of the latest occurrence.
+        suppressed (int): Occurrences not emailed yet, reported by the next digest.
+    """
+
+    subject: str
+    body: str
+    first_seen: datetime
+    last_seen: datetime
+    suppressed: int = 0
+
+
+def fingerprint(subject: str, exc: Optional[BaseException] = None) -> str:
+    """
+    Computes a stable fingerprint of an error.
+
+    The exception message is left out on purpose, so the same fault with
+    varying ids or values in its message is reported as one error.
+
+    Args:
+        subject (str): The admin email subject, e.g. "ValueError in check_resources".
+        exc (Optional[BaseException]): The caught exception, its type and the
+            location it was raised at are part of the fingerprint.
+
+    Returns:
+        str: A short hexadecimal fingerprint.
+    """
+    parts: List[str] = [subject]
+    if exc is not None:
+        parts.append(type(exc).__qualname__)
+        frames = traceback.extract_tb(exc.__traceback__)
+        if frames:
+            parts.append(f"{frames[-1].filename}:{frames[-1].lineno}")
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()[:12]
+
+
+def send_admin_email_in_app(subject: str, body: str) -> None:
+    """
+    Sends an admin email from a thread without an application context.
+
+    Args:
+        subject (str): The subject of the email.
+        body (str): The body content of the email.
+    """
+    from app import app
+    from app.utils.email_utils import send_admin_email
+
+    with app.app_context():
+        send_admin_email(subject, body)
+
+
+class ErrorAggregator:
+    """
+    Coalesces admin error emails.
+
+    The first occurrence of an error is emailed right away, further
+    occurrences of the same fingerprint are only counted and reported by one
+    digest email per window. An error that stayed quiet for a whole window is
+    forgotten, so its next occurrence is emailed right away again. Emails are
+    sent by a single background thread, so the reporting thread never waits
+    for SMTP and the email cost is bounded by the number of distinct errors.
+    """
+
+    def __init__(
+        self,
+        window_s: Optional[float] = None,
+        send: Callable[[str, str], Any] = send_admin_email_in_app,
+    ) -> None:
+        """
+        Args:
+            window_s (Optional[float]): Seconds between digests, defaults to
+                `ERROR_DIGEST_WINDOW_S`.
+            send (Callable[[str, str], Any]): Sends an email given subject and body.
+        """
+        self.window_s = window_s
+        self.send = send
+        self._errors: Dict[str, ErrorRecord] = {}
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def report(
+        self, subject: str, body: str, exc: Optional[BaseException] = None
+    ) -> Optional[Future]:
+        """
+        Reports an error occurrence.
+
+        Args:
+            subject (str): The admin email subject.
+            body (str): The admin email body.
+            exc (Optional[BaseException]): The caught exception, see `fingerprint()`.
+
+        Returns:
+            Optional[Future]: The pending email for a new error, None if the
+                occurrence was suppressed until the next digest.
+        """
+        key = fingerprint(subject, exc)
+        now = datetime.now()
+        with self._lock:
+            record = self._errors.get(key)
+            if record is not None:
+                record.suppressed += 1
+                record.body = body
+                record.last_seen = now
+                return None
+            self._errors[key] = ErrorRecord(subject, body, now, now)
+            self._start_timer()
+        return self._submit(subject, f"{body}\n\nFingerprint: {key}")
+
+    def flush(self, restart: bool = True) -> int:
+        """
+        Sends the digest of the suppressed occurrences and starts a new window.
+        Called by the digest timer, blocks until the digest is sent.
+
+        Args:
+            restart (bool): Whether to start the timer of the new window.
+
+        Returns:
+            int: The number of distinct errors in the digest.
+        """
+        with self._lock:
+            self._timer = None
+            recurring = {
+                key: record for key, record in self._errors.items() if record.suppressed
+            }
+            self._errors = {
+                key: ErrorRecord(record.subject, record.body, record.first_seen, record.last_seen)
+                for key, record in recurring.items()
+            }
+            if self._errors and restart:
+                self._start_timer()
+
+        if recurring:
+            self._deliver(*self._digest(recurring))
+        return len(recurring)
+
+    def close(self) -> None:
+        """
+        Stops the digest timer and sends the last digest. Meant for `atexit`.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+        self.flush(restart=False)
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def _window_s(self) -> float:
+        if self.window_s:
+            return self.window_s
+        if has_app_context():
+            return current_app.config.get(
+                "ERROR_DIGEST_WINDOW_S", DEFAULT_ERROR_DIGEST_WINDOW_S
+            )
+        return DEFAULT_ERROR_DIGEST_WINDOW_S
+
+    def _start_timer(self) -> None:
+        if self._timer is None:
+            self._timer = threading.Timer(self._window_s(), self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _submit(self, subject: str, body: str) -> Future:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="ErrorReporter"
+                )
+            return self._executor.submit(self._deliver, subject, body)
+
+    def _deliver(self, subject: str, body: str) -> None:
+        try:
+            self.send(subject, body)
+        except Exception as e:
+            logger.error(f"ErrorAggregator failed to send '{subject}': {e}")
+
+    def _digest(self, recurring: Dict[str, ErrorRecord]) -> Tuple[str, str]:
+        lines: List[str] = []
+        for key, record in sorted(
+            recurring.items(), key=lambda item: item[1].suppressed, reverse=True
+        ):
+            lines.append(
+                f"{record.suppressed}x {record.subject} [{key}] "
+                f"(first {record.first_seen:%Y-%m-%d %H:%M:%S}, last {record.last_seen:%Y-%m-%d %H:%M:%S})\n"
+                f"{record.body}\n"
+            )
+        total = sum(record.suppressed for record in recurring.values())
+        subject = f"Error digest: {total} repeated occurrence(s) of {len(recurring)} error(s)"
+        return subject, "\n".join(lines)
+
+
+error_aggregator = ErrorAggregator()
+
+
+def report_error(subject: str, body: str, exc: Optional[BaseException] = None) -> None:
+    """
+    Reports an error to the admins through the shared `error_aggregator`.
+
+    Args:
+        subject (str): The admin email subject.
+        body (str): The admin email body.
+        exc (Optional[BaseException]): The caught exception, see `fingerprint()`.
+    """
+    error_aggregator.report(subject, body, exc)
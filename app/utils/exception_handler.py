@@ -15,7 +15,7 @@ def exception_handler(
 ) -> Callable[[F], F]:
     """
     A decorator that catches exceptions, logs the error, optionally rolls back the database session,
-    and sends an email notification.
+    and reports the error to the admins (coalesced by `error_aggregator`).
 
     Args:
         default_return (Any, optional): The value or callable to return if an exception occurs.
@@ -38,7 +38,7 @@ def exception_handler(
 
     Behavior:
         - Logs the exception with the bot ID (if available).
-        - Sends an email notification to the administrator.
+        - Reports the error to the administrator, repeated errors are sent as periodic digests.
         - Optionally rolls back the database session if `db_rollback=True`.
         - Returns `default_return` or its result in case of an error.
     """
@@ -80,20 +80,22 @@ def exception_handler(
             ) as e:
                 exception_type = type(e).__name__
                 logger.error(f"{bot_str}{exception_type} in {func.__name__}: {str(e)}")
-                from .email_utils import send_admin_email
+                from .error_aggregator import report_error
 
-                send_admin_email(
+                report_error(
                     f"{bot_str}{exception_type} in {func.__name__}",
                     f"StefanCryptoTradingBot\n{exception_type} in {func.__name__}\n\n{str(e)}",
+                    e,
                 )
             except Exception as e:
                 exception_type = "Exception"
                 logger.error(f"{bot_str}{exception_type} in {func.__name__}: {str(e)}")
-                from .email_utils import send_admin_email
+                from .error_aggregator import report_error
 
-                send_admin_email(
+                report_error(
                     f"{bot_str}{exception_type} in {func.__name__}",
                     f"StefanCryptoTradingBot\n{exception_type} in {func.__name__}\n\n{str(e)}",
+                    e,
                 )
 
             if db_rollback:
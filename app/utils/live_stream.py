@@ -0,0 +1,97 @@
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from flask import current_app
+from app.utils.logging import logger
+
+# Alert states published by the process running the alert rules engine.
+_alert_states: List[Dict[str, Any]] = []
+_published: Optional[List[Dict[str, Any]]] = None
+# Alert states read from ALERT_STATE_PATH, cached by file modification time.
+_cached_states: Tuple[Optional[int], List[Dict[str, Any]]] = (None, [])
+_alert_state_lock = threading.Lock()
+
+
+def format_event(event: str, data: Any, event_id: Optional[str] = None) -> str:
+    """
+    Formats a Server-Sent Event.
+
+    Args:
+        event (str): The event type, e.g. "samples".
+        data (Any): The JSON-serialisable event payload.
+        event_id (Optional[str]): The event id, sent back by the browser as
+            `Last-Event-ID` when it reconnects.
+
+    Returns:
+        str: The event in the `text/event-stream` format.
+    """
+    lines: List[str] = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+def publish_alert_states(states: List[Dict[str, Any]]) -> bool:
+    """
+    Publishes the currently firing alert rules to the /api/stream clients of
+    every process. The states are written atomically to `ALERT_STATE_PATH`
+    (when set), only when they changed. Must be called within an application
+    context.
+
+    Args:
+        states (List[Dict[str, Any]]): The firing rules, see `RulesEngine.firing()`.
+
+    Returns:
+        bool: True if the states changed.
+    """
+    global _alert_states, _published
+
+    with _alert_state_lock:
+        if states == _published:
+            return False
+        _alert_states = _published = states
+
+    path: Optional[str] = current_app.config.get("ALERT_STATE_PATH")
+    if path:
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "w") as file:
+                json.dump(states, file)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.error(f"publish_alert_states() failed to write {path}: {e}")
+    return True
+
+
+def get_alert_states() -> List[Dict[str, Any]]:
+    """
+    Returns the firing alert rules published by `publish_alert_states()`,
+    possibly by another process. The file is only re-read when it changed.
+    Must be called within an application context.
+
+    Returns:
+        List[Dict[str, Any]]: The firing rules, see `RulesEngine.firing()`.
+    """
+    global _cached_states
+
+    path: Optional[str] = current_app.config.get("ALERT_STATE_PATH")
+    if not path:
+        return _alert_states
+
+    try:
+        modified: Optional[int] = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return []
+    if modified == _cached_states[0]:
+        return _cached_states[1]
+
+    try:
+        with open(path) as file:
+            states: List[Dict[str, Any]] = json.load(file)
+    except (OSError, ValueError) as e:
+        logger.error(f"get_alert_states() failed to read {path}: {e}")
+        return _cached_states[1]
+    _cached_states = (modified, states)
+    return states
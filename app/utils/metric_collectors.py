@@ -0,0 +1,292 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Type, Union
+import psutil
+from flask import current_app
+from app.utils.logging import logger
+from app.utils.resource_sampler import NET_RATE_FIELDS, counter_delta
+
+DEFAULT_COLLECTOR_WORKERS: int = 4
+DEFAULT_COLLECTOR_TIMEOUT_S: float = 2
+
+# Linux-only: allocated, unused and maximum number of file handles.
+FILE_NR_PATH: str = "/proc/sys/fs/file-nr"
+
+
+class MetricCollector:
+    """
+    Base class of the pluggable metric collectors.
+
+    A collector reads one group of metrics and returns them as a mapping of
+    series name to value. Series are stored in the narrow `MetricSample` table,
+    so registering a new collector doesn't require a schema change. Collectors
+    run on a thread pool, concurrently with each other, and must not touch the
+    database.
+
+    Attributes:
+        name (str): The unique collector name, used for registration and logging.
+    """
+
+    name: str = ""
+
+    def collect(self) -> Dict[str, Optional[float]]:
+        """
+        Reads the current values of the collector's series.
+
+        Returns:
+            Dict[str, Optional[float]]: Values keyed by series name. None values are skipped.
+        """
+        raise NotImplementedError
+
+
+_collectors: Dict[str, MetricCollector] = {}
+_pending: Dict[str, Future] = {}
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def register_collector(
+    collector: Union[MetricCollector, Type[MetricCollector]]
+) -> Union[MetricCollector, Type[MetricCollector]]:
+    """
+    Registers a metric collector, replacing one registered under the same name.
+    Can be used as a class decorator.
+
+    Args:
+        collector (Union[MetricCollector, Type[MetricCollector]]): A collector
+            instance, or a collector class to be instantiated without arguments.
+
+    Returns:
+        Union[MetricCollector, Type[MetricCollector]]: The given collector, unchanged.
+    """
+    instance: MetricCollector = (
+        collector() if isinstance(collector, type) else collector
+    )
+    if not instance.name:
+        raise ValueError(f"{type(instance).__name__} has no name")
+    with _lock:
+        _collectors[instance.name] = instance
+    return collector
+
+
+def unregister_collector(name: str) -> None:
+    """
+    Removes a registered metric collector.
+
+    Args:
+        name (str): The collector name.
+    """
+    with _lock:
+        _collectors.pop(name, None)
+        _pending.pop(name, None)
+
+
+def get_collectors() -> Dict[str, MetricCollector]:
+    """
+    Returns the registered metric collectors.
+
+    Returns:
+        Dict[str, MetricCollector]: Collectors keyed by name.
+    """
+    with _lock:
+        return dict(_collectors)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Returns the process-wide thread pool running the collectors, creating it
+    with `METRIC_COLLECTOR_WORKERS` threads on first use.
+
+    Returns:
+        ThreadPoolExecutor: The collector thread pool.
+    """
+    global _executor
+
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=current_app.config.get(
+                    "METRIC_COLLECTOR_WORKERS", DEFAULT_COLLECTOR_WORKERS
+                ),
+                thread_name_prefix="MetricCollector",
+            )
+        return _executor
+
+
+def sample_series(sample: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    """
+    Turns the per-core CPU and per-interface network values of a
+    `read_resources()` sample into metric series.
+
+    Args:
+        sample (Dict[str, Any]): A sample returned by `read_resources()`.
+
+    Returns:
+        Dict[str, Optional[float]]: Values keyed by series name, e.g. "cpu.core0"
+            or "net.eth0.sent_rate".
+    """
+    series: Dict[str, Optional[float]] = {
+        f"cpu.core{index}": value
+        for index, value in enumerate(sample.get("cpu_per_core", ()))
+    }
+    for nic, rates in sample.get("net_per_nic", {}).items():
+        for key in NET_RATE_FIELDS.values():
+            series[f"net.{nic}.{key.removeprefix('net_')}"] = rates.get(key)
+    return series
+
+
+def collect_metrics(
+    timestamp: datetime, sample: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Runs every registered collector concurrently and returns their values as
+    `MetricSample` rows. Must be called within an application context.
+
+    Collectors that don't finish within `METRIC_COLLECTOR_TIMEOUT_S` are skipped
+    for this call and are not started again until the slow run completes, so a
+    hanging collector never delays the others or piles up threads.
+
+    Args:
+        timestamp (datetime): The timestamp of the rows.
+        sample (Optional[Dict[str, Any]]): A `read_resources()` sample whose per-core
+            and per-interface values are included, see `sample_series()`.
+
+    Returns:
+        List[Dict[str, Any]]: Rows with series, timestamp and value keys.
+    """
+    timeout_s: float = current_app.config.get(
+        "METRIC_COLLECTOR_TIMEOUT_S", DEFAULT_COLLECTOR_TIMEOUT_S
+    )
+    executor: ThreadPoolExecutor = _get_executor()
+
+    futures: Dict[Future, str] = {}
+    for name, collector in get_collectors().items():
+        with _lock:
+            pending: Optional[Future] = _pending.get(name)
+            if pending is not None and not pending.done():
+                logger.warning(
+                    f"collect_metrics() collector {name} is still running, skipped."
+                )
+                continue
+            future: Future = executor.submit(collector.collect)
+            _pending[name] = future
+        futures[future] = name
+
+    done, not_done = wait(futures, timeout=timeout_s)
+    for future in not_done:
+        logger.warning(
+            f"collect_metrics() collector {futures[future]} timed out after {timeout_s}s."
+        )
+
+    values: Dict[str, Optional[float]] = sample_series(sample) if sample else {}
+    for future in done:
+        try:
+            values.update(future.result())
+        except Exception as e:
+            logger.error(f"collect_metrics() collector {futures[future]} failed: {e}")
+
+    return [
+        {"series": series, "timestamp": timestamp, "value": float(value)}
+        for series, value in values.items()
+        if value is not None
+    ]
+
+
+@register_collector
+class LoadAverageCollector(MetricCollector):
+    """
+    System load average over 1, 5 and 15 minutes.
+    """
+
+    name = "load"
+
+    def collect(self) -> Dict[str, Optional[float]]:
+        load_1, load_5, load_15 = psutil.getloadavg()
+        return {"load.1": load_1, "load.5": load_5, "load.15": load_15}
+
+
+@register_collector
+class SwapCollector(MetricCollector):
+    """
+    Swap usage percentage and used swap in MB.
+    """
+
+    name = "swap"
+
+    def collect(self) -> Dict[str, Optional[float]]:
+        swap = psutil.swap_memory()
+        return {"swap.percent": swap.percent, "swap.used": swap.used / (1024 * 1024)}
+
+
+@register_collector
+class DiskIOCollector(MetricCollector):
+    """
+    Disk throughput (bytes per second) and operations per second of all disks,
+    computed from the counters of the previous call.
+    """
+
+    name = "disk_io"
+
+    FIELDS: Dict[str, str] = {
+        "read_bytes": "disk_io.read_rate",
+        "write_bytes": "disk_io.write_rate",
+        "read_count": "disk_io.read_ops_rate",
+        "write_count": "disk_io.write_ops_rate",
+    }
+
+    def __init__(self) -> None:
+        self._counters: Optional[NamedTuple] = None
+        self._time: Optional[float] = None
+
+    def collect(self) -> Dict[str, Optional[float]]:
+        counters = psutil.disk_io_counters()
+        now: float = time.monotonic()
+        previous, previous_time = self._counters, self._time
+        self._counters, self._time = counters, now
+
+        if counters is None or previous is None or now <= previous_time:
+            return {}
+        return {
+            series: counter_delta(getattr(counters, field), getattr(previous, field))
+            / (now - previous_time)
+            for field, series in self.FIELDS.items()
+        }
+
+
+@register_collector
+class OpenFilesCollector(MetricCollector):
+    """
+    Number of file handles allocated system-wide (Linux only).
+    """
+
+    name = "open_files"
+
+    def collect(self) -> Dict[str, Optional[float]]:
+        try:
+            with open(FILE_NR_PATH) as file_nr:
+                allocated, unused, _ = file_nr.read().split()
+        except (OSError, ValueError):
+            return {}
+        return {"open_files": float(int(allocated) - int(unused))}
+
+
+@register_collector
+class MountUsageCollector(MetricCollector):
+    """
+    Usage percentage of every mounted physical partition.
+    """
+
+    name = "mounts"
+
+    def collect(self) -> Dict[str, Optional[float]]:
+        usage: Dict[str, Optional[float]] = {}
+        for partition in psutil.disk_partitions(all=False):
+            try:
+                usage[f"disk.{partition.mountpoint}.percent"] = psutil.disk_usage(
+                    partition.mountpoint
+                ).percent
+            except OSError:
+                continue
+        return usage
@@ -0,0 +1,120 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
+from flask import current_app
+from sqlalchemy import delete, select
+from app.models import db, AlertOutbox
+from app.utils.logging import logger
+from app.utils.exception_handler import exception_handler
+
+DEFAULT_ALERT_RETRY_BASE_S: float = 30
+DEFAULT_ALERT_RETRY_MAX_S: float = 60 * 60
+DEFAULT_ALERT_MAX_ATTEMPTS: int = 10
+
+# Alerts dispatched in one run of the dispatcher job.
+DISPATCH_BATCH_SIZE: int = 50
+# How long delivered alerts are kept in the outbox.
+SENT_ALERTS_RETENTION: timedelta = timedelta(days=7)
+
+
+def enqueue_alert(subject: str, body: str) -> AlertOutbox:
+    """
+    Stores an alert in the outbox for delivery by `dispatch_alerts()`.
+    Must be called within an application context.
+
+    Args:
+        subject (str): The alert title, used as the email subject.
+        body (str): The alert message content.
+
+    Returns:
+        AlertOutbox: The enqueued alert.
+    """
+    alert = AlertOutbox(subject=subject, body=body, next_attempt_at=datetime.now())
+    db.session.add(alert)
+    db.session.commit()
+    logger.info(f"enqueue_alert() alert {alert.id} '{subject}' enqueued.")
+    return alert
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """
+    Computes the exponential backoff before the next delivery attempt.
+
+    Args:
+        attempts (int): The number of failed attempts so far (at least 1).
+
+    Returns:
+        timedelta: `ALERT_RETRY_BASE_S` doubled for every further failed attempt,
+            capped at `ALERT_RETRY_MAX_S`.
+    """
+    base_s: float = current_app.config.get("ALERT_RETRY_BASE_S", DEFAULT_ALERT_RETRY_BASE_S)
+    max_s: float = current_app.config.get("ALERT_RETRY_MAX_S", DEFAULT_ALERT_RETRY_MAX_S)
+    return timedelta(seconds=min(base_s * 2 ** (attempts - 1), max_s))
+
+
+@exception_handler(default_return=0)
+def dispatch_alerts(now: Optional[datetime] = None) -> int:
+    """
+    Delivers the due alerts from the outbox, oldest first.
+
+    Each alert is committed on its own, so a crash never loses or repeats more
+    than the alert in flight. A failed alert is retried with exponential
+    backoff (see `retry_delay()`) up to `ALERT_MAX_ATTEMPTS` times. Receivers
+    already reached by an earlier attempt are skipped by the alert frequency
+    check. Delivered alerts are removed after `SENT_ALERTS_RETENTION`.
+
+    Args:
+        now (Optional[datetime]): The current time, defaults to `datetime.now()`.
+
+    Returns:
+        int: The number of delivered alerts.
+    """
+    from app.utils.system_monitor import sent_user_alert
+
+    now = now or datetime.now()
+    max_attempts: int = current_app.config.get(
+        "ALERT_MAX_ATTEMPTS", DEFAULT_ALERT_MAX_ATTEMPTS
+    )
+
+    due_alerts: List[AlertOutbox] = db.session.scalars(
+        select(AlertOutbox)
+        .where(AlertOutbox.next_attempt_at <= now)
+        .order_by(AlertOutbox.id)
+        .limit(DISPATCH_BATCH_SIZE)
+    ).all()
+
+    delivered: int = 0
+    for alert in due_alerts:
+        try:
+            sent: bool = sent_user_alert(alert.subject, alert.body)
+            error: Optional[str] = None if sent else "Not delivered to every receiver."
+        except Exception as e:
+            db.session.rollback()
+            sent, error = False, str(e)
+
+        if sent:
+            alert.sent_at = datetime.now()
+            alert.next_attempt_at = None
+            alert.last_error = None
+            delivered += 1
+        else:
+            alert.attempts += 1
+            alert.last_error = error
+            if alert.attempts >= max_attempts:
+                alert.next_attempt_at = None
+                logger.error(
+                    f"dispatch_alerts() alert {alert.id} given up after {alert.attempts} attempts: {error}"
+                )
+            else:
+                alert.next_attempt_at = now + retry_delay(alert.attempts)
+                logger.warning(
+                    f"dispatch_alerts() alert {alert.id} attempt {alert.attempts} failed, retry at {alert.next_attempt_at}: {error}"
+                )
+        db.session.commit()
+
+    db.session.execute(
+        delete(AlertOutbox)
+        .where(AlertOutbox.sent_at < now - SENT_ALERTS_RETENTION)
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+    return delivered
@@ -0,0 +1,191 @@
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional
+import psutil
+
+# Guest time is already included in user/nice on Linux, so it is not added to the total.
+EXCLUDED_CPU_FIELDS = ("guest", "guest_nice")
+IDLE_CPU_FIELDS = ("idle", "iowait")
+
+# net_io_counters fields turned into per-second rates, with their sample keys.
+NET_RATE_FIELDS: Dict[str, str] = {
+    "bytes_sent": "net_sent_rate",
+    "bytes_recv": "net_recv_rate",
+    "packets_sent": "net_packets_sent_rate",
+    "packets_recv": "net_packets_recv_rate",
+}
+
+# Some platforms still expose 32-bit network counters.
+COUNTER_WRAP_32: int = 2**32
+
+
+def _cpu_total(times: NamedTuple) -> float:
+    """
+    Sums the CPU time fields of a `psutil.cpu_times()` snapshot.
+
+    Args:
+        times (NamedTuple): A cpu_times snapshot.
+
+    Returns:
+        float: The total CPU time in seconds.
+    """
+    return sum(
+        value
+        for field, value in zip(times._fields, times)
+        if field not in EXCLUDED_CPU_FIELDS
+    )
+
+
+def _cpu_delta(
+    current: NamedTuple, previous: Optional[NamedTuple]
+) -> Dict[str, float]:
+    """
+    Computes the utilisation breakdown between two cpu_times snapshots.
+
+    Args:
+        current (NamedTuple): The current snapshot.
+        previous (Optional[NamedTuple]): The previous snapshot. None means since boot.
+
+    Returns:
+        Dict[str, float]: "busy" plus one entry per cpu_times field, as percentages
+            of the elapsed CPU time.
+    """
+    total: float = _cpu_total(current) - (_cpu_total(previous) if previous else 0)
+    if total <= 0:
+        return {"busy": 0.0, **{field: 0.0 for field in current._fields}}
+
+    breakdown: Dict[str, float] = {
+        field: max(value - (getattr(previous, field) if previous else 0), 0)
+        / total
+        * 100
+        for field, value in zip(current._fields, current)
+    }
+    idle: float = sum(breakdown.get(field, 0.0) for field in IDLE_CPU_FIELDS)
+    breakdown["busy"] = min(max(100 - idle, 0.0), 100.0)
+    return breakdown
+
+
+def counter_delta(current: int, previous: int) -> int:
+    """
+    Computes the increase of a monotonic counter, tolerating wraps and resets.
+
+    A 32-bit counter that overflowed continues from zero, so the distance to the
+    wrap point is added back. Any other decrease means the counter was reset
+    (e.g. the interface was re-created) and the current value is the increase.
+
+    Args:
+        current (int): The current counter value.
+        previous (int): The previous counter value.
+
+    Returns:
+        int: The increase since the previous value.
+    """
+    if current >= previous:
+        return current - previous
+    if previous < COUNTER_WRAP_32:
+        return current + COUNTER_WRAP_32 - previous
+    return current
+
+
+class ResourceSampler:
+    """
+    Long-lived sampler that keeps the previous `psutil.cpu_times()` and
+    `psutil.net_io_counters()` snapshots and computes exact CPU utilisation
+    and network rates for the interval since the last call.
+
+    Unlike `psutil.cpu_percent()` without an interval, the result doesn't
+    depend on other callers in the process and never blocks. The first call
+    in a fresh process reports the average since boot instead of a
+    meaningless 0.0, and no network rates. The snapshots live in memory only,
+    so a reboot (which restarts the process) never yields a negative rate.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cpu_times: Optional[NamedTuple] = None
+        self._per_core_times: Optional[List[NamedTuple]] = None
+        self._net_counters: Optional[Dict[str, NamedTuple]] = None
+        self._net_time: Optional[float] = None
+
+    def sample_cpu(self) -> Dict[str, Any]:
+        """
+        Computes CPU utilisation since the previous call.
+
+        Returns:
+            Dict[str, Any]: A dictionary containing:
+                - cpu (float): Total CPU busy percentage.
+                - cpu_iowait (float): Percentage of time spent waiting for I/O (0 if unsupported).
+                - cpu_steal (float): Percentage of time stolen by the hypervisor (0 if unsupported).
+                - cpu_per_core (List[float]): Busy percentage of every core.
+        """
+        cpu_times = psutil.cpu_times()
+        per_core_times = psutil.cpu_times(percpu=True)
+
+        with self._lock:
+            previous: Optional[NamedTuple] = self._cpu_times
+            previous_per_core: Optional[List[NamedTuple]] = self._per_core_times
+            self._cpu_times = cpu_times
+            self._per_core_times = per_core_times
+
+        if previous_per_core is None or len(previous_per_core) != len(per_core_times):
+            previous_per_core = [None] * len(per_core_times)
+
+        breakdown: Dict[str, float] = _cpu_delta(cpu_times, previous)
+        return {
+            "cpu": breakdown["busy"],
+            "cpu_iowait": breakdown.get("iowait", 0.0),
+            "cpu_steal": breakdown.get("steal", 0.0),
+            "cpu_per_core": [
+                _cpu_delta(core, previous_core)["busy"]
+                for core, previous_core in zip(per_core_times, previous_per_core)
+            ],
+        }
+
+    def sample_network(self) -> Dict[str, Any]:
+        """
+        Reads the network counters of every interface and computes the byte and
+        packet rates since the previous call.
+
+        Returns:
+            Dict[str, Any]: A dictionary containing:
+                - net_sent, net_recv (float): Total MB sent/received since boot.
+                - net_sent_rate, net_recv_rate (Optional[float]): Bytes per second.
+                - net_packets_sent_rate, net_packets_recv_rate (Optional[float]): Packets per second.
+                - net_per_nic (Dict[str, Dict[str, float]]): The same rates for every interface.
+                The rates are None on the first call.
+        """
+        counters: Dict[str, NamedTuple] = psutil.net_io_counters(pernic=True)
+        now: float = time.monotonic()
+
+        with self._lock:
+            previous: Optional[Dict[str, NamedTuple]] = self._net_counters
+            previous_time: Optional[float] = self._net_time
+            self._net_counters = counters
+            self._net_time = now
+
+        result: Dict[str, Any] = {
+            "net_sent": sum(nic.bytes_sent for nic in counters.values()) / (1024 * 1024),
+            "net_recv": sum(nic.bytes_recv for nic in counters.values()) / (1024 * 1024),
+            **{key: None for key in NET_RATE_FIELDS.values()},
+            "net_per_nic": {},
+        }
+        elapsed: float = now - previous_time if previous_time is not None else 0
+        if previous is None or elapsed <= 0:
+            return result
+
+        for name, nic in counters.items():
+            previous_nic: Optional[NamedTuple] = previous.get(name)
+            if previous_nic is None:
+                continue
+            result["net_per_nic"][name] = {
+                key: counter_delta(getattr(nic, field), getattr(previous_nic, field))
+                / elapsed
+                for field, key in NET_RATE_FIELDS.items()
+            }
+
+        for key in NET_RATE_FIELDS.values():
+            result[key] = sum(rates[key] for rates in result["net_per_nic"].values())
+        return result
+
+
+sampler: ResourceSampler = ResourceSampler()
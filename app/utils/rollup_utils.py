@@ -0,0 +1,282 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from flask import current_app
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+from app.models import db, Monitor, MonitorRollup
+from app.utils.data_utils import percentile
+from app.utils.logging import logger
+from app.utils.exception_handler import exception_handler
+
+EPOCH: datetime = datetime(1970, 1, 1)
+
+# Rolled-up Monitor columns and the /api/data series they are served as.
+ROLLUP_METRICS: Dict[str, str] = {
+    "cpu": "cpu_usage",
+    "ram": "ram",
+    "disk": "disk",
+    "net_sent": "net_sent",
+    "net_recv": "net_recv",
+    "net_sent_rate": "net_sent_rate",
+    "net_recv_rate": "net_recv_rate",
+    "net_packets_sent_rate": "net_packets_sent_rate",
+    "net_packets_recv_rate": "net_packets_recv_rate",
+    "cpu_temp": "temperature",
+}
+
+# Buckets are only rolled up once they are this old, so samples that are
+# still on their way to the database are not missed.
+ROLLUP_SETTLE_SECONDS: int = 120
+
+
+def get_rollup_tiers() -> List[Tuple[int, float]]:
+    """
+    Returns the configured rollup tiers.
+
+    Returns:
+        List[Tuple[int, float]]: (bucket size in seconds, retention in hours) pairs,
+            ordered from the finest to the coarsest resolution.
+    """
+    return sorted(current_app.config.get("ROLLUP_TIERS", []))
+
+
+def floor_time(timestamp: datetime, resolution: int) -> datetime:
+    """
+    Rounds a timestamp down to the start of its bucket.
+
+    Args:
+        timestamp (datetime): The timestamp to round.
+        resolution (int): The bucket size in seconds.
+
+    Returns:
+        datetime: The start of the bucket containing `timestamp`.
+    """
+    seconds: int = int((timestamp - EPOCH).total_seconds())
+    return EPOCH + timedelta(seconds=seconds - seconds % resolution)
+
+
+def aggregate_bucket(values: Sequence[Any]) -> Optional[Dict[str, float]]:
+    """
+    Computes the rollup statistics for the values of one metric in one bucket.
+
+    Args:
+        values (Sequence[Any]): Raw values; non-numeric ones (e.g. "Brak danych") are ignored.
+
+    Returns:
+        Optional[Dict[str, float]]: count, min, max, avg and p95, or None if no numeric values.
+    """
+    numeric: List[float] = [
+        value for value in values if isinstance(value, (int, float))
+    ]
+    if not numeric:
+        return None
+    return {
+        "count": len(numeric),
+        "min": min(numeric),
+        "max": max(numeric),
+        "avg": sum(numeric) / len(numeric),
+        "p95": percentile(numeric, 95),
+    }
+
+
+def rollup_tier(resolution: int, now: datetime) -> int:
+    """
+    Aggregates raw Monitor records into the given tier, from the last rolled-up
+    bucket up to the last complete bucket.
+
+    Args:
+        resolution (int): The bucket size in seconds.
+        now (datetime): The current time.
+
+    Returns:
+        int: The number of rollup rows created.
+    """
+    last_bucket: Optional[datetime] = db.session.scalar(
+        select(func.max(MonitorRollup.bucket_start)).where(
+            MonitorRollup.resolution == resolution
+        )
+    )
+    if last_bucket is not None:
+        start: datetime = last_bucket + timedelta(seconds=resolution)
+    else:
+        first_timestamp: Optional[datetime] = db.session.scalar(
+            select(func.min(Monitor.timestamp))
+        )
+        if first_timestamp is None:
+            return 0
+        start = floor_time(first_timestamp, resolution)
+
+    end: datetime = floor_time(
+        now - timedelta(seconds=ROLLUP_SETTLE_SECONDS), resolution
+    )
+    if start >= end:
+        return 0
+
+    columns = [getattr(Monitor, metric) for metric in ROLLUP_METRICS]
+    rows = db.session.execute(
+        select(Monitor.timestamp, *columns)
+        .where(Monitor.timestamp >= start)
+        .where(Monitor.timestamp < end)
+        .order_by(Monitor.timestamp)
+    ).all()
+
+    buckets: Dict[datetime, List[Tuple[Any, ...]]] = {}
+    for row in rows:
+        buckets.setdefault(floor_time(row[0], resolution), []).append(row[1:])
+
+    rollups: List[Dict[str, Any]] = []
+    for bucket_start, bucket_rows in buckets.items():
+        for index, metric in enumerate(ROLLUP_METRICS):
+            stats = aggregate_bucket([row[index] for row in bucket_rows])
+            if stats is not None:
+                rollups.append(
+                    {
+                        "resolution": resolution,
+                        "bucket_start": bucket_start,
+                        "metric": metric,
+                        **stats,
+                    }
+                )
+
+    if rollups:
+        db.session.execute(insert(MonitorRollup), rollups)
+    db.session.commit()
+    return len(rollups)
+
+
+def prune_tier(resolution: int, cutoff_time: datetime) -> int:
+    """
+    Removes rollup rows of the given tier older than its retention window.
+
+    Args:
+        resolution (int): The bucket size in seconds.
+        cutoff_time (datetime): Buckets starting before this time are removed.
+
+    Returns:
+        int: The number of removed rows.
+    """
+    result = db.session.execute(
+        delete(MonitorRollup)
+        .where(MonitorRollup.resolution == resolution)
+        .where(MonitorRollup.bucket_start < cutoff_time)
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+    return result.rowcount
+
+
+@exception_handler(default_return=0)
+def rollup_monitor_data() -> int:
+    """
+    Rolls raw monitoring records up into every configured tier and applies
+    each tier's own retention window.
+
+    Returns:
+        int: The number of rollup rows created.
+    """
+    now: datetime = datetime.now()
+    created: int = 0
+    for resolution, retention_hrs in get_rollup_tiers():
+        created += rollup_tier(resolution, now)
+        removed: int = prune_tier(resolution, now - timedelta(hours=retention_hrs))
+        logger.info(
+            f"rollup_monitor_data() {resolution}s tier updated, {removed} expired buckets removed."
+        )
+    return created
+
+
+def select_rollup_tier(
+    start: Optional[datetime],
+    end: Optional[datetime],
+    points: Optional[int],
+    raw_retention_hrs: float,
+    now: Optional[datetime] = None,
+) -> Optional[int]:
+    """
+    Picks the rollup tier that should serve a history query.
+
+    Raw records are used when the range fits in the raw retention window and no
+    tier is coarse enough to be useful. Otherwise the coarsest tier whose bucket
+    is not wider than one requested point is used, so long ranges never touch
+    raw records. Ranges older than the raw retention always use a tier.
+
+    Args:
+        start (Optional[datetime]): The start of the range. None means raw records.
+        end (Optional[datetime]): The end of the range, defaults to `now`.
+        points (Optional[int]): The requested maximum number of points per series.
+        raw_retention_hrs (float): How long raw records are kept.
+        now (Optional[datetime]): The current time, defaults to `datetime.now()`.
+
+    Returns:
+        Optional[int]: The tier resolution in seconds, or None for raw records.
+    """
+    if start is None:
+        return None
+
+    now = now or datetime.now()
+    end = end or now
+    tiers: List[Tuple[int, float]] = get_rollup_tiers()
+    if not tiers:
+        return None
+
+    needs_rollup: bool = start < now - timedelta(hours=raw_retention_hrs)
+    covering: List[int] = [
+        resolution
+        for resolution, retention_hrs in tiers
+        if start >= now - timedelta(hours=retention_hrs)
+    ]
+
+    selected: Optional[int] = None
+    if points:
+        point_width: float = (end - start).total_seconds() / points
+        for resolution in covering:
+            if resolution <= point_width:
+                selected = resolution
+
+    if selected is None and needs_rollup:
+        selected = covering[0] if covering else tiers[-1][0]
+    return selected
+
+
+def get_rollup_series(
+    resolution: int,
+    start: Optional[datetime],
+    end: Optional[datetime],
+    agg: str,
+    session: Optional[Session] = None,
+) -> Tuple[List[datetime], Dict[str, List[Optional[float]]]]:
+    """
+    Loads rolled-up history of one tier as /api/data series.
+
+    Args:
+        resolution (int): The tier bucket size in seconds.
+        start (Optional[datetime]): Inclusive lower bound of the bucket start.
+        end (Optional[datetime]): Inclusive upper bound of the bucket start.
+        agg (str): Which statistic to return: "avg", "min", "max" or "p95".
+        session (Optional[Session]): The session to query, defaults to `db.session`.
+
+    Returns:
+        Tuple[List[datetime], Dict[str, List[Optional[float]]]]: Bucket start times and
+            the series keyed like the /api/data response.
+    """
+    statistic = getattr(MonitorRollup, agg)
+    query = select(
+        MonitorRollup.bucket_start, MonitorRollup.metric, statistic
+    ).where(MonitorRollup.resolution == resolution)
+    if start is not None:
+        query = query.where(MonitorRollup.bucket_start >= floor_time(start, resolution))
+    if end is not None:
+        query = query.where(MonitorRollup.bucket_start <= end)
+    rows = (session or db.session).execute(query.order_by(MonitorRollup.bucket_start)).all()
+
+    timestamps: List[datetime] = []
+    series: Dict[str, List[Optional[float]]] = {
+        key: [] for key in ROLLUP_METRICS.values()
+    }
+    for bucket_start, metric, value in rows:
+        if not timestamps or timestamps[-1] != bucket_start:
+            timestamps.append(bucket_start)
+            for values in series.values():
+                values.append(None)
+        series[ROLLUP_METRICS[metric]][-1] = value
+    return timestamps, series
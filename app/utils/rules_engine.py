@@ -0,0 +1,306 @@
+import operator
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional
+from flask import current_app
+from sqlalchemy import select
+from app.models import db, AlertRule, Settings
+from app.utils.logging import logger
+
+DEFAULT_ALERT_RULES_RELOAD_S: float = 60
+
+OPERATORS: Dict[str, Callable[[float, float], bool]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+# Built-in rule from `Settings.cpu_alert_temp`, used unless an AlertRule
+# on cpu_temp exists.
+CPU_TEMP_RULE_KEY: str = "settings:cpu_temp"
+CPU_TEMP_RULE_NAME: str = "CPU Temperature"
+CPU_TEMP_HYSTERESIS: float = 2.0
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    A snapshot of an alert rule, see `AlertRule` for the meaning of the fields.
+
+    Attributes:
+        key (str): Identifies the rule state across reloads.
+    """
+
+    key: str
+    name: str
+    metric: str
+    operator: str
+    threshold: float
+    for_samples: int = 1
+    avg_window: int = 1
+    hysteresis: float = 0
+
+    @classmethod
+    def from_model(cls, alert_rule: AlertRule) -> "Rule":
+        """
+        Creates the snapshot of a stored rule.
+
+        Args:
+            alert_rule (AlertRule): The stored rule.
+
+        Returns:
+            Rule: The snapshot, detached from the database session.
+        """
+        return cls(
+            key=f"rule:{alert_rule.id}",
+            name=alert_rule.name,
+            metric=alert_rule.metric,
+            operator=alert_rule.operator,
+            threshold=alert_rule.threshold,
+            for_samples=max(alert_rule.for_samples or 1, 1),
+            avg_window=max(alert_rule.avg_window or 1, 1),
+            hysteresis=alert_rule.hysteresis or 0,
+        )
+
+    def resolve_threshold(self) -> float:
+        """
+        Returns:
+            float: The threshold moved by the hysteresis away from the breach side.
+        """
+        if self.operator in (">", ">="):
+            return self.threshold - self.hysteresis
+        return self.threshold + self.hysteresis
+
+
+class RuleState:
+    """
+    The incremental state of one rule: the rolling window of recent values
+    with its running sum, the streak of breaching samples and whether (since
+    when and at which value) the rule is firing.
+    """
+
+    def __init__(self, rule: Rule) -> None:
+        self.window: Deque[float] = deque(maxlen=rule.avg_window)
+        self.total: float = 0.0
+        self.streak: int = 0
+        self.firing: bool = False
+        self.fired_at: Optional[datetime] = None
+        self.fired_value: Optional[float] = None
+
+    def push(self, value: float) -> float:
+        """
+        Adds a value to the window in O(1).
+
+        Args:
+            value (float): The latest metric value.
+
+        Returns:
+            float: The average of the window.
+        """
+        if len(self.window) == self.window.maxlen:
+            self.total -= self.window[0]
+        self.window.append(value)
+        self.total += value
+        return self.total / len(self.window)
+
+
+@dataclass
+class RuleTransition:
+    """
+    A rule that fired or resolved on a sample.
+
+    Attributes:
+        rule (Rule): The rule.
+        fired (bool): True if the rule fired, False if it resolved.
+        value (float): The (averaged) metric value.
+        timestamp (datetime): The time of the sample.
+    """
+
+    rule: Rule
+    fired: bool
+    value: float
+    timestamp: datetime
+
+    def subject(self) -> str:
+        """
+        Returns:
+            str: The alert title, e.g. "CPU Temperature Alert.".
+        """
+        return f"{self.rule.name} {'Alert' if self.fired else 'Resolved'}."
+
+    def content(self) -> str:
+        """
+        Returns:
+            str: The alert message content.
+        """
+        formatted_time = self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        rule = self.rule
+        condition = f"{rule.operator} {rule.threshold}"
+        if rule.avg_window > 1:
+            condition += f" (average of {rule.avg_window} samples)"
+        if rule.for_samples > 1:
+            condition += f" for {rule.for_samples} samples"
+        return (
+            f"PulseSystemMonitoringStation\nhttps://pulse.ropeaccess.pro\n\n{self.subject()}\n{formatted_time}\n\n"
+            f"Current {rule.metric} = {round(self.value, 2)}\nLimit = {condition}"
+        )
+
+
+def sample_values(sample: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Collects the numeric values of a sample by metric name.
+
+    Args:
+        sample (Dict[str, Any]): A sample returned by `read_resources()`.
+
+    Returns:
+        Dict[str, float]: The `Monitor` columns and the metric collector series.
+    """
+    values: Dict[str, float] = {
+        key: value
+        for key, value in sample.items()
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+    }
+    for row in sample.get("metrics", ()):
+        if row.get("value") is not None:
+            values[row["series"]] = row["value"]
+    return values
+
+
+class RulesEngine:
+    """
+    Evaluates the alert rules incrementally, one sample at a time.
+
+    Every rule keeps only its rolling window in memory, so evaluating a
+    sample costs O(rules) regardless of the stored history. The rules are
+    reloaded from the database every `ALERT_RULES_RELOAD_S` seconds; the
+    state of unchanged rules survives a reload.
+    """
+
+    def __init__(self) -> None:
+        self._rules: List[Rule] = []
+        self._states: Dict[str, RuleState] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def set_rules(self, rules: List[Rule]) -> None:
+        """
+        Replaces the evaluated rules, keeping the state of unchanged ones.
+
+        Args:
+            rules (List[Rule]): The rules to evaluate.
+        """
+        valid_rules: List[Rule] = []
+        for rule in rules:
+            if rule.operator not in OPERATORS:
+                logger.error(f"RulesEngine rule '{rule.name}' has unknown operator '{rule.operator}'.")
+                continue
+            valid_rules.append(rule)
+
+        with self._lock:
+            previous = {rule.key: rule for rule in self._rules}
+            self._states = {
+                rule.key: self._states[rule.key]
+                if previous.get(rule.key) == rule and rule.key in self._states
+                else RuleState(rule)
+                for rule in valid_rules
+            }
+            self._rules = valid_rules
+            self._loaded_at = time.monotonic()
+
+    def reload(self) -> None:
+        """
+        Loads the enabled rules and the CPU temperature limit from the database.
+        Must be called within an application context.
+        """
+        stored_rules: List[AlertRule] = db.session.scalars(
+            select(AlertRule).where(AlertRule.enabled.is_(True)).order_by(AlertRule.id)
+        ).all()
+        rules: List[Rule] = [Rule.from_model(alert_rule) for alert_rule in stored_rules]
+
+        settings = Settings.query.first()
+        if settings is not None and not any(rule.metric == "cpu_temp" for rule in rules):
+            rules.insert(
+                0,
+                Rule(
+                    key=CPU_TEMP_RULE_KEY,
+                    name=CPU_TEMP_RULE_NAME,
+                    metric="cpu_temp",
+                    operator=">=",
+                    threshold=settings.cpu_alert_temp,
+                    hysteresis=CPU_TEMP_HYSTERESIS,
+                ),
+            )
+        self.set_rules(rules)
+
+    def evaluate(self, sample: Dict[str, Any]) -> List[RuleTransition]:
+        """
+        Feeds a sample to every rule. Must be called within an application
+        context, the rules are reloaded when due.
+
+        Args:
+            sample (Dict[str, Any]): A sample returned by `read_resources()`.
+
+        Returns:
+            List[RuleTransition]: The rules that fired or resolved on this sample.
+        """
+        reload_s: float = current_app.config.get(
+            "ALERT_RULES_RELOAD_S", DEFAULT_ALERT_RULES_RELOAD_S
+        )
+        if self._loaded_at is None or time.monotonic() - self._loaded_at >= reload_s:
+            self.reload()
+
+        values = sample_values(sample)
+        timestamp: datetime = sample.get("timestamp") or datetime.now()
+        transitions: List[RuleTransition] = []
+
+        with self._lock:
+            for rule in self._rules:
+                value = values.get(rule.metric)
+                if value is None:
+                    continue
+
+                state = self._states[rule.key]
+                average = state.push(value)
+                compare = OPERATORS[rule.operator]
+
+                if compare(average, rule.threshold):
+                    state.streak += 1
+                    if not state.firing and state.streak >= rule.for_samples:
+                        state.firing = True
+                        state.fired_at, state.fired_value = timestamp, average
+                        transitions.append(RuleTransition(rule, True, average, timestamp))
+                else:
+                    state.streak = 0
+                    if state.firing and not compare(average, rule.resolve_threshold()):
+                        state.firing = False
+                        state.fired_at, state.fired_value = None, None
+                        transitions.append(RuleTransition(rule, False, average, timestamp))
+        return transitions
+
+    def firing(self) -> List[Dict[str, Any]]:
+        """
+        Returns:
+            List[Dict[str, Any]]: The rules currently firing (name, metric,
+                operator, threshold, the value and ISO time they fired at).
+        """
+        with self._lock:
+            return [
+                {
+                    "name": rule.name,
+                    "metric": rule.metric,
+                    "operator": rule.operator,
+                    "threshold": rule.threshold,
+                    "value": self._states[rule.key].fired_value,
+                    "since": self._states[rule.key].fired_at.isoformat(),
+                }
+                for rule in self._rules
+                if self._states[rule.key].firing
+            ]
+
+
+rules_engine = RulesEngine()
@@ -0,0 +1,467 @@
+import math
+import mmap
+import os
+import threading
+import zlib
+from array import array
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+from flask import current_app
+from app.utils.rollup_utils import ROLLUP_METRICS
+from app.utils.logging import logger
+
+DEFAULT_SAMPLE_BUFFER_SIZE: int = 720
+
+NAN: float = float("nan")
+
+T = TypeVar("T")
+
+
+class SampleRingBuffer:
+    """
+    A fixed-size ring buffer of the most recent samples.
+
+    Every metric is kept in its own compact `array('d')` (8 bytes per value,
+    NaN for missing values) next to an array of epoch timestamps, so the
+    footprint is bounded by `capacity * (len(metrics) + 1) * 8` bytes and the
+    latest value, short-window averages and short chart ranges are served
+    from memory without touching the database.
+
+    Attributes:
+        capacity (int): The maximum number of samples kept.
+        metrics (Tuple[str, ...]): The buffered sample keys (`Monitor` columns).
+        writable (bool): Whether this process may append samples.
+    """
+
+    writable: bool = True
+
+    def __init__(self, capacity: int, metrics: Iterable[str] = ROLLUP_METRICS) -> None:
+        self.capacity = capacity
+        self.metrics: Tuple[str, ...] = tuple(metrics)
+        self._timestamps = array("d", [NAN]) * capacity
+        self._values: Dict[str, Any] = {
+            metric: array("d", [NAN]) * capacity for metric in self.metrics
+        }
+        self._next: int = 0
+        self._count: int = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._read(lambda: self._count)
+
+    def append(self, sample: Dict[str, Any]) -> None:
+        """
+        Adds a sample in O(metrics), overwriting the oldest one when full.
+
+        Args:
+            sample (Dict[str, Any]): A sample returned by `read_resources()`.
+        """
+        with self._lock:
+            self._write(sample)
+
+    def oldest_timestamp(self) -> Optional[datetime]:
+        """
+        Returns:
+            Optional[datetime]: The time of the oldest buffered sample, None if empty.
+        """
+
+        def read() -> Optional[datetime]:
+            if not self._count:
+                return None
+            oldest = (self._next - self._count) % self.capacity
+            return datetime.fromtimestamp(self._timestamps[oldest])
+
+        return self._read(read)
+
+    def covers(self, start: Optional[datetime]) -> bool:
+        """
+        Checks whether every sample newer than `start` taken by the collector is
+        still buffered, i.e. a query from `start` can be served from memory.
+
+        Args:
+            start (Optional[datetime]): The lower bound of the query, None for all history.
+
+        Returns:
+            bool: True if the buffer holds all samples from `start` on.
+        """
+        oldest = self.oldest_timestamp()
+        return start is not None and oldest is not None and oldest <= start
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns:
+            Optional[Dict[str, Any]]: The newest sample (timestamp and metrics,
+                None for missing values), None if the buffer is empty.
+        """
+
+        def read() -> Optional[Dict[str, Any]]:
+            if not self._count:
+                return None
+            index = (self._next - 1) % self.capacity
+            return {
+                "timestamp": datetime.fromtimestamp(self._timestamps[index]),
+                **{
+                    metric: _optional(values[index])
+                    for metric, values in self._values.items()
+                },
+            }
+
+        return self._read(read)
+
+    def average(
+        self, metric: str, seconds: float, now: Optional[datetime] = None
+    ) -> Optional[float]:
+        """
+        Averages a metric over the buffered samples of the last `seconds`.
+
+        Args:
+            metric (str): The metric name.
+            seconds (float): The window length.
+            now (Optional[datetime]): The end of the window, defaults to `datetime.now()`.
+
+        Returns:
+            Optional[float]: The average, None if there are no values in the window.
+        """
+        cutoff = (now or datetime.now()).timestamp() - seconds
+
+        def read() -> Optional[float]:
+            if not self._count:
+                return None
+            values = self._values[metric]
+            total, count = 0.0, 0
+            for index in self._newest_first():
+                if self._timestamps[index] < cutoff:
+                    break
+                value = values[index]
+                if not math.isnan(value):
+                    total += value
+                    count += 1
+            return total / count if count else None
+
+        return self._read(read)
+
+    def series(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        after: Optional[datetime] = None,
+    ) -> Tuple[List[datetime], Dict[str, List[Optional[float]]]]:
+        """
+        Returns the buffered samples in a time range, oldest first. Only the
+        samples in the range are visited, newest first.
+
+        Args:
+            start (Optional[datetime]): Inclusive lower bound.
+            end (Optional[datetime]): Inclusive upper bound.
+            after (Optional[datetime]): Exclusive lower bound (incremental cursor).
+
+        Returns:
+            Tuple[List[datetime], Dict[str, List[Optional[float]]]]: The sample
+                timestamps and the values of every metric.
+        """
+        low = max(
+            start.timestamp() if start is not None else -math.inf,
+            math.nextafter(after.timestamp(), math.inf) if after is not None else -math.inf,
+        )
+        high = end.timestamp() if end is not None else math.inf
+
+        def read() -> Tuple[List[datetime], Dict[str, List[Optional[float]]]]:
+            indices: List[int] = []
+            for index in self._newest_first():
+                timestamp = self._timestamps[index]
+                if timestamp < low:
+                    break
+                if timestamp <= high:
+                    indices.append(index)
+            indices.reverse()
+            timestamps = [datetime.fromtimestamp(self._timestamps[i]) for i in indices]
+            series = {
+                metric: [_optional(self._values[metric][i]) for i in indices]
+                for metric in self.metrics
+            }
+            return timestamps, series
+
+        return self._read(read)
+
+    def _write(self, sample: Dict[str, Any]) -> None:
+        index = self._next
+        self._timestamps[index] = sample["timestamp"].timestamp()
+        for metric, values in self._values.items():
+            value = sample.get(metric)
+            values[index] = NAN if value is None else value
+        self._next = (index + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def _read(self, read: Callable[[], T]) -> T:
+        with self._lock:
+            return read()
+
+    def _newest_first(self) -> Iterable[int]:
+        next_index, count = self._next, self._count
+        for offset in range(1, count + 1):
+            yield (next_index - offset) % self.capacity
+
+    def _reset_lock(self) -> None:
+        self._lock = threading.Lock()
+
+
+class SharedSampleRingBuffer(SampleRingBuffer):
+    """
+    A `SampleRingBuffer` in a memory-mapped file, written by the process
+    running the sample collector and read by every other process (e.g. the
+    gunicorn workers, while the scheduler runs in the master).
+
+    The file has a fixed layout: a 64-byte header (magic, capacity, layout
+    checksum, sequence number, next index, sample count as 8-byte fields)
+    followed by the float64 timestamp array and one float64 array per metric.
+    Readers index the shared pages directly, without copying or
+    deserialising. Consistency is kept with a seqlock: the writer makes the
+    sequence number odd while it writes, and a reader retries when the number
+    was odd or changed during its read, so readers never block the writer.
+
+    Attributes:
+        path (str): The memory-mapped file.
+    """
+
+    MAGIC: bytes = b"PULSESB1"
+    HEADER_SIZE: int = 64
+    # Indices of the 8-byte header fields following the magic.
+    CAPACITY, LAYOUT, SEQUENCE, NEXT, COUNT = range(5)
+
+    def __init__(
+        self,
+        path: str,
+        capacity: int,
+        metrics: Iterable[str] = ROLLUP_METRICS,
+        writable: bool = False,
+    ) -> None:
+        self.path = path
+        self.capacity = capacity
+        self.metrics = tuple(metrics)
+        self.writable = writable
+        self._lock = threading.Lock()
+        self._mmap: Optional[mmap.mmap] = None
+        self._inode: Optional[int] = None
+        self._header: Any = None
+        self._timestamps: Any = None
+        self._values: Dict[str, Any] = {}
+        if writable:
+            self._create()
+        self._attach()
+
+    @property
+    def size(self) -> int:
+        """
+        Returns:
+            int: The file size in bytes.
+        """
+        return self.HEADER_SIZE + 8 * self.capacity * (len(self.metrics) + 1)
+
+    @property
+    def layout(self) -> int:
+        """
+        Returns:
+            int: The checksum of the capacity and metrics, readers of another
+                layout ignore the file.
+        """
+        return zlib.crc32(f"{self.capacity}|{','.join(self.metrics)}".encode())
+
+    @property
+    def _next(self) -> int:
+        return self._header[self.NEXT] if self._header is not None else 0
+
+    @_next.setter
+    def _next(self, value: int) -> None:
+        self._header[self.NEXT] = value
+
+    @property
+    def _count(self) -> int:
+        return self._header[self.COUNT] if self._header is not None else 0
+
+    @_count.setter
+    def _count(self, value: int) -> None:
+        self._header[self.COUNT] = value
+
+    def append(self, sample: Dict[str, Any]) -> None:
+        """
+        Adds a sample, see `SampleRingBuffer.append()`.
+
+        Args:
+            sample (Dict[str, Any]): A sample returned by `read_resources()`.
+
+        Raises:
+            PermissionError: If the buffer was opened read-only.
+        """
+        if not self.writable:
+            raise PermissionError(f"{self.path} is opened read-only")
+        with self._lock:
+            self._header[self.SEQUENCE] += 1
+            try:
+                self._write(sample)
+            finally:
+                self._header[self.SEQUENCE] += 1
+
+    def close(self) -> None:
+        """
+        Unmaps the file.
+        """
+        self._detach()
+
+    def _read(self, read: Callable[[], T]) -> T:
+        if not self._attach():
+            return read()
+        while True:
+            sequence = self._header[self.SEQUENCE]
+            if sequence % 2:
+                os.sched_yield()
+                continue
+            try:
+                result = read()
+            except (ValueError, OverflowError, OSError):
+                if self._header[self.SEQUENCE] == sequence:
+                    raise
+                continue
+            if self._header[self.SEQUENCE] == sequence:
+                return result
+
+    def _create(self) -> None:
+        """
+        Creates the file, or reuses an existing one of the same layout so the
+        buffered samples survive a restart of the writer. A file of another
+        layout is replaced atomically, readers attach to the new one.
+        """
+        try:
+            with open(self.path, "rb") as file:
+                header = file.read(self.HEADER_SIZE)
+                if (
+                    os.fstat(file.fileno()).st_size == self.size
+                    and self._valid_header(header)
+                ):
+                    return
+        except FileNotFoundError:
+            pass
+
+        header = array("Q", [self.capacity, self.layout, 0, 0, 0])
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(self.MAGIC)
+            file.write(header.tobytes())
+            file.write(bytes(self.HEADER_SIZE - len(self.MAGIC) - 8 * len(header)))
+            file.write((array("d", [NAN]) * (self.capacity * (len(self.metrics) + 1))).tobytes())
+        os.replace(temp_path, self.path)
+        logger.info(f"SharedSampleRingBuffer created {self.path} ({self.size} bytes).")
+
+    def _valid_header(self, header: bytes) -> bool:
+        if len(header) < self.HEADER_SIZE or header[: len(self.MAGIC)] != self.MAGIC:
+            return False
+        fields = array("Q", header[len(self.MAGIC) : len(self.MAGIC) + 16])
+        return fields[self.CAPACITY] == self.capacity and fields[self.LAYOUT] == self.layout
+
+    def _attach(self) -> bool:
+        """
+        Maps the file, or maps it again when the writer replaced it.
+
+        Returns:
+            bool: True if a valid file is mapped.
+        """
+        try:
+            inode = os.stat(self.path).st_ino
+        except FileNotFoundError:
+            self._detach()
+            return False
+        if self._mmap is not None and inode == self._inode:
+            return True
+
+        self._detach()
+        with open(self.path, "r+b" if self.writable else "rb") as file:
+            if os.fstat(file.fileno()).st_size != self.size:
+                return False
+            mapping = mmap.mmap(
+                file.fileno(),
+                self.size,
+                access=mmap.ACCESS_WRITE if self.writable else mmap.ACCESS_READ,
+            )
+        if not self._valid_header(mapping[: self.HEADER_SIZE]):
+            mapping.close()
+            return False
+
+        view = memoryview(mapping)
+        magic_size = len(self.MAGIC)
+        self._header = view[magic_size : self.HEADER_SIZE].cast("Q")
+        arrays = view[self.HEADER_SIZE : self.size].cast("d")
+        self._timestamps = arrays[: self.capacity]
+        self._values = {
+            metric: arrays[(position + 1) * self.capacity : (position + 2) * self.capacity]
+            for position, metric in enumerate(self.metrics)
+        }
+        self._mmap, self._inode = mapping, inode
+        return True
+
+    def _detach(self) -> None:
+        if self._mmap is None:
+            return
+        for view in (self._timestamps, self._header, *self._values.values()):
+            view.release()
+        self._header, self._timestamps, self._values = None, None, {}
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+        self._mmap, self._inode = None, None
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+sample_buffer: Optional[SampleRingBuffer] = None
+_sample_buffer_lock = threading.Lock()
+
+
+def get_sample_buffer(writable: bool = False) -> SampleRingBuffer:
+    """
+    Returns the process-wide buffer of recent samples, creating it with
+    `SAMPLE_BUFFER_SIZE` samples on first use. Must be called within an
+    application context.
+
+    With `SAMPLE_STORE_PATH` set, the buffer lives in that memory-mapped file
+    and is shared by all processes: the collector opens it writable, the
+    other processes (gunicorn workers) read the same pages. Without it, the
+    buffer is private to the process.
+
+    Args:
+        writable (bool): Whether the caller appends samples.
+
+    Returns:
+        SampleRingBuffer: The shared buffer, filled by the sample collector.
+    """
+    global sample_buffer
+
+    with _sample_buffer_lock:
+        if sample_buffer is None or (writable and not sample_buffer.writable):
+            capacity: int = current_app.config.get(
+                "SAMPLE_BUFFER_SIZE", DEFAULT_SAMPLE_BUFFER_SIZE
+            )
+            path: Optional[str] = current_app.config.get("SAMPLE_STORE_PATH")
+            if path:
+                if sample_buffer is not None:
+                    sample_buffer.close()
+                sample_buffer = SharedSampleRingBuffer(path, capacity, writable=writable)
+            else:
+                sample_buffer = SampleRingBuffer(capacity)
+        return sample_buffer
+
+
+def _reset_after_fork() -> None:
+    """
+    Replaces the locks in a forked child, they may have been held by another
+    thread of the parent at the time of the fork.
+    """
+    global _sample_buffer_lock
+
+    _sample_buffer_lock = threading.Lock()
+    if sample_buffer is not None:
+        sample_buffer._reset_lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
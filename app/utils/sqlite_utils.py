@@ -0,0 +1,152 @@
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Optional, Tuple
+from flask import current_app
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+from app.models import db
+from app.utils.logging import logger
+
+# Pragmas applied to every SQLite connection, see `SQLITE_PRAGMAS` in config.py.
+DEFAULT_SQLITE_PRAGMAS: Dict[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,
+    "cache_size": -16000,
+    "mmap_size": 128 * 1024 * 1024,
+}
+DEFAULT_SQLITE_READ_POOL_SIZE: int = 8
+
+# Pragmas that change the database file rather than the connection, skipped
+# on read-only connections.
+DATABASE_PRAGMAS: Tuple[str, ...] = ("journal_mode",)
+
+# The read-only engine with the process id and database URL it was created for.
+_read_engine: Optional[Tuple[Tuple[int, str], Optional[Engine]]] = None
+_read_engine_lock = threading.Lock()
+
+
+def apply_pragmas(
+    dbapi_connection: sqlite3.Connection,
+    pragmas: Dict[str, Any],
+    read_only: bool = False,
+) -> None:
+    """
+    Applies pragmas to a new SQLite connection.
+
+    Args:
+        dbapi_connection (sqlite3.Connection): The connection.
+        pragmas (Dict[str, Any]): Pragma names and values.
+        read_only (bool): Whether the connection is read-only, which skips the
+            `DATABASE_PRAGMAS` and sets `query_only`.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            if read_only and name in DATABASE_PRAGMAS:
+                continue
+            cursor.execute(f"PRAGMA {name}={value}")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+    finally:
+        cursor.close()
+
+
+def configure_sqlite_engine(engine: Engine, pragmas: Dict[str, Any]) -> bool:
+    """
+    Applies the pragmas to every connection the engine opens.
+
+    With `journal_mode=WAL` readers no longer block the writer and vice versa,
+    `synchronous=NORMAL` only syncs the WAL at checkpoints, `busy_timeout`
+    makes a connection wait for a lock instead of failing with "database is
+    locked", and `cache_size`/`mmap_size` keep hot pages in memory.
+
+    Args:
+        engine (Engine): The engine, ignored unless it is SQLite.
+        pragmas (Dict[str, Any]): Pragma names and values.
+
+    Returns:
+        bool: True if the engine was configured.
+    """
+    if engine.dialect.name != "sqlite":
+        return False
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        apply_pragmas(dbapi_connection, pragmas)
+
+    return True
+
+
+def create_read_engine(
+    engine: Engine, pragmas: Dict[str, Any], pool_size: int
+) -> Optional[Engine]:
+    """
+    Creates a pool of read-only connections to the database file of an engine.
+    The connections are opened with `mode=ro` and `query_only`, so readers can
+    never take the write lock.
+
+    Args:
+        engine (Engine): The read-write engine.
+        pragmas (Dict[str, Any]): Pragma names and values.
+        pool_size (int): Number of pooled connections.
+
+    Returns:
+        Optional[Engine]: The read-only engine, None if the engine isn't backed
+            by a SQLite file (e.g. an in-memory database).
+    """
+    path: Optional[str] = engine.url.database
+    if engine.dialect.name != "sqlite" or not path or path == ":memory:":
+        return None
+    uri: str = f"file:{os.path.abspath(path)}?mode=ro"
+
+    def connect() -> sqlite3.Connection:
+        return sqlite3.connect(uri, uri=True, check_same_thread=False)
+
+    read_engine: Engine = create_engine(
+        "sqlite://",
+        creator=connect,
+        poolclass=QueuePool,
+        pool_size=pool_size,
+        max_overflow=pool_size,
+    )
+
+    @event.listens_for(read_engine, "connect")
+    def set_read_only_pragmas(dbapi_connection, connection_record) -> None:
+        apply_pragmas(dbapi_connection, pragmas, read_only=True)
+
+    return read_engine
+
+
+def get_read_engine() -> Optional[Engine]:
+    """
+    Returns the read-only engine of this process, creating it on first use.
+    The engine is never shared with forked processes (gunicorn workers).
+    Must be called within an application context.
+
+    Returns:
+        Optional[Engine]: The read-only engine, None if disabled with
+            `SQLITE_READ_POOL_SIZE = 0` or not available for the database.
+    """
+    global _read_engine
+
+    pool_size: int = current_app.config.get(
+        "SQLITE_READ_POOL_SIZE", DEFAULT_SQLITE_READ_POOL_SIZE
+    )
+    if not pool_size:
+        return None
+
+    key: Tuple[int, str] = (os.getpid(), str(db.engine.url))
+    with _read_engine_lock:
+        if _read_engine is None or _read_engine[0] != key:
+            read_engine = create_read_engine(
+                db.engine,
+                current_app.config.get("SQLITE_PRAGMAS", DEFAULT_SQLITE_PRAGMAS),
+                pool_size,
+            )
+            if read_engine is not None:
+                logger.info(f"get_read_engine() created a pool of {pool_size} read-only connections.")
+            _read_engine = (key, read_engine)
+        return _read_engine[1]
@@ -1,9 +1,79 @@
 import psutil
 from datetime import datetime, timedelta
-from typing import List, Tuple, Union
-from app.models import db, Monitor, Settings
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple, Union
+from sqlalchemy import delete, insert, select
+from app.models import db, Monitor, MetricSample, Settings
 from app import app
 from app.utils.logging import logger
+from app.utils.resource_sampler import sampler
+from app.utils.metric_collectors import collect_metrics
+from app.utils.outbox_utils import enqueue_alert
+from app.utils.rules_engine import rules_engine
+from app.utils.sample_buffer import get_sample_buffer
+from app.utils.live_stream import publish_alert_states
+
+DEFAULT_DATA_RETENTION_HRS: float = 24
+RETENTION_DELETE_CHUNK_SIZE: int = 5000
+
+
+def read_resources() -> Dict[str, Any]:
+    """
+    Reads the current system resource usage without touching the database.
+    Must be called within an application context.
+
+    CPU utilisation and network rates are computed by the long-lived
+    `ResourceSampler` from counter deltas since the previous sample, without
+    sleeping.
+
+    Returns:
+        Dict[str, Any]: A sample with the `Monitor` column names as keys:
+            timestamp, cpu, cpu_iowait, cpu_steal, ram, disk, net_sent,
+            net_recv (MB since boot), net_sent_rate, net_recv_rate (bytes/s),
+            net_packets_sent_rate, net_packets_recv_rate (packets/s) and
+            cpu_temp (None if unavailable), plus cpu_per_core, net_per_nic and
+            metrics (the `MetricSample` rows of the registered metric collectors).
+    """
+    cpu_sample: Dict[str, Any] = sampler.sample_cpu()
+    ram: float = psutil.virtual_memory().percent
+    disk: float = psutil.disk_usage("/").percent
+    temperature = psutil.sensors_temperatures()
+
+    cpu_temp: Optional[float] = None
+    if "coretemp" in temperature:
+        cpu_temp_data = temperature["coretemp"]
+        if cpu_temp_data:
+            cpu_temp = cpu_temp_data[0].current
+
+    sample: Dict[str, Any] = {
+        "timestamp": datetime.now(),
+        **cpu_sample,
+        "ram": ram,
+        "disk": disk,
+        **sampler.sample_network(),
+        "cpu_temp": cpu_temp,
+    }
+    sample["metrics"] = collect_metrics(sample["timestamp"], sample)
+    return sample
+
+
+def check_alerts(sample: Dict[str, Any]) -> None:
+    """
+    Feeds the sample to the alert rules engine and enqueues an alert for every
+    rule that fired or resolved (by default the CPU temperature limit from
+    `Settings.cpu_alert_temp`, see `app.utils.rules_engine`). The alerts are
+    delivered by the `dispatch_alerts()` job, so sampling never waits for
+    SMTP/Telegram. The firing rules are published to the /api/stream clients.
+
+    Args:
+        sample (Dict[str, Any]): A sample returned by `read_resources()`.
+    """
+    for transition in rules_engine.evaluate(sample):
+        logger.warning(
+            f"check_alerts() {transition.subject()} current {transition.rule.metric} = {transition.value}"
+        )
+        enqueue_alert(transition.subject(), transition.content())
+    publish_alert_states(rules_engine.firing())
 
 
 def check_resources() -> Tuple[float, float, float, float, float, Union[float, str]]:
@@ -11,6 +81,9 @@ def check_resources() -> Tuple[float, float, float, float, float, Union[float, s
     Checks the current system resource usage, stores it in the database,
     removes outdated records, and sends alerts if necessary.
 
+    Used by the scheduler when the high-frequency collector is disabled
+    (`COLLECTOR_INTERVAL_S = 0`), see `app.utils.collector`.
+
     Returns:
         Tuple containing:
         - CPU usage percentage (float)
@@ -21,103 +94,167 @@ def check_resources() -> Tuple[float, float, float, float, float, Union[float, s
         - CPU temperature (float or 'Brak danych' if unavailable)
     """
     with app.app_context():
-        cpu: float = psutil.cpu_percent()
-        ram: float = psutil.virtual_memory().percent
-        disk: float = psutil.disk_usage("/").percent
-        net = psutil.net_io_counters()
-        net_sent: float = net.bytes_sent / (1024 * 1024)
-        net_recv: float = net.bytes_recv / (1024 * 1024)
-        temperature = psutil.sensors_temperatures()
-
-        cpu_temp: Union[float, str] = "Brak danych"
-        if "coretemp" in temperature:
-            cpu_temp_data = temperature["coretemp"]
-            if cpu_temp_data:
-                cpu_temp = cpu_temp_data[0].current
-
-        timestamp: datetime = datetime.now()
-        data: List[Union[datetime, float, str]] = [
-            timestamp,
-            cpu,
-            ram,
-            disk,
-            net_sent,
-            net_recv,
-            cpu_temp,
-        ]
+        sample: Dict[str, Any] = read_resources()
+        get_sample_buffer(writable=True).append(sample)
 
-        write_to_db(data)
+        write_samples_to_db([sample])
         remove_old_data()
 
         logger.info("check_resources() loop completed.")
 
-        settings = Settings.query.first()
-        
-        if isinstance(cpu_temp, float) and cpu_temp >= settings.cpu_alert_temp:
-            now = datetime.now()
-            formatted_now = now.strftime("%Y-%m-%d %H:%M:%S")
-            logger.warning(f"check_resources() current cpu_temp = {cpu_temp}")
-            alert_subject = "CPU Temperature Alert."
-            alert_content = f"PulseSystemMonitoringStation\nhttps://pulse.ropeaccess.pro\n\nCPU temparature Alert.\n{formatted_now}\n\nCurrent cpu_temp = {cpu_temp}\nLimit = {settings.cpu_alert_temp}"
-            sent_user_alert(alert_subject, alert_content)
+        check_alerts(sample)
 
-        return cpu, ram, disk, net_sent, net_recv, cpu_temp
+        cpu_temp: Union[float, str] = (
+            sample["cpu_temp"] if sample["cpu_temp"] is not None else "Brak danych"
+        )
+        return (
+            sample["cpu"],
+            sample["ram"],
+            sample["disk"],
+            sample["net_sent"],
+            sample["net_recv"],
+            cpu_temp,
+        )
 
 
-def sent_user_alert(title: str, msg: str) -> None:
+def sent_user_alert(title: str, msg: str) -> bool:
     """
     Sends a system alert to all configured users via Telegram and email.
 
+    Every Telegram message and the batch of alert emails (sent over one SMTP
+    connection) run concurrently on a bounded pool with an overall deadline
+    (`ALERT_DEADLINE_S`), so one slow SMTP server or chat doesn't delay the
+    others. The receivers and settings are loaded once for both channels, and
+    the users' alert bookkeeping happens afterwards in the calling thread, in
+    one bulk update per channel and a single commit.
+
     Args:
         title (str): The alert title for email.
         msg (str): The alert message content.
+
+    Returns:
+        bool: True if no send failed (also when no receiver was due).
     """
-    from app.utils.telegram_utils import filter_users_and_send_alert_telegram
-    from app.utils.email_utils import filter_users_and_send_alert_email
+    from app.utils.alert_utils import load_alert_receivers, send_concurrently
+    from app.utils.telegram_utils import (
+        prepare_alert_telegram,
+        record_alert_telegram_results,
+    )
+    from app.utils.email_utils import (
+        prepare_alert_email,
+        send_alert_email,
+        record_alert_email_results,
+    )
 
-    filter_users_and_send_alert_telegram(msg)
-    filter_users_and_send_alert_email(title, msg)
+    receivers, alerts_frequency_hrs = load_alert_receivers()
+    telegram_tasks = prepare_alert_telegram(msg, receivers, alerts_frequency_hrs)
+    email_receivers = prepare_alert_email(title, msg, receivers, alerts_frequency_hrs)
 
+    tasks = {("telegram", user): task for user, task in telegram_tasks.items()}
+    if email_receivers:
+        tasks["email"] = partial(send_alert_email, email_receivers, title, msg)
+    results = send_concurrently(tasks)
 
-def write_to_db(data: List[Union[datetime, float, str]]) -> None:
+    telegram_results = {user: results[("telegram", user)] for user in telegram_tasks}
+    email_results = results.get("email") or {}
+    email_results = {user: email_results.get(user, False) for user in email_receivers}
+
+    record_alert_telegram_results(telegram_results, msg)
+    record_alert_email_results(email_results, title, msg)
+    db.session.commit()
+    return all(telegram_results.values()) and all(email_results.values())
+
+
+def write_samples_to_db(samples: List[Dict[str, Any]]) -> None:
     """
-    Writes a new resource monitoring record to the database.
+    Writes a batch of resource monitoring samples, together with the metric
+    collector values attached to them, to the database in a single transaction,
+    so the commit (and SQLite fsync) cost is paid once per batch.
 
     Args:
-        data (List): A list containing:
-            - timestamp (datetime)
-            - CPU usage percentage (float)
-            - RAM usage percentage (float)
-            - Disk usage percentage (float)
-            - Network sent (MB) (float)
-            - Network received (MB) (float)
-            - CPU temperature (float or str)
+        samples (List[Dict[str, Any]]): Samples returned by `read_resources()`.
     """
-    timestamp, cpu, ram, disk, net_sent, net_recv, cpu_temp = data
-
-    record = Monitor(
-        timestamp=timestamp,
-        cpu=cpu,
-        ram=ram,
-        disk=disk,
-        net_sent=net_sent,
-        net_recv=net_recv,
-        cpu_temp=cpu_temp,
-    )
+    if not samples:
+        return
 
-    db.session.add(record)
+    columns = Monitor.__table__.columns.keys()
+    db.session.execute(
+        insert(Monitor),
+        [
+            {key: value for key, value in sample.items() if key in columns}
+            for sample in samples
+        ],
+    )
+    metric_rows: List[Dict[str, Any]] = [
+        row for sample in samples for row in sample.get("metrics", ())
+    ]
+    if metric_rows:
+        db.session.execute(insert(MetricSample), metric_rows)
     db.session.commit()
 
-    logger.info("write_to_db() New data written to database")
+    logger.info(
+        f"write_samples_to_db() {len(samples)} samples written to database"
+        + (f" with {len(metric_rows)} metric values" if metric_rows else "")
+    )
 
 
-def remove_old_data() -> None:
+def _delete_older_than(model: Any, cutoff_time: datetime) -> int:
     """
-    Removes monitoring records older than 24 hours from the database.
+    Removes the records of a timestamped model older than the cutoff time with
+    set-based DELETE statements in chunks of `RETENTION_DELETE_CHUNK_SIZE` rows,
+    committing after every chunk.
+
+    Args:
+        model (Any): The model class, with `id` and `timestamp` columns.
+        cutoff_time (datetime): Records recorded before this time are removed.
+
+    Returns:
+        int: The number of removed records.
     """
-    cutoff_time: datetime = datetime.now() - timedelta(hours=24)
-    records_to_remove = Monitor.query.filter(Monitor.timestamp < cutoff_time).all()
-    for record in records_to_remove:
-        db.session.delete(record)
-    db.session.commit()
-    logger.info("remove_old_data() Data older than 24 hours removed from database.")
+    removed: int = 0
+    while True:
+        expired_ids = (
+            select(model.id)
+            .where(model.timestamp < cutoff_time)
+            .limit(RETENTION_DELETE_CHUNK_SIZE)
+            .scalar_subquery()
+        )
+        result = db.session.execute(
+            delete(model)
+            .where(model.id.in_(expired_ids))
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        removed += result.rowcount
+        if result.rowcount < RETENTION_DELETE_CHUNK_SIZE:
+            return removed
+
+
+def remove_old_data() -> int:
+    """
+    Removes monitoring records and metric samples older than the configured
+    retention window.
+
+    The retention window is read from `Settings.data_retention_hrs` (24 hours if
+    no settings exist). Records are removed with set-based DELETE statements in
+    chunks of `RETENTION_DELETE_CHUNK_SIZE` rows, without loading them into the
+    session, so a large backlog doesn't hold the write lock for long.
+
+    Returns:
+        int: The number of removed records and metric samples.
+    """
+    settings = Settings.query.first()
+    retention_hrs: float = (
+        settings.data_retention_hrs
+        if settings and settings.data_retention_hrs
+        else DEFAULT_DATA_RETENTION_HRS
+    )
+    cutoff_time: datetime = datetime.now() - timedelta(hours=retention_hrs)
+
+    removed: int = _delete_older_than(Monitor, cutoff_time)
+    removed_metrics: int = _delete_older_than(MetricSample, cutoff_time)
+
+    logger.info(
+        f"remove_old_data() {removed} records and {removed_metrics} metric samples older than {retention_hrs} hours removed from database."
+    )
+    return removed + removed_metrics
@@ -1,37 +1,181 @@
 import os
+import atexit
 import asyncio
+import threading
 from flask.cli import load_dotenv
 import time
-from datetime import datetime, timedelta
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Optional
 from telegram import Bot as TelegramBot
+from telegram.request import HTTPXRequest
 from flask import current_app
-from app.models import User, Settings
+from app.models import db, User, Settings
 from app.utils.logging import logger
 from app.utils.email_utils import send_admin_email
 from app.utils.exception_handler import exception_handler
 from app.utils.retry_connection import retry_connection
+from app.utils.alert_utils import is_alert_due, mark_alerts_sent, send_concurrently
 
 load_dotenv()
 
+# Pooled HTTP connections of the long-lived bot, also the number of concurrent sends.
+TELEGRAM_CONNECTION_POOL_SIZE: int = 8
+# Maximum time in seconds a caller waits for a message (or a whole send_many batch).
+TELEGRAM_SEND_TIMEOUT_S: float = 30
+
 
 @exception_handler(default_return=False)
 @retry_connection()
 def init_telegram_bot() -> TelegramBot:
     """
-    Initializes and returns a Telegram bot instance.
+    Initializes and returns a Telegram bot instance with a pooled HTTP client.
 
     Returns:
         TelegramBot: An instance of the Telegram bot.
     """
     TELEGRAM_API_SECRET = os.environ["TELEGRAM_API_SECRET"]
-    return TelegramBot(token=TELEGRAM_API_SECRET)
+    return TelegramBot(
+        token=TELEGRAM_API_SECRET,
+        request=HTTPXRequest(connection_pool_size=TELEGRAM_CONNECTION_POOL_SIZE),
+    )
+
+
+class TelegramClient:
+    """
+    Long-lived Telegram client. A single bot, with its pooled HTTP connections,
+    lives on a persistent event loop running in a background thread, so messages
+    are sent without creating a bot, an HTTP client and an event loop per message.
+
+    Attributes:
+        bot (TelegramBot): The bot used for every message.
+    """
+
+    def __init__(self, bot: TelegramBot) -> None:
+        self.bot = bot
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="TelegramClient", daemon=True
+        )
+        self._thread.start()
+        self._semaphore: asyncio.Semaphore = self._run(self._create_semaphore())
+
+    @staticmethod
+    async def _create_semaphore() -> asyncio.Semaphore:
+        """
+        Creates the semaphore limiting concurrent sends on the client loop.
+
+        Returns:
+            asyncio.Semaphore: A semaphore sized to the connection pool.
+        """
+        return asyncio.Semaphore(TELEGRAM_CONNECTION_POOL_SIZE)
+
+    def _run(self, coroutine, timeout: float = TELEGRAM_SEND_TIMEOUT_S):
+        """
+        Runs a coroutine on the client loop and waits for its result.
+
+        Args:
+            coroutine: The coroutine to run.
+            timeout (float): Maximum time in seconds to wait.
+
+        Returns:
+            Any: The coroutine result.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result(timeout)
+
+    async def _send(self, chat_id: str, msg: str) -> None:
+        """
+        Sends one message, waiting for a free pooled connection.
+
+        Args:
+            chat_id (str): The Telegram chat ID.
+            msg (str): The message content.
+        """
+        async with self._semaphore:
+            await self.bot.send_message(chat_id=chat_id, text=msg)
+
+    def send(self, chat_id: str, msg: str) -> None:
+        """
+        Sends a message to a specific Telegram chat.
+
+        Args:
+            chat_id (str): The Telegram chat ID.
+            msg (str): The message content.
+
+        Raises:
+            Exception: Any error raised by the Telegram API.
+        """
+        self._run(self._send(chat_id, msg))
+
+    def send_many(self, chat_ids: Iterable[str], msg: str) -> Dict[str, bool]:
+        """
+        Sends the same message to many chats concurrently over the pooled connections.
+
+        Args:
+            chat_ids (Iterable[str]): The Telegram chat IDs.
+            msg (str): The message content.
+
+        Returns:
+            Dict[str, bool]: Whether the message was sent, for every chat ID.
+        """
+        chat_ids = list(chat_ids)
+
+        async def send_all():
+            return await asyncio.gather(
+                *(self._send(chat_id, msg) for chat_id in chat_ids),
+                return_exceptions=True,
+            )
+
+        results = self._run(send_all())
+        for chat_id, result in zip(chat_ids, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Telegram {chat_id} send failed: {result}")
+        return {
+            chat_id: not isinstance(result, BaseException)
+            for chat_id, result in zip(chat_ids, results)
+        }
+
+    def close(self) -> None:
+        """
+        Closes the bot's HTTP connections and stops the client loop. Safe to call
+        more than once.
+        """
+        if not self._loop.is_running():
+            return
+        try:
+            self._run(self.bot.request.shutdown(), timeout=5)
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+
+
+_telegram_client: Optional[TelegramClient] = None
+_telegram_client_lock = threading.Lock()
+
+
+def get_telegram_client() -> Optional[TelegramClient]:
+    """
+    Returns the process-wide Telegram client, creating it on first use.
+
+    Returns:
+        Optional[TelegramClient]: The client, or None if the bot cannot be initialized.
+    """
+    global _telegram_client
+
+    with _telegram_client_lock:
+        if _telegram_client is None:
+            telegram_bot = init_telegram_bot()
+            if not telegram_bot:
+                return None
+            _telegram_client = TelegramClient(telegram_bot)
+            atexit.register(_telegram_client.close)
+        return _telegram_client
 
 
 @exception_handler(default_return=False)
 @retry_connection()
 def send_telegram(chat_id: str, msg: str) -> bool:
     """
-    Sends a message to a specific Telegram chat.
+    Sends a message to a specific Telegram chat using the long-lived client.
 
     Args:
         chat_id (str): The Telegram chat ID where the message should be sent.
@@ -40,10 +184,10 @@ def send_telegram(chat_id: str, msg: str) -> bool:
     Returns:
         bool: True if the message was sent successfully.
     """
-    telegram_bot = init_telegram_bot()
+    telegram_client = get_telegram_client()
 
-    if telegram_bot:
-        asyncio.run(telegram_bot.send_message(chat_id=chat_id, text=msg))
+    if telegram_client:
+        telegram_client.send(chat_id, msg)
 
         logger.info(f"Telegram {chat_id}\n{msg}\nsent succesfully.")
         return True
@@ -51,42 +195,108 @@ def send_telegram(chat_id: str, msg: str) -> bool:
     return False
 
 
-@exception_handler()
-def filter_users_and_send_alert_telegram(msg: str) -> None:
+@exception_handler(default_return={})
+def send_telegram_many(chat_ids: Iterable[str], msg: str) -> Dict[str, bool]:
     """
-    Sends a trade-related notification to all users with Telegram notifications enabled.
+    Sends the same message to many Telegram chats concurrently, sharing the
+    pooled connections of the long-lived client.
+
+    Args:
+        chat_ids (Iterable[str]): The Telegram chat IDs.
+        msg (str): The message content.
+
+    Returns:
+        Dict[str, bool]: Whether the message was sent, for every chat ID.
+    """
+    chat_ids = list(chat_ids)
+    telegram_client = get_telegram_client()
+    if not telegram_client:
+        return {chat_id: False for chat_id in chat_ids}
+
+    results: Dict[str, bool] = telegram_client.send_many(chat_ids, msg)
+    sent: int = sum(results.values())
+    logger.info(f"Telegram\n{msg}\nsent succesfully to {sent}/{len(chat_ids)} chats.")
+    return results
+
+
+def prepare_alert_telegram(
+    msg: str,
+    receivers: Optional[List[User]] = None,
+    alerts_frequency_hrs: Optional[float] = None,
+) -> Dict[User, Callable[[], bool]]:
+    """
+    Prepares the alert messages for all users with Telegram alerts enabled whose
+    last Telegram alert is older than `Settings.alerts_frequency_hrs`.
 
     Args:
         msg (str): The message content to be sent.
+        receivers (Optional[List[User]]): Preloaded alert receivers of any
+            channel (see `load_alert_receivers()`), queried if not given.
+        alerts_frequency_hrs (Optional[float]): Preloaded alert frequency,
+            queried if not given.
 
-    Raises:
-        Logs an error if the message fails to send.
+    Returns:
+        Dict[User, Callable[[], bool]]: One send callable per receiver, see `send_concurrently()`.
     """
-    with current_app.app_context():
+    if receivers is None:
         telegram_alerts_receivers = User.query.filter_by(
             telegram_alerts_receiver=True
         ).all()
-        
+    else:
+        telegram_alerts_receivers = [
+            user for user in receivers if user.telegram_alerts_receiver
+        ]
+
+    if alerts_frequency_hrs is None:
         settings = Settings.query.first()
         alerts_frequency_hrs = settings.alerts_frequency_hrs
 
-        for user in telegram_alerts_receivers:
-            if (
-                user.last_alert_time is None
-                or datetime.now() - user.last_alert_time >= timedelta(hours=alerts_frequency_hrs)
-            ):
-                success = send_telegram(chat_id=user.telegram_chat_id, msg=msg)
-                if success:
-                    user.update_last_alert_time()
-                else:
-                    logger.error(
-                        f"Failed to send trade info telegram to {user.email}. {msg}"
-                    )
-                    send_admin_email(
-                        f"Error in filter_users_and_send_trade_telegrams",
-                        f"Failed to send trade info telegram to {user.email}",
-                    )
-            else:
-                logger.warning(
-                    f"Telegram alert not sent: Less than a {alerts_frequency_hrs} hour(s) since last alert."
-                )
+    tasks: Dict[User, Callable[[], bool]] = {}
+    for user in telegram_alerts_receivers:
+        if is_alert_due(user.last_telegram_alert_time, alerts_frequency_hrs):
+            tasks[user] = partial(send_telegram, chat_id=user.telegram_chat_id, msg=msg)
+        else:
+            logger.warning(
+                f"Telegram alert not sent: Less than a {alerts_frequency_hrs} hour(s) since last alert."
+            )
+    return tasks
+
+
+def record_alert_telegram_results(results: Dict[User, bool], msg: str) -> None:
+    """
+    Updates the last Telegram alert time of the users the alert was sent to
+    (in one statement, the caller commits) and reports the failed ones to the
+    admins.
+
+    Args:
+        results (Dict[User, bool]): Whether the message was sent, for every receiver.
+        msg (str): The message content.
+    """
+    mark_alerts_sent("telegram", [user for user, success in results.items() if success])
+    for user, success in results.items():
+        if not success:
+            logger.error(
+                f"Failed to send trade info telegram to {user.email}. {msg}"
+            )
+            send_admin_email(
+                f"Error in filter_users_and_send_trade_telegrams",
+                f"Failed to send trade info telegram to {user.email}",
+            )
+
+
+@exception_handler()
+def filter_users_and_send_alert_telegram(msg: str) -> None:
+    """
+    Sends a trade-related notification to all users with Telegram notifications
+    enabled, concurrently and within `ALERT_DEADLINE_S`.
+
+    Args:
+        msg (str): The message content to be sent.
+
+    Raises:
+        Logs an error if the message fails to send.
+    """
+    with current_app.app_context():
+        results = send_concurrently(prepare_alert_telegram(msg))
+        record_alert_telegram_results(results, msg)
+        db.session.commit()
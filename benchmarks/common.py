@@ -0,0 +1,89 @@
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, Tuple
+from contextlib import contextmanager
+
+for variable in (
+    "APP_SECRET_KEY",
+    "CSRF_SECRET_KEY",
+    "GMAIL_APP_PASSWORD",
+    "GMAIL_USERNAME",
+    "RECAPTCHA_PUBLIC_KEY",
+    "RECAPTCHA_PRIVATE_KEY",
+):
+    os.environ.setdefault(variable, "benchmark")
+
+from flask import Flask
+from sqlalchemy import insert
+from app.models import db, Monitor
+
+INSERT_CHUNK_SIZE: int = 50_000
+
+
+@contextmanager
+def benchmark_app() -> Iterator[Flask]:
+    """
+    Creates a throwaway Flask application backed by a temporary SQLite file,
+    so benchmarks never touch the real instance/pulse.db.
+
+    Yields:
+        Flask: The application, with an active application context and all tables created.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        bench_app: Flask = Flask(__name__)
+        bench_app.config["SQLALCHEMY_DATABASE_URI"] = (
+            f"sqlite:///{os.path.join(tmp_dir, 'benchmark.db')}"
+        )
+        bench_app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+        db.init_app(bench_app)
+
+        with bench_app.app_context():
+            db.create_all()
+            yield bench_app
+            db.session.remove()
+            db.engine.dispose()
+
+
+def populate_monitor(rows: int, start: datetime, step: timedelta) -> None:
+    """
+    Inserts `rows` synthetic Monitor records with Core bulk inserts.
+
+    Args:
+        rows (int): Number of records to insert.
+        start (datetime): Timestamp of the first record.
+        step (timedelta): Time between consecutive records.
+    """
+    for offset in range(0, rows, INSERT_CHUNK_SIZE):
+        db.session.execute(
+            insert(Monitor),
+            [
+                {
+                    "timestamp": start + step * i,
+                    "cpu": float(i % 100),
+                    "ram": 50.0,
+                    "disk": 30.0,
+                    "net_sent": 10.0,
+                    "net_recv": 20.0,
+                    "cpu_temp": 55.0,
+                }
+                for i in range(offset, min(offset + INSERT_CHUNK_SIZE, rows))
+            ],
+        )
+    db.session.commit()
+
+
+def timed(func: Callable[[], object]) -> Tuple[float, object]:
+    """
+    Runs `func` once and measures its wall-clock time.
+
+    Args:
+        func (Callable[[], object]): The function to run.
+
+    Returns:
+        Tuple[float, object]: Elapsed time in milliseconds and the function result.
+    """
+    started: float = time.perf_counter()
+    result = func()
+    return (time.perf_counter() - started) * 1000, result
@@ -0,0 +1,90 @@
+"""
+Compares the legacy per-row retention (load every expired Monitor object and
+delete it through the ORM) with the set-based, chunked `remove_old_data()`.
+
+Run from the repository root:
+    python -m benchmarks.retention_benchmark
+"""
+
+from datetime import datetime, timedelta
+from typing import List, Tuple
+from benchmarks.common import benchmark_app, populate_monitor, timed
+from app.models import db, Monitor, Settings
+from app.utils.system_monitor import remove_old_data
+
+EXPIRED_ROWS: int = 5_000
+LIVE_ROWS: List[int] = [10_000, 100_000, 500_000]
+BACKLOG_ROWS: List[int] = [1_000, 10_000, 100_000]
+
+
+def legacy_remove_old_data() -> None:
+    """
+    The previous implementation: one ORM object and one DELETE per expired record.
+    """
+    cutoff_time: datetime = datetime.now() - timedelta(hours=24)
+    records_to_remove = Monitor.query.filter(Monitor.timestamp < cutoff_time).all()
+    for record in records_to_remove:
+        db.session.delete(record)
+    db.session.commit()
+
+
+def run_case(live_rows: int, expired_rows: int, legacy: bool) -> float:
+    """
+    Populates a fresh database and measures a single retention run.
+
+    Args:
+        live_rows (int): Records inside the retention window.
+        expired_rows (int): Records older than the retention window.
+        legacy (bool): If True, measures the legacy implementation.
+
+    Returns:
+        float: Elapsed time in milliseconds.
+    """
+    with benchmark_app():
+        db.session.add(Settings(data_retention_hrs=24))
+        now: datetime = datetime.now()
+        populate_monitor(expired_rows, now - timedelta(days=30), timedelta(seconds=1))
+        populate_monitor(
+            live_rows,
+            now - timedelta(hours=23),
+            timedelta(hours=23) / max(live_rows, 1),
+        )
+        elapsed, _ = timed(legacy_remove_old_data if legacy else remove_old_data)
+        assert Monitor.query.count() == live_rows
+        return elapsed
+
+
+def main() -> None:
+    results: List[Tuple[str, int, int, float, float]] = []
+
+    for live_rows in LIVE_ROWS:
+        results.append(
+            (
+                "growing table",
+                live_rows,
+                EXPIRED_ROWS,
+                run_case(live_rows, EXPIRED_ROWS, legacy=True),
+                run_case(live_rows, EXPIRED_ROWS, legacy=False),
+            )
+        )
+
+    for expired_rows in BACKLOG_ROWS:
+        results.append(
+            (
+                "growing backlog",
+                LIVE_ROWS[0],
+                expired_rows,
+                run_case(LIVE_ROWS[0], expired_rows, legacy=True),
+                run_case(LIVE_ROWS[0], expired_rows, legacy=False),
+            )
+        )
+
+    print(f"{'scenario':<16} {'live':>8} {'expired':>8} {'legacy ms':>10} {'bulk ms':>10}")
+    for scenario, live_rows, expired_rows, legacy_ms, bulk_ms in results:
+        print(
+            f"{scenario:<16} {live_rows:>8} {expired_rows:>8} {legacy_ms:>10.1f} {bulk_ms:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
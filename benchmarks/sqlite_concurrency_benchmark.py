@@ -0,0 +1,206 @@
+"""
+Measures the latency of /api/data-style reads from several reader processes
+(the gunicorn workers) while a writer commits batches of samples and deletes
+expired ones (the collector and the retention job in the master), with the
+default rollback-journal SQLite and with the WAL pragmas and read-only pool of
+`app.utils.sqlite_utils`.
+
+Run from the repository root:
+    python -m benchmarks.sqlite_concurrency_benchmark
+"""
+
+import multiprocessing
+import statistics
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Tuple
+from sqlalchemy import create_engine, delete, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from benchmarks.common import benchmark_app, populate_monitor
+from app.models import db, Monitor
+from app.utils.sqlite_utils import (
+    DEFAULT_SQLITE_PRAGMAS,
+    configure_sqlite_engine,
+    create_read_engine,
+)
+
+LIVE_ROWS: int = 100_000
+READERS: int = 4
+DURATION_S: float = 5
+WRITE_BATCH_SIZE: int = 12
+WRITE_INTERVAL_S: float = 0.05
+READ_WINDOW: timedelta = timedelta(hours=1)
+
+
+def write_load(
+    engine: Engine, stop: threading.Event, latencies: List[float], stats: Dict[str, int]
+) -> None:
+    """
+    Commits batches of new samples and deletes as many expired ones until stopped.
+
+    Args:
+        engine (Engine): The read-write engine.
+        stop (threading.Event): Set when the benchmark is over.
+        latencies (List[float]): Receives the commit latencies in milliseconds.
+        stats (Dict[str, int]): Receives the number of lock errors.
+    """
+    timestamp: datetime = datetime.now()
+    while not stop.is_set():
+        rows = []
+        for _ in range(WRITE_BATCH_SIZE):
+            timestamp += timedelta(seconds=5)
+            rows.append(
+                {
+                    "timestamp": timestamp,
+                    "cpu": 50.0,
+                    "ram": 50.0,
+                    "disk": 30.0,
+                    "net_sent": 10.0,
+                    "net_recv": 20.0,
+                    "cpu_temp": 55.0,
+                }
+            )
+        started: float = time.perf_counter()
+        try:
+            with engine.begin() as connection:
+                connection.execute(insert(Monitor), rows)
+                oldest = select(Monitor.id).order_by(Monitor.id).limit(WRITE_BATCH_SIZE)
+                connection.execute(delete(Monitor).where(Monitor.id.in_(oldest)))
+            latencies.append((time.perf_counter() - started) * 1000)
+        except OperationalError:
+            stats["write_errors"] += 1
+        time.sleep(WRITE_INTERVAL_S)
+
+
+def read_load(url: str, tuned: bool, stop: Any, results: Any) -> None:
+    """
+    Reads the last hour of samples in a loop until stopped. Runs in a reader
+    process with its own engine, like a gunicorn worker.
+
+    Args:
+        url (str): The database URL.
+        tuned (bool): If True, reads through the read-only pool.
+        stop (multiprocessing.Event): Set when the benchmark is over.
+        results (multiprocessing.Queue): Receives the read latencies in
+            milliseconds and the number of lock errors.
+    """
+    engine: Engine = create_engine(url)
+    if tuned:
+        engine = create_read_engine(engine, DEFAULT_SQLITE_PRAGMAS, pool_size=1)
+    columns = (Monitor.timestamp, Monitor.cpu, Monitor.ram, Monitor.disk, Monitor.cpu_temp)
+    latencies: List[float] = []
+    errors: int = 0
+    while not stop.is_set():
+        started: float = time.perf_counter()
+        try:
+            with engine.connect() as connection:
+                connection.execute(
+                    select(*columns).where(Monitor.timestamp >= datetime.now() - READ_WINDOW)
+                ).all()
+            latencies.append((time.perf_counter() - started) * 1000)
+        except OperationalError:
+            errors += 1
+    engine.dispose()
+    results.put((latencies, errors))
+
+
+def run_case(tuned: bool) -> Tuple[List[float], List[float], Dict[str, int]]:
+    """
+    Populates a fresh database and runs the readers against the writer.
+
+    Args:
+        tuned (bool): If True, uses WAL, the pragmas and the read-only pool.
+
+    Returns:
+        Tuple[List[float], List[float], Dict[str, int]]: Read and commit
+            latencies in milliseconds, and the lock error counts.
+    """
+    with benchmark_app():
+        now: datetime = datetime.now()
+        populate_monitor(LIVE_ROWS, now - timedelta(hours=23), timedelta(hours=23) / LIVE_ROWS)
+        url: str = db.engine.url.render_as_string(hide_password=False)
+        db.session.remove()
+        db.engine.dispose()
+
+        write_engine: Engine = create_engine(url)
+        if tuned:
+            configure_sqlite_engine(write_engine, DEFAULT_SQLITE_PRAGMAS)
+            with write_engine.connect():
+                pass
+
+        context = multiprocessing.get_context("fork")
+        stop = context.Event()
+        results = context.Queue()
+        readers = [
+            context.Process(target=read_load, args=(url, tuned, stop, results))
+            for _ in range(READERS)
+        ]
+        for reader in readers:
+            reader.start()
+
+        writer_stop = threading.Event()
+        stats: Dict[str, int] = {"write_errors": 0, "read_errors": 0}
+        write_latencies: List[float] = []
+        writer = threading.Thread(
+            target=write_load, args=(write_engine, writer_stop, write_latencies, stats)
+        )
+        writer.start()
+        time.sleep(DURATION_S)
+        stop.set()
+        writer_stop.set()
+        writer.join()
+
+        latencies: List[float] = []
+        for _ in readers:
+            reader_latencies, errors = results.get()
+            latencies.extend(reader_latencies)
+            stats["read_errors"] += errors
+        for reader in readers:
+            reader.join()
+
+        write_engine.dispose()
+        return latencies, write_latencies, stats
+
+
+def percentiles(latencies: List[float]) -> Tuple[float, float, float]:
+    """
+    Args:
+        latencies (List[float]): Latencies in milliseconds.
+
+    Returns:
+        Tuple[float, float, float]: The median, 95th percentile and maximum.
+    """
+    if len(latencies) < 2:
+        return (latencies[0],) * 3 if latencies else (0.0, 0.0, 0.0)
+    return (
+        statistics.median(latencies),
+        statistics.quantiles(latencies, n=20)[18],
+        max(latencies),
+    )
+
+
+def main() -> None:
+    print(
+        f"{READERS} readers of the last hour of {LIVE_ROWS} samples for {DURATION_S} s, "
+        f"writer committing {WRITE_BATCH_SIZE} samples every {WRITE_INTERVAL_S * 1000:.0f} ms"
+    )
+    print(
+        f"{'mode':<8} {'reads':>6} {'read p50':>9} {'p95':>7} {'max':>7} "
+        f"{'commits':>8} {'commit p50':>11} {'p95':>7} {'max':>7} {'locked':>7}"
+    )
+    for mode, tuned in (("default", False), ("wal", True)):
+        read_latencies, write_latencies, stats = run_case(tuned)
+        read_p50, read_p95, read_max = percentiles(read_latencies)
+        write_p50, write_p95, write_max = percentiles(write_latencies)
+        print(
+            f"{mode:<8} {len(read_latencies):>6} {read_p50:>9.1f} {read_p95:>7.1f} {read_max:>7.1f} "
+            f"{len(write_latencies):>8} {write_p50:>11.1f} {write_p95:>7.1f} {write_max:>7.1f} "
+            f"{stats['read_errors'] + stats['write_errors']:>7}"
+        )
+    print("latencies in ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,32 @@
 from datetime import timedelta
 import os
+import tempfile
 from flask.cli import load_dotenv
 
 load_dotenv()
 
+# Directory of the files shared by the gunicorn master and workers (tmpfs if available)
+SHARED_STATE_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
 
 class Config:
     SQLALCHEMY_DATABASE_URI = "sqlite:///pulse.db"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # SQLite connection tuning (app.utils.sqlite_utils): WAL so the collector's
+    # writes don't block the readers, fsync only at WAL checkpoints, wait up to
+    # 5 s for a lock instead of failing, 16 MB page cache and 128 MB mmap per connection
+    SQLITE_PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "cache_size": -16000,
+        "mmap_size": 128 * 1024 * 1024,
+    }
+    # Read-only connections per process serving the API routes (0 = use the
+    # read-write session)
+    SQLITE_READ_POOL_SIZE = 8
+
     SECRET_KEY = os.environ["APP_SECRET_KEY"]
     WTF_CSRF_SECRET_KEY = os.environ["CSRF_SECRET_KEY"]
     SESSION_COOKIE_SECURE = True  # False if https ssl disabled
@@ -26,5 +44,69 @@ class Config:
     MAIL_PASSWORD = os.environ["GMAIL_APP_PASSWORD"]
     MAIL_DEFAULT_SENDER = os.environ["GMAIL_USERNAME"]
 
+    # High-frequency sampling: seconds between samples (0 = one check_resources
+    # job per minute), buffered samples per batch and max seconds between flushes
+    COLLECTOR_INTERVAL_S = 5
+    COLLECTOR_BATCH_SIZE = 12
+    COLLECTOR_FLUSH_S = 60
+
+    # Recent samples kept in memory for the dashboard and short /api/data ranges
+    # (720 samples = 1 hour at COLLECTOR_INTERVAL_S = 5)
+    SAMPLE_BUFFER_SIZE = 720
+
+    # Memory-mapped file sharing the recent samples of the collector (gunicorn
+    # master) with all workers; unset keeps a per-process buffer
+    SAMPLE_STORE_PATH = os.path.join(SHARED_STATE_DIR, "pulse_samples.bin")
+
+    # Live dashboard stream (/api/stream): seconds between checks for new
+    # samples, between keepalive comments and before a connection is recycled
+    # (the browser reconnects and resumes), milliseconds the browser waits
+    # before reconnecting, seconds between database polls when no shared sample
+    # buffer is available, and the file sharing the firing alert rules
+    STREAM_POLL_S = 1
+    STREAM_KEEPALIVE_S = 15
+    STREAM_MAX_S = 60 * 60
+    STREAM_RETRY_MS = 5000
+    STREAM_DB_POLL_S = 60
+    ALERT_STATE_PATH = os.path.join(SHARED_STATE_DIR, "pulse_alerts.json")
+
+    # Pluggable metric collectors: threads running them concurrently and seconds
+    # a sample waits for them (slower collectors are skipped for that sample)
+    METRIC_COLLECTOR_WORKERS = 4
+    METRIC_COLLECTOR_TIMEOUT_S = 2
+
+    # Alert delivery: concurrent sends across all channels and recipients, and
+    # seconds after which unfinished sends are reported as failed
+    ALERT_MAX_WORKERS = 8
+    ALERT_DEADLINE_S = 30
+
+    # Alert outbox: seconds between dispatcher runs, exponential retry backoff
+    # (first delay and cap in seconds) and attempts before an alert is given up
+    ALERT_DISPATCH_INTERVAL_S = 10
+    ALERT_RETRY_BASE_S = 30
+    ALERT_RETRY_MAX_S = 60 * 60
+    ALERT_MAX_ATTEMPTS = 10
+
+    # Alert rules: seconds between reloads of the rules (and the CPU temperature
+    # limit from Settings) by the rules engine
+    ALERT_RULES_RELOAD_S = 60
+
+    # Admin error emails: the first occurrence of an error is sent right away,
+    # repeats within this many seconds are sent as one digest with counts
+    ERROR_DIGEST_WINDOW_S = 15 * 60
+
+    # Database backups (instance/backup): compressed generations kept, pages
+    # copied per step of the online backup and seconds to pause between steps
+    BACKUP_GENERATIONS = 7
+    BACKUP_PAGES_PER_STEP = 1024
+    BACKUP_STEP_SLEEP_S = 0.01
+
+    # Rollup tiers of monitoring history: (bucket size in seconds, retention in hours)
+    ROLLUP_TIERS = [
+        (60, 7 * 24),
+        (15 * 60, 90 * 24),
+        (60 * 60, 2 * 365 * 24),
+    ]
+
     RECAPTCHA_PUBLIC_KEY = os.environ["RECAPTCHA_PUBLIC_KEY"]
     RECAPTCHA_PRIVATE_KEY = os.environ["RECAPTCHA_PRIVATE_KEY"]
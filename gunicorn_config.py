@@ -1,5 +1,9 @@
 bind = "0.0.0.0:8003"
 workers = 4
+# Threaded workers: every open dashboard holds a thread with its /api/stream
+# connection, so idle streams don't block the other requests
+worker_class = "gthread"
+threads = 32
 timeout = 256
 
 accesslog = "/home/pedro/PulseSystemMonitoringStation/gunicorn.log"
@@ -25,3 +29,24 @@ def when_ready(server):
 
     if os.getenv("SCHEDULER_ENABLED", "true") == "true":
         start_scheduler()
+
+
+def post_fork(server, worker):
+    """
+    Callback function for Gunicorn that is executed in a worker right after
+    it was forked from the master. Drops the database connections inherited
+    from the master (SQLite connections must not be shared across processes),
+    the worker opens its own on first use.
+
+    Args:
+        server (object): The Gunicorn server object.
+        worker (object): The Gunicorn worker object.
+
+    Returns:
+        None: No value is returned from this function.
+    """
+    from app import app
+    from app.models import db
+
+    with app.app_context():
+        db.engine.dispose(close=False)
@@ -0,0 +1,26 @@
+"""add monitor timestamp index
+
+Revision ID: 3b1c5e2a9d47
+Revises: f03083be7ddb
+Create Date: 2026-10-18 14:12:40.118302
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b1c5e2a9d47'
+down_revision = 'f03083be7ddb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('monitor', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_monitor_timestamp'), ['timestamp'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('monitor', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_monitor_timestamp'))
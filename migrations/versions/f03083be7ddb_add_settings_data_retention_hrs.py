@@ -0,0 +1,26 @@
+"""add settings data_retention_hrs
+
+Revision ID: f03083be7ddb
+Revises: 89d4999cf40a
+Create Date: 2026-10-18 14:09:18.904728
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f03083be7ddb'
+down_revision = '89d4999cf40a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('settings', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('data_retention_hrs', sa.Float(), nullable=False, server_default='24'))
+
+
+def downgrade():
+    with op.batch_alter_table('settings', schema=None) as batch_op:
+        batch_op.drop_column('data_retention_hrs')
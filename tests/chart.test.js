@@ -35,4 +35,16 @@ describe("ChartCreator", () => {
     expect(chartCreator.chart.data.datasets[0].data).toEqual(data);
     expect(chartCreator.chart.update).toHaveBeenCalledTimes(1);
   });
+
+  test("appendChart drops old points, appends new ones and calls chart.update", () => {
+    const chartCreator = new ChartCreator("myChart", "red", "someKey");
+    chartCreator.createChart();
+    chartCreator.updateChart(["2025-05-01", "2025-05-02"], [10, 20]);
+
+    chartCreator.appendChart(["2025-05-03"], [30], 1);
+
+    expect(chartCreator.chart.data.labels).toEqual(["2025-05-02", "2025-05-03"]);
+    expect(chartCreator.chart.data.datasets[0].data).toEqual([20, 30]);
+    expect(chartCreator.chart.update).toHaveBeenCalledTimes(2);
+  });
 });
@@ -15,5 +15,7 @@ def app():
         WTF_I18N_ENABLED=False,
         RECAPTCHA_PUBLIC_KEY="test",
         RECAPTCHA_PRIVATE_KEY="test",
+        SAMPLE_STORE_PATH=None,
+        ALERT_STATE_PATH=None,
     )
     return flask_app
@@ -1,4 +1,4 @@
-import fetchData from '../src/fetchData';
+import fetchData, { resetData } from '../src/fetchData';
 import ChartCreator from '../src/charts.js';
 
 jest.mock('../src/charts.js');
@@ -25,7 +25,9 @@ describe('fetchData', () => {
     ChartCreator.mockClear();
     ChartCreator.prototype.createChart = jest.fn();
     ChartCreator.prototype.updateChart = jest.fn();
+    ChartCreator.prototype.appendChart = jest.fn();
 
+    resetData();
     global.fetch = jest.fn();
   });
 
@@ -38,8 +40,8 @@ describe('fetchData', () => {
       cpu_usage: [10, 20],
       ram: [30, 40],
       disk: [50, 60],
-      net_sent: [70, 80],
-      net_recv: [90, 100],
+      net_sent_rate: [1024, 2048],
+      net_recv_rate: [null, 512],
       temperature: [60, 70],
       temperature_limit: 65,
     };
@@ -58,8 +60,8 @@ describe('fetchData', () => {
     expect(document.getElementById('cpuUsageValue').textContent).toBe('20.00%');
     expect(document.getElementById('ramUsageValue').textContent).toBe('40.00%');
     expect(document.getElementById('diskUsageValue').textContent).toBe('60.00%');
-    expect(document.getElementById('netSentValue').textContent).toBe('80.00 MB');
-    expect(document.getElementById('netRecvValue').textContent).toBe('100.00 MB');
+    expect(document.getElementById('netSentValue').textContent).toBe('2.00 KB/s');
+    expect(document.getElementById('netRecvValue').textContent).toBe('0.50 KB/s');
     expect(document.getElementById('temperatureValue').textContent).toBe('70°C');
     expect(document.getElementById('temperatureAverageValue').textContent).toBeCloseTo((65), 2); // average around 65
 
@@ -95,4 +97,47 @@ describe('fetchData', () => {
 
     consoleErrorSpy.mockRestore();
   });
+
+  test('dociąga tylko nowe dane przez kursor since', async () => {
+    const firstData = {
+      timestamps: [new Date(Date.now() - 60 * 1000).toISOString()],
+      cpu_usage: [10],
+      ram: [30],
+      disk: [50],
+      net_sent_rate: [70],
+      net_recv_rate: [90],
+      temperature: [60],
+      temperature_limit: 65,
+      cursor: 41,
+    };
+    const nextData = {
+      timestamps: [new Date().toISOString()],
+      cpu_usage: [20],
+      ram: [40],
+      disk: [60],
+      net_sent_rate: [80],
+      net_recv_rate: [100],
+      temperature: [70],
+      temperature_limit: 65,
+      cursor: 42,
+    };
+
+    fetch
+      .mockResolvedValueOnce({ json: () => Promise.resolve(firstData) })
+      .mockResolvedValueOnce({ json: () => Promise.resolve(nextData) });
+
+    await fetchData();
+    await fetchData();
+
+    expect(fetch).toHaveBeenNthCalledWith(1, '/api/data?points=1440');
+    expect(fetch).toHaveBeenNthCalledWith(2, '/api/data?since=41');
+
+    expect(ChartCreator).toHaveBeenCalledTimes(6);
+    expect(ChartCreator.prototype.createChart).toHaveBeenCalledTimes(6);
+    expect(ChartCreator.prototype.appendChart).toHaveBeenCalledTimes(6);
+    expect(ChartCreator.prototype.appendChart).toHaveBeenCalledWith(nextData.timestamps, [20], 0);
+
+    expect(document.getElementById('cpuUsageValue').textContent).toBe('20.00%');
+    expect(document.getElementById('cpuAverageValue').textContent).toBe('15.00%');
+  });
 });
@@ -0,0 +1,175 @@
+import threading
+import time
+import pytest
+from unittest.mock import patch, MagicMock
+from datetime import datetime, timedelta
+from flask import Flask, current_app
+from app.models import db, User, Settings
+from app.utils.alert_utils import (
+    is_alert_due,
+    load_alert_receivers,
+    mark_alerts_sent,
+    send_concurrently,
+)
+from app.utils.system_monitor import sent_user_alert
+
+
+@pytest.fixture
+def app_context(app):
+    with app.app_context():
+        yield
+
+
+@pytest.fixture
+def users_app():
+    users_app = Flask(__name__)
+    users_app.config.update(SQLALCHEMY_DATABASE_URI="sqlite://")
+    db.init_app(users_app)
+    with users_app.app_context():
+        db.create_all()
+        db.session.add(Settings(alerts_frequency_hrs=2))
+        for name, email_alerts, telegram_alerts in [
+            ("both", True, True),
+            ("email", True, False),
+            ("telegram", False, True),
+            ("none", False, False),
+        ]:
+            db.session.add(
+                User(
+                    username=name,
+                    email=f"{name}@example.com",
+                    password_hash="hash",
+                    email_alerts_receiver=email_alerts,
+                    telegram_alerts_receiver=telegram_alerts,
+                )
+            )
+        db.session.commit()
+        yield users_app
+        db.session.remove()
+
+
+def test_is_alert_due():
+    assert is_alert_due(None, 1)
+    assert is_alert_due(datetime.now() - timedelta(hours=2), 1)
+    assert not is_alert_due(datetime.now() - timedelta(minutes=30), 1)
+
+
+def test_load_alert_receivers(users_app):
+    receivers, alerts_frequency_hrs = load_alert_receivers()
+
+    assert sorted(user.username for user in receivers) == ["both", "email", "telegram"]
+    assert alerts_frequency_hrs == 2
+
+
+def test_mark_alerts_sent_per_channel(users_app):
+    receivers, _ = load_alert_receivers()
+    by_name = {user.username: user for user in receivers}
+    sent_at = datetime(2025, 5, 20, 12, 0)
+
+    mark_alerts_sent("email", [by_name["both"], by_name["email"]], sent_at)
+    mark_alerts_sent("telegram", [], sent_at)
+    db.session.commit()
+
+    both = db.session.get(User, by_name["both"].id)
+    assert both.last_email_alert_time == sent_at
+    assert both.last_alert_time == sent_at
+    assert both.last_telegram_alert_time is None
+    assert db.session.get(User, by_name["telegram"].id).last_alert_time is None
+
+
+def test_send_concurrently_runs_sends_in_parallel(app_context):
+    barrier = threading.Barrier(3, timeout=5)
+
+    def send():
+        barrier.wait()
+        return current_app.name is not None
+
+    results = send_concurrently({key: send for key in "abc"}, deadline_s=5, max_workers=3)
+
+    assert results == {"a": True, "b": True, "c": True}
+
+
+@patch("app.utils.alert_utils.logger")
+def test_send_concurrently_deadline(mock_logger, app_context):
+    release = threading.Event()
+
+    def slow_send():
+        release.wait(5)
+        return True
+
+    start = time.monotonic()
+    try:
+        results = send_concurrently(
+            {"fast": lambda: True, "slow": slow_send}, deadline_s=0.2, max_workers=2
+        )
+    finally:
+        release.set()
+
+    assert time.monotonic() - start < 2
+    assert results == {"fast": True, "slow": False}
+    mock_logger.error.assert_called_once_with(
+        "send_concurrently() alert to slow not sent within 0.2s."
+    )
+
+
+@patch("app.utils.alert_utils.logger")
+def test_send_concurrently_failure(mock_logger, app_context):
+    def failing_send():
+        raise ConnectionError("SMTP down")
+
+    results = send_concurrently({"ok": lambda: True, "failed": failing_send, "false": lambda: False})
+
+    assert results == {"ok": True, "failed": False, "false": False}
+    mock_logger.error.assert_called_once_with(
+        "send_concurrently() alert to failed failed: SMTP down"
+    )
+
+
+def test_send_concurrently_no_tasks():
+    assert send_concurrently({}) == {}
+
+
+@patch("app.utils.system_monitor.db")
+@patch("app.utils.alert_utils.load_alert_receivers")
+@patch("app.utils.email_utils.record_alert_email_results")
+@patch("app.utils.email_utils.send_alert_email")
+@patch("app.utils.email_utils.prepare_alert_email")
+@patch("app.utils.telegram_utils.record_alert_telegram_results")
+@patch("app.utils.telegram_utils.prepare_alert_telegram")
+def test_sent_user_alert_fans_out_across_channels(
+    mock_prepare_telegram,
+    mock_record_telegram,
+    mock_prepare_email,
+    mock_send_email,
+    mock_record_email,
+    mock_load_alert_receivers,
+    mock_db,
+    app_context,
+):
+    user1, user2 = MagicMock(), MagicMock()
+    mock_load_alert_receivers.return_value = ([user1, user2], 1)
+    barrier = threading.Barrier(3, timeout=5)
+
+    def send(result):
+        barrier.wait()
+        return result
+
+    mock_prepare_telegram.return_value = {
+        user1: lambda: send(True),
+        user2: lambda: send(True),
+    }
+    mock_prepare_email.return_value = [user1, user2]
+    mock_send_email.side_effect = lambda users, subject, body: send(
+        {user1: True, user2: False}
+    )
+
+    assert not sent_user_alert("Alert", "CPU too hot")
+
+    mock_prepare_telegram.assert_called_once_with("CPU too hot", [user1, user2], 1)
+    mock_prepare_email.assert_called_once_with("Alert", "CPU too hot", [user1, user2], 1)
+    mock_send_email.assert_called_once_with([user1, user2], "Alert", "CPU too hot")
+    mock_record_telegram.assert_called_once_with({user1: True, user2: True}, "CPU too hot")
+    mock_record_email.assert_called_once_with(
+        {user1: True, user2: False}, "Alert", "CPU too hot"
+    )
+    mock_db.session.commit.assert_called_once()
@@ -1,6 +1,9 @@
 import json
-from datetime import datetime
-from app.models import Monitor, Settings
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from app.models import Monitor, MetricSample, Settings
+from app.utils.sample_buffer import SampleRingBuffer
+from app.routes.api import stream_events
 from app import db
 
 
@@ -19,6 +22,8 @@ def test_get_data_success(client, app):
             disk=30.2,
             net_sent=10.0,
             net_recv=15.5,
+            net_sent_rate=2048.0,
+            net_recv_rate=4096.0,
             cpu_temp=65.0,
         )
         db.session.add(monitor_entry)
@@ -35,8 +40,12 @@ def test_get_data_success(client, app):
     assert data["disk"] == [30.2]
     assert data["net_sent"] == [10.0]
     assert data["net_recv"] == [15.5]
+    assert data["net_sent_rate"] == [2048.0]
+    assert data["net_recv_rate"] == [4096.0]
+    assert data["net_packets_sent_rate"] == [None]
     assert data["temperature"] == [65.0]
     assert data["temperature_limit"] == 80.0
+    assert data["cursor"] is not None
 
 
 def test_get_data_no_settings(client, app):
@@ -49,3 +58,216 @@ def test_get_data_no_settings(client, app):
     response = client.get("/api/data")
     assert response.status_code == 500
     assert b"error" in response.data
+
+
+@patch("app.routes.api.select_rollup_tier", return_value=None)
+def test_get_data_time_range_and_points(mock_select_rollup_tier, client, app):
+    with app.app_context():
+        db.session.query(Monitor).delete()
+        db.session.query(Settings).delete()
+
+        db.session.add(Settings(cpu_alert_temp=80.0))
+        for minute in range(10):
+            db.session.add(
+                Monitor(
+                    timestamp=datetime(2024, 1, 1, 12, minute),
+                    cpu=float(minute),
+                    ram=50.0,
+                    disk=30.0,
+                    net_sent=10.0,
+                    net_recv=15.0,
+                    cpu_temp=65.0,
+                )
+            )
+        db.session.commit()
+
+    response = client.get(
+        "/api/data?from=2024-01-01T12:02:00&to=2024-01-01T12:09:00&points=4"
+    )
+
+    assert response.status_code == 200
+    data = json.loads(response.data)
+
+    assert data["timestamps"] == [
+        "2024-01-01T12:02:00",
+        "2024-01-01T12:04:00",
+        "2024-01-01T12:06:00",
+        "2024-01-01T12:08:00",
+    ]
+    assert data["cpu_usage"] == [2.5, 4.5, 6.5, 8.5]
+
+
+def test_get_data_invalid_params(client):
+    response = client.get("/api/data?points=-1")
+    assert response.status_code == 400
+    assert b"error" in response.data
+
+    response = client.get("/api/data?from=yesterday")
+    assert response.status_code == 400
+
+
+def test_get_data_since_cursor(client, app):
+    with app.app_context():
+        db.session.query(Monitor).delete()
+        db.session.query(Settings).delete()
+
+        db.session.add(Settings(cpu_alert_temp=80.0))
+        records = [
+            Monitor(
+                timestamp=datetime(2024, 1, 1, 12, minute),
+                cpu=float(minute),
+                ram=50.0,
+                disk=30.0,
+                net_sent=10.0,
+                net_recv=15.0,
+                cpu_temp=65.0,
+            )
+            for minute in range(3)
+        ]
+        db.session.add_all(records)
+        db.session.commit()
+        first_id, last_id = records[0].id, records[-1].id
+
+    response = client.get(f"/api/data?since={first_id}")
+    data = json.loads(response.data)
+    assert data["cpu_usage"] == [1.0, 2.0]
+    assert data["cursor"] == "2024-01-01T12:02:00"
+
+    response = client.get(f"/api/data?since={last_id}")
+    data = json.loads(response.data)
+    assert data["timestamps"] == []
+    assert data["cursor"] == last_id
+
+    response = client.get("/api/data?since=2024-01-01T12:01:00")
+    data = json.loads(response.data)
+    assert data["cpu_usage"] == [2.0]
+    assert data["cursor"] == "2024-01-01T12:02:00"
+
+
+def buffered_samples(start, count):
+    sample_buffer = SampleRingBuffer(10)
+    for second in range(count):
+        sample_buffer.append(
+            {
+                "timestamp": start + timedelta(seconds=5 * second),
+                "cpu": float(second),
+                "ram": 50.0,
+                "disk": 30.0,
+                "net_sent_rate": 100.0 * second,
+                "cpu_temp": None,
+            }
+        )
+    return sample_buffer
+
+
+def test_get_data_from_sample_buffer(client, app):
+    with app.app_context():
+        db.session.query(Monitor).delete()
+        db.session.query(Settings).delete()
+        db.session.add(Settings(cpu_alert_temp=80.0))
+        db.session.commit()
+
+    start = datetime.now().replace(microsecond=0) - timedelta(minutes=1)
+    sample_buffer = buffered_samples(start, 4)
+    with patch("app.routes.api.get_sample_buffer", return_value=sample_buffer):
+        response = client.get(f"/api/data?from={(start + timedelta(seconds=5)).isoformat()}")
+        data = json.loads(response.data)
+
+        assert data["cpu_usage"] == [1.0, 2.0, 3.0]
+        assert data["temperature"] == [None, None, None]
+        assert data["net_sent_rate"] == [100.0, 200.0, 300.0]
+        assert data["cursor"] == (start + timedelta(seconds=15)).isoformat()
+
+        response = client.get(f"/api/data?since={data['cursor']}")
+        data = json.loads(response.data)
+        assert data["timestamps"] == []
+
+        response = client.get(f"/api/data?from={(start - timedelta(seconds=5)).isoformat()}")
+        assert json.loads(response.data)["timestamps"] == []
+
+
+def test_get_latest(client, app):
+    start = datetime(2025, 5, 20, 12, 0)
+    with patch("app.routes.api.get_sample_buffer", return_value=buffered_samples(start, 4)):
+        response = client.get("/api/latest?window=10")
+
+    data = json.loads(response.data)
+    assert data["timestamp"] == "2025-05-20T12:00:15"
+    assert data["cpu_usage"] == 3.0
+    assert data["temperature"] is None
+    assert data["averages"]["cpu_usage"] == 2.0
+    assert data["averages"]["temperature"] is None
+    assert data["window"] == 10
+
+    response = client.get("/api/latest?window=0")
+    assert response.status_code == 400
+
+
+def test_stream_events(client, app):
+    start = datetime(2025, 5, 20, 12, 0)
+    sample_buffer = buffered_samples(start, 2)
+    firing = [{"name": "CPU Temperature", "metric": "cpu_temp", "value": 90.0}]
+
+    def collect_sample(seconds):
+        sample_buffer.append({"timestamp": start + timedelta(seconds=10), "cpu": 7.0})
+
+    with app.app_context(), patch(
+        "app.routes.api.get_sample_buffer", return_value=sample_buffer
+    ), patch("app.routes.api.get_alert_states", side_effect=[[], [], firing]), patch(
+        "app.routes.api.time.sleep", side_effect=collect_sample
+    ):
+        events = stream_events(None)
+
+        assert next(events) == "retry: 5000\n\n"
+        assert next(events) == 'event: alerts\ndata: {"firing":[]}\n\n'
+
+        event = next(events)
+        assert event.startswith("event: samples\nid: 2025-05-20T12:00:10\n")
+        data = json.loads(event.split("data: ")[1])
+        assert data["timestamps"] == ["2025-05-20T12:00:10"]
+        assert data["cpu_usage"] == [7.0]
+        assert data["cursor"] == "2025-05-20T12:00:10"
+
+        assert json.loads(next(events).split("data: ")[1]) == {"firing": firing}
+
+
+def test_stream(client):
+    response = client.get("/api/stream?since=yesterday")
+    assert response.status_code == 400
+
+    with patch("app.routes.api.stream_events", return_value=iter(["retry: 5000\n\n"])) as mock_events:
+        response = client.get("/api/stream", headers={"Last-Event-ID": "2025-05-20T12:00:10"})
+
+    assert response.mimetype == "text/event-stream"
+    assert response.data == b"retry: 5000\n\n"
+    mock_events.assert_called_once_with(datetime(2025, 5, 20, 12, 0, 10))
+
+
+def test_get_series(client, app):
+    with app.app_context():
+        db.session.query(MetricSample).delete()
+        for minute in range(3):
+            db.session.add(
+                MetricSample(
+                    series="load.1",
+                    timestamp=datetime(2024, 1, 1, 12, minute),
+                    value=float(minute),
+                )
+            )
+        db.session.add(
+            MetricSample(series="swap.percent", timestamp=datetime(2024, 1, 1, 12, 0), value=5.0)
+        )
+        db.session.commit()
+
+    names = json.loads(client.get("/api/series").data)
+    assert names["series"] == ["load.1", "swap.percent"]
+
+    response = client.get("/api/series/load.1?from=2024-01-01T12:01:00")
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data["series"] == "load.1"
+    assert data["timestamps"] == ["2024-01-01T12:01:00", "2024-01-01T12:02:00"]
+    assert data["values"] == [1.0, 2.0]
+
+    response = client.get("/api/series/load.1?points=0")
+    assert response.status_code == 400
@@ -35,15 +35,15 @@ def test_run_job_with_context_failure(monkeypatch):
 
     monkeypatch.setattr("app.logger", mock.Mock())
 
-    monkeypatch.setattr("app.utils.email_utils.send_admin_email", mock.Mock())
+    monkeypatch.setattr("app.utils.error_aggregator.report_error", mock.Mock())
 
     with pytest.raises(ValueError):
         run_job_with_context(fail_func)
 
     assert app.logger.error.called
-    from app.utils.email_utils import send_admin_email
+    from app.utils.error_aggregator import report_error
 
-    assert send_admin_email.called
+    assert report_error.called
 
 
 def test_start_scheduler(monkeypatch):
@@ -59,10 +59,13 @@ def test_start_scheduler(monkeypatch):
         "app.utils.logs_utils.send_logs_via_email_and_clear_logs", mock.Mock()
     )
     monkeypatch.setattr("app.utils.db_utils.backup_database", mock.Mock())
+    monkeypatch.setattr("app.utils.rollup_utils.rollup_monitor_data", mock.Mock())
+    monkeypatch.setattr("app.utils.collector.start_collector", lambda flask_app: None)
+    monkeypatch.setattr("app.utils.outbox_utils.dispatch_alerts", mock.Mock())
 
     start_scheduler()
 
-    assert mock_scheduler.add_job.call_count == 3
+    assert mock_scheduler.add_job.call_count == 5
     assert mock_scheduler.start.called
     assert app.logger.info.called
 
@@ -0,0 +1,91 @@
+import pytest
+from unittest.mock import patch, MagicMock
+from datetime import datetime
+from app.utils.collector import SampleCollector, start_collector
+from app.utils.sample_buffer import SampleRingBuffer
+
+
+def make_sample(second=0):
+    return {
+        "timestamp": datetime(2025, 5, 20, 12, 0, second),
+        "cpu": 10.0,
+        "ram": 20.0,
+        "disk": 30.0,
+        "net_sent": 1.0,
+        "net_recv": 2.0,
+        "cpu_temp": 50.0,
+    }
+
+
+@pytest.fixture(autouse=True)
+def sample_buffer():
+    sample_buffer = SampleRingBuffer(10)
+    with patch("app.utils.sample_buffer.get_sample_buffer", return_value=sample_buffer):
+        yield sample_buffer
+
+
+@pytest.fixture
+def collector(app):
+    return SampleCollector(app, interval_s=1, batch_size=3, flush_s=3600)
+
+
+@patch("app.utils.system_monitor.check_alerts")
+@patch("app.utils.system_monitor.write_samples_to_db")
+@patch("app.utils.system_monitor.read_resources")
+def test_collect_once_flushes_full_batch(
+    mock_read_resources, mock_write_samples_to_db, mock_check_alerts, collector, sample_buffer
+):
+    samples = [make_sample(second) for second in range(4)]
+    mock_read_resources.side_effect = samples
+
+    collector.collect_once()
+    collector.collect_once()
+    mock_write_samples_to_db.assert_not_called()
+
+    collector.collect_once()
+    mock_write_samples_to_db.assert_called_once_with(samples[:3])
+
+    collector.collect_once()
+    mock_write_samples_to_db.assert_called_once()
+    assert mock_check_alerts.call_count == 4
+    assert len(sample_buffer) == 4
+    assert sample_buffer.latest()["timestamp"] == samples[3]["timestamp"]
+
+
+@patch("app.utils.system_monitor.check_alerts")
+@patch("app.utils.system_monitor.write_samples_to_db")
+@patch("app.utils.system_monitor.read_resources")
+def test_collect_once_flushes_after_flush_interval(
+    mock_read_resources, mock_write_samples_to_db, mock_check_alerts, app
+):
+    collector = SampleCollector(app, interval_s=1, batch_size=100, flush_s=0)
+    mock_read_resources.return_value = make_sample()
+
+    collector.collect_once()
+
+    mock_write_samples_to_db.assert_called_once_with([make_sample()])
+
+
+@patch("app.utils.system_monitor.write_samples_to_db")
+def test_flush_failure_keeps_samples_buffered(mock_write_samples_to_db, collector, app):
+    collector._buffer = [make_sample(0), make_sample(1)]
+    mock_write_samples_to_db.side_effect = Exception("database is locked")
+
+    with app.app_context():
+        with pytest.raises(Exception):
+            collector.flush()
+
+    assert collector._buffer == [make_sample(0), make_sample(1)]
+
+    mock_write_samples_to_db.side_effect = None
+    with app.app_context():
+        assert collector.flush() == 2
+    assert collector._buffer == []
+
+
+def test_start_collector_disabled(app):
+    app.config["COLLECTOR_INTERVAL_S"] = 0
+    try:
+        assert start_collector(app) is None
+    finally:
+        app.config["COLLECTOR_INTERVAL_S"] = 5
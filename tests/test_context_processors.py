@@ -4,6 +4,8 @@ from datetime import datetime as dt
 import pytz
 from flask import template_rendered, request
 from app import app, inject_user, to_datetime
+from app.routes import context_processors
+from app.routes.context_processors import format_uptime, get_system_info
 
 
 @pytest.fixture
@@ -69,6 +71,7 @@ def test_inject_user_agent(client, captured_templates):
 
 
 def test_inject_system_info(monkeypatch, client, captured_templates):
+    get_system_info.cache_clear()
     with patch("platform.system", return_value="Linux"), patch(
         "platform.version", return_value="5.4.0-42-generic"
     ), patch("platform.release", return_value="generic-release"):
@@ -78,19 +81,39 @@ def test_inject_system_info(monkeypatch, client, captured_templates):
                 "Linux generic-release 5.4.0-42-generic" in context.get("system_info")
                 for _, context in captured_templates
             )
+    get_system_info.cache_clear()
+
+
+def test_get_system_info_is_cached():
+    get_system_info.cache_clear()
+    with patch("platform.system", return_value="Linux") as mock_system:
+        get_system_info()
+        get_system_info()
+    assert mock_system.call_count == 1
+    get_system_info.cache_clear()
 
 
 def test_inject_system_uptime(monkeypatch, client, captured_templates):
-    with patch(
-        "subprocess.check_output",
-        return_value=" 10:23:45 up 1 day,  2:34,  2 users,  load average: 0.00, 0.01, 0.05\n",
-    ):
+    with patch.object(
+        context_processors, "get_boot_time", return_value=1000.0
+    ), patch.object(
+        context_processors.time, "time", return_value=1000.0 + 95640
+    ), patch("subprocess.check_output") as mock_check_output:
         with client:
             client.get("/")
             assert any(
-                "10:23:45" in context.get("system_uptime")
+                context.get("system_uptime") == "up 1 day, 2:34"
                 for _, context in captured_templates
             )
+    mock_check_output.assert_not_called()
+
+
+def test_format_uptime():
+    assert format_uptime(59) == "up 0 min"
+    assert format_uptime(42 * 60) == "up 42 min"
+    assert format_uptime(2 * 3600 + 5 * 60) == "up 2:05"
+    assert format_uptime(86400 + 2 * 3600 + 34 * 60) == "up 1 day, 2:34"
+    assert format_uptime(3 * 86400 + 7 * 60) == "up 3 days, 7 min"
 
 
 def test_inject_python_version(client, captured_templates):
@@ -0,0 +1,98 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from app.utils.data_utils import (
+    parse_datetime_param,
+    parse_points_param,
+    parse_cursor_param,
+    downsample,
+)
+
+
+def test_parse_datetime_param_empty():
+    assert parse_datetime_param(None) is None
+    assert parse_datetime_param("") is None
+
+
+def test_parse_datetime_param_iso():
+    assert parse_datetime_param("2025-05-20T12:00:00") == datetime(2025, 5, 20, 12, 0)
+
+
+def test_parse_datetime_param_epoch():
+    result = parse_datetime_param("1747735200")
+    assert result == datetime.fromtimestamp(1747735200)
+
+
+def test_parse_datetime_param_timezone_aware_converted_to_local():
+    result = parse_datetime_param("2025-05-20T12:00:00Z")
+    expected = (
+        datetime(2025, 5, 20, 12, 0, tzinfo=timezone.utc)
+        .astimezone()
+        .replace(tzinfo=None)
+    )
+    assert result == expected
+
+
+def test_parse_datetime_param_invalid():
+    with pytest.raises(ValueError):
+        parse_datetime_param("yesterday")
+
+
+def test_parse_points_param():
+    assert parse_points_param(None) is None
+    assert parse_points_param("300") == 300
+    with pytest.raises(ValueError):
+        parse_points_param("0")
+    with pytest.raises(ValueError):
+        parse_points_param("abc")
+
+
+def test_parse_cursor_param():
+    assert parse_cursor_param(None) is None
+    assert parse_cursor_param("42") == 42
+    assert parse_cursor_param("2025-05-20T12:00:00") == datetime(2025, 5, 20, 12, 0)
+    with pytest.raises(ValueError):
+        parse_cursor_param("-1")
+
+
+def test_downsample_no_points_returns_everything():
+    timestamps = [1, 2, 3]
+    result_timestamps, result_series = downsample(timestamps, {"cpu": [1.0, 2.0, 3.0]}, None)
+    assert result_timestamps == [1, 2, 3]
+    assert result_series == {"cpu": [1.0, 2.0, 3.0]}
+
+
+def test_downsample_buckets():
+    start = datetime(2025, 1, 1)
+    timestamps = [start + timedelta(seconds=i) for i in range(10)]
+    values = [float(i) for i in range(10)]
+
+    result_timestamps, result_series = downsample(timestamps, {"cpu": values}, 5)
+    assert result_timestamps == timestamps[::2]
+    assert result_series["cpu"] == [0.5, 2.5, 4.5, 6.5, 8.5]
+
+    _, result_series = downsample(timestamps, {"cpu": values}, 5, agg="max")
+    assert result_series["cpu"] == [1.0, 3.0, 5.0, 7.0, 9.0]
+
+    _, result_series = downsample(timestamps, {"cpu": values}, 5, agg="min")
+    assert result_series["cpu"] == [0.0, 2.0, 4.0, 6.0, 8.0]
+
+
+def test_downsample_uneven_buckets_never_exceed_points():
+    timestamps = list(range(1000))
+    result_timestamps, result_series = downsample(
+        timestamps, {"cpu": [1.0] * 1000}, 7
+    )
+    assert len(result_timestamps) == 7
+    assert result_series["cpu"] == [1.0] * 7
+
+
+def test_downsample_ignores_missing_values():
+    _, result_series = downsample(
+        [1, 2, 3, 4], {"temperature": [None, "Brak danych", 40.0, 60.0]}, 2
+    )
+    assert result_series["temperature"] == [None, 50.0]
+
+
+def test_downsample_invalid_agg():
+    with pytest.raises(ValueError):
+        downsample([1, 2], {"cpu": [1.0, 2.0]}, 1, agg="median")
@@ -1,68 +1,108 @@
+import gzip
 import os
-import builtins
+import sqlite3
 import pytest
-from unittest.mock import patch, MagicMock
-from app.utils import backup_database
+from datetime import datetime
+from unittest.mock import patch
+from flask import Flask
+from app.models import db, Settings
+from app.utils.db_utils import backup_database, rotate_backups, snapshot_database
 
 
 @pytest.fixture
-def setup_mocks():
-    with patch("app.utils.os.path.exists") as mock_exists, patch(
-        "app.utils.os.makedirs"
-    ) as mock_makedirs, patch("app.utils.shutil.copy2") as mock_copy2, patch(
-        "app.utils.logger"
-    ) as mock_logger, patch(
-        "app.utils.send_admin_email"
-    ) as mock_send_email:
-        yield mock_exists, mock_makedirs, mock_copy2, mock_logger, mock_send_email
-
-
-def test_backup_database_success_existing_backup_dir(setup_mocks):
-    mock_exists, mock_makedirs, mock_copy2, mock_logger, mock_send_email = setup_mocks
-    mock_exists.side_effect = (
-        lambda path: path == "instance/pulse.db" or path == "instance/backup"
+def backup_app(tmp_path):
+    backup_app = Flask(__name__)
+    backup_app.config.update(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'pulse.db'}",
+        BACKUP_GENERATIONS=2,
+        BACKUP_PAGES_PER_STEP=1,
+        BACKUP_STEP_SLEEP_S=0,
     )
+    db.init_app(backup_app)
+    with backup_app.app_context():
+        db.create_all()
+        db.session.add(Settings(cpu_alert_temp=80))
+        db.session.commit()
+        yield backup_app
+        db.session.remove()
+        db.engine.dispose()
 
-    result = backup_database()
 
-    assert result == "instance/backup/backup_pulse.db"
-    mock_copy2.assert_called_once_with(
-        "instance/pulse.db", "instance/backup/backup_pulse.db"
-    )
-    mock_logger.info.assert_called_once()
-    mock_send_email.assert_called_once()
+def read_backup(path, tmp_path):
+    restored = str(tmp_path / "restored.db")
+    with gzip.open(path, "rb") as source, open(restored, "wb") as target:
+        target.write(source.read())
+    connection = sqlite3.connect(restored)
+    try:
+        return connection.execute("SELECT cpu_alert_temp FROM settings").fetchall()
+    finally:
+        connection.close()
 
 
-def test_backup_database_success_create_backup_dir(setup_mocks):
-    mock_exists, mock_makedirs, mock_copy2, mock_logger, mock_send_email = setup_mocks
+@patch("app.utils.db_utils.send_admin_email")
+def test_backup_database(mock_send_email, backup_app, tmp_path):
+    with patch("app.utils.db_utils.datetime") as mock_datetime:
+        mock_datetime.now.return_value = datetime(2025, 5, 20, 3, 0)
+        backup_path = backup_database()
 
-    def exists_side_effect(path):
-        if path == "instance/pulse.db":
-            return True
-        if path == "instance/backup":
-            return False
-        return False
+    assert backup_path == str(tmp_path / "backup" / "backup_pulse_20250520_030000.db.gz")
+    assert read_backup(backup_path, tmp_path) == [(80.0,)]
+    assert os.listdir(tmp_path / "backup") == ["backup_pulse_20250520_030000.db.gz"]
+    mock_send_email.assert_called_once()
 
-    mock_exists.side_effect = exists_side_effect
 
-    result = backup_database()
+@patch("app.utils.db_utils.send_admin_email")
+def test_backup_database_rotates_generations(mock_send_email, backup_app, tmp_path):
+    for hour in range(1, 4):
+        with patch("app.utils.db_utils.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2025, 5, 20, hour, 0)
+            backup_database()
 
-    assert result == "instance/backup/backup_pulse.db"
-    mock_makedirs.assert_called_once_with("instance/backup")
-    mock_copy2.assert_called_once_with(
-        "instance/pulse.db", "instance/backup/backup_pulse.db"
-    )
-    mock_logger.info.assert_called_once()
-    mock_send_email.assert_called_once()
+    assert sorted(os.listdir(tmp_path / "backup")) == [
+        "backup_pulse_20250520_020000.db.gz",
+        "backup_pulse_20250520_030000.db.gz",
+    ]
 
 
-def test_backup_database_file_not_found(setup_mocks):
-    mock_exists, mock_makedirs, mock_copy2, mock_logger, mock_send_email = setup_mocks
-    mock_exists.return_value = False
+@patch("app.utils.db_utils.send_admin_email")
+def test_backup_database_file_not_found(mock_send_email, backup_app, tmp_path):
+    os.remove(tmp_path / "pulse.db")
 
-    with pytest.raises(FileNotFoundError):
-        backup_database()
-    mock_makedirs.assert_not_called()
-    mock_copy2.assert_not_called()
-    mock_logger.info.assert_not_called()
+    assert backup_database() is None
     mock_send_email.assert_not_called()
+
+
+def test_snapshot_database_consistent_with_writer(backup_app, tmp_path):
+    db_path = str(tmp_path / "pulse.db")
+    writer = sqlite3.connect(db_path)
+    writer.execute("CREATE TABLE samples (value INTEGER)")
+    writer.executemany("INSERT INTO samples VALUES (?)", [(i,) for i in range(5000)])
+    writer.commit()
+
+    def write_during_backup(status, remaining, total):
+        if remaining:
+            writer.execute("INSERT INTO samples VALUES (-1)")
+            writer.commit()
+
+    snapshot_path = str(tmp_path / "snapshot.db")
+    with patch("app.utils.db_utils.time.sleep", side_effect=lambda s: write_during_backup(0, 1, 0)):
+        pages = snapshot_database(db_path, snapshot_path, pages_per_step=4, step_sleep_s=0.01)
+    writer.close()
+
+    snapshot = sqlite3.connect(snapshot_path)
+    assert snapshot.execute("PRAGMA integrity_check").fetchone() == ("ok",)
+    assert snapshot.execute("SELECT count(*) FROM samples WHERE value >= 0").fetchone() == (5000,)
+    snapshot.close()
+    assert pages > 4
+
+
+def test_rotate_backups_ignores_other_files(tmp_path):
+    for name in ("backup_pulse_1.db.gz", "backup_pulse_2.db.gz", "backup_pulse.db", "backup_other_1.db.gz"):
+        (tmp_path / name).touch()
+
+    assert rotate_backups(str(tmp_path), "pulse", 1) == [str(tmp_path / "backup_pulse_1.db.gz")]
+    assert sorted(os.listdir(tmp_path)) == [
+        "backup_other_1.db.gz",
+        "backup_pulse.db",
+        "backup_pulse_2.db.gz",
+    ]
@@ -1,8 +1,10 @@
 import pytest
+import smtplib
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
 from app.utils.email_utils import (
     send_email,
+    send_bulk_email,
     send_admin_email,
     filter_users_and_send_alert_email,
 )
@@ -35,36 +37,107 @@ def test_send_email_exception(mock_logger, mock_mail, app_context):
     mock_logger.info.assert_not_called()
 
 
-@patch("app.utils.email_utils.send_email")
-@patch("app.utils.email_utils.User")
+@patch("app.mail")
 @patch("app.utils.email_utils.logger")
-def test_send_admin_email_success(mock_logger, mock_user, mock_send_email, app_context):
-    admin_user = MagicMock()
-    admin_user.email = "admin@example.com"
-    mock_user.query.filter_by.return_value.all.return_value = [admin_user]
+def test_send_bulk_email_uses_one_connection(mock_logger, mock_mail, app_context):
+    connection = mock_mail.connect.return_value.__enter__.return_value
+
+    results = send_bulk_email(["a@example.com", "b@example.com"], "Subject", "Body")
+
+    assert results == {"a@example.com": True, "b@example.com": True}
+    mock_mail.connect.assert_called_once()
+    sent_to = [call.args[0].recipients for call in connection.send.call_args_list]
+    assert sent_to == [["a@example.com"], ["b@example.com"]]
+
+
+@patch("app.utils.retry_connection.time.sleep")
+@patch("app.mail")
+@patch("app.utils.email_utils.logger")
+def test_send_bulk_email_reconnects_for_unsent(mock_logger, mock_mail, mock_sleep, app_context):
+    connection = mock_mail.connect.return_value.__enter__.return_value
+    connection.send.side_effect = [
+        None,
+        smtplib.SMTPServerDisconnected("Connection unexpectedly closed"),
+        None,
+        None,
+    ]
+    emails = ["a@example.com", "b@example.com", "c@example.com"]
+
+    results = send_bulk_email(emails, "Subject", "Body")
+
+    assert results == dict.fromkeys(emails, True)
+    assert mock_mail.connect.call_count == 2
+    sent_to = [call.args[0].recipients[0] for call in connection.send.call_args_list]
+    assert sent_to == ["a@example.com", "b@example.com", "b@example.com", "c@example.com"]
+
+
+@patch("app.mail")
+@patch("app.utils.email_utils.logger")
+def test_send_bulk_email_refused_recipient(mock_logger, mock_mail, app_context):
+    connection = mock_mail.connect.return_value.__enter__.return_value
+    connection.send.side_effect = [
+        smtplib.SMTPRecipientsRefused({"bad@example.com": (550, b"No such user")}),
+        None,
+    ]
 
-    mock_send_email.return_value = True
+    results = send_bulk_email(["bad@example.com", "ok@example.com"], "Subject", "Body")
+
+    assert results == {"bad@example.com": False, "ok@example.com": True}
+    mock_mail.connect.assert_called_once()
+    mock_logger.error.assert_called_once()
+
+
+@patch("app.utils.retry_connection.time.sleep")
+@patch("app.mail")
+@patch("app.utils.email_utils.logger")
+def test_send_bulk_email_connection_failure(mock_logger, mock_mail, mock_sleep, app_context):
+    mock_mail.connect.return_value.__enter__.side_effect = smtplib.SMTPConnectError(
+        421, "Service not available"
+    )
+
+    results = send_bulk_email(["a@example.com"], "Subject", "Body")
+
+    assert results == {"a@example.com": False}
+    assert mock_mail.connect.call_count == 3
+    mock_logger.error.assert_called_once()
+
+
+@patch("app.utils.email_utils.send_bulk_email")
+@patch("app.utils.email_utils.User")
+@patch("app.utils.email_utils.logger")
+def test_send_admin_email_success(mock_logger, mock_user, mock_send_bulk_email, app_context):
+    admin1, admin2 = MagicMock(), MagicMock()
+    admin1.email = "admin1@example.com"
+    admin2.email = "admin2@example.com"
+    mock_user.query.filter_by.return_value.all.return_value = [admin1, admin2]
+
+    mock_send_bulk_email.return_value = {
+        "admin1@example.com": True,
+        "admin2@example.com": True,
+    }
     send_admin_email("Admin Subject", "Admin Body")
-    mock_send_email.assert_called_once_with(
-        "admin@example.com", "Admin Subject", "Admin Body"
+    mock_send_bulk_email.assert_called_once_with(
+        ["admin1@example.com", "admin2@example.com"], "Admin Subject", "Admin Body"
     )
     mock_logger.error.assert_not_called()
 
 
-@patch("app.utils.email_utils.send_email")
+@patch("app.utils.email_utils.send_bulk_email")
 @patch("app.utils.email_utils.User")
 @patch("app.utils.email_utils.logger")
-def test_send_admin_email_failure(mock_logger, mock_user, mock_send_email, app_context):
+def test_send_admin_email_failure(mock_logger, mock_user, mock_send_bulk_email, app_context):
     admin_user = MagicMock()
     admin_user.email = "admin@example.com"
     mock_user.query.filter_by.return_value.all.return_value = [admin_user]
 
-    mock_send_email.return_value = False
+    mock_send_bulk_email.return_value = {"admin@example.com": False}
     send_admin_email("Admin Subject", "Admin Body")
     mock_logger.error.assert_called_once()
 
 
-@patch("app.utils.email_utils.send_email")
+@patch("app.utils.email_utils.send_bulk_email")
+@patch("app.utils.email_utils.db")
+@patch("app.utils.email_utils.mark_alerts_sent")
 @patch("app.utils.email_utils.send_admin_email")
 @patch("app.utils.email_utils.User")
 @patch("app.utils.email_utils.Settings")
@@ -74,36 +147,39 @@ def test_filter_users_and_send_alert_email(
     mock_settings,
     mock_user,
     mock_send_admin_email,
-    mock_send_email,
+    mock_mark_alerts_sent,
+    mock_db,
+    mock_send_bulk_email,
     app_context,
 ):
     mock_settings.query.first.return_value = MagicMock(alerts_frequency_hrs=1)
 
     user1 = MagicMock()
     user1.email = "user1@example.com"
-    user1.last_alert_time = None
-    user1.update_last_alert_time = MagicMock()
+    user1.last_email_alert_time = None
 
     user2 = MagicMock()
     user2.email = "user2@example.com"
-    user2.last_alert_time = datetime.now() - timedelta(minutes=30)
-    user2.update_last_alert_time = MagicMock()
+    user2.last_email_alert_time = datetime.now() - timedelta(minutes=30)
 
     mock_user.query.filter_by.return_value.all.return_value = [user1, user2]
 
-    mock_send_email.side_effect = [True]
+    mock_send_bulk_email.return_value = {"user1@example.com": True}
 
     filter_users_and_send_alert_email("Alert Subject", "Alert Body")
 
-    mock_send_email.assert_called_once_with(
-        "user1@example.com", "Alert Subject", "Alert Body"
+    mock_send_bulk_email.assert_called_once_with(
+        ["user1@example.com"], "Alert Subject", "Alert Body"
     )
-    user1.update_last_alert_time.assert_called_once()
+    mock_mark_alerts_sent.assert_called_once_with("email", [user1])
+    mock_db.session.commit.assert_called_once()
 
     mock_logger.warning.assert_called_once()
 
 
-@patch("app.utils.email_utils.send_email")
+@patch("app.utils.email_utils.send_bulk_email")
+@patch("app.utils.email_utils.db")
+@patch("app.utils.email_utils.mark_alerts_sent")
 @patch("app.utils.email_utils.send_admin_email")
 @patch("app.utils.email_utils.User")
 @patch("app.utils.email_utils.Settings")
@@ -113,21 +189,22 @@ def test_filter_users_and_send_alert_email_send_failure(
     mock_settings,
     mock_user,
     mock_send_admin_email,
-    mock_send_email,
+    mock_mark_alerts_sent,
+    mock_db,
+    mock_send_bulk_email,
     app_context,
 ):
     mock_settings.query.first.return_value = MagicMock(alerts_frequency_hrs=1)
 
     user = MagicMock()
     user.email = "user@example.com"
-    user.last_alert_time = None
-    user.update_last_alert_time = MagicMock()
+    user.last_email_alert_time = None
 
     mock_user.query.filter_by.return_value.all.return_value = [user]
-    mock_send_email.return_value = False
+    mock_send_bulk_email.return_value = {"user@example.com": False}
 
     filter_users_and_send_alert_email("Alert Subject", "Alert Body")
 
     mock_logger.error.assert_called_once()
     mock_send_admin_email.assert_called_once()
-    user.update_last_alert_time.assert_not_called()
+    mock_mark_alerts_sent.assert_called_once_with("email", [])
@@ -0,0 +1,88 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from app.utils.error_aggregator import ErrorAggregator, fingerprint
+from app.utils.exception_handler import exception_handler
+
+
+def raise_value_error(message):
+    raise ValueError(message)
+
+
+def caught(func, *args):
+    try:
+        func(*args)
+    except Exception as e:
+        return e
+
+
+@pytest.fixture
+def aggregator():
+    aggregator = ErrorAggregator(window_s=3600, send=MagicMock())
+    yield aggregator
+    aggregator.close()
+
+
+def test_fingerprint_ignores_message():
+    first = caught(raise_value_error, "user 1 not found")
+    second = caught(raise_value_error, "user 2 not found")
+
+    assert fingerprint("ValueError in f", first) == fingerprint("ValueError in f", second)
+    assert fingerprint("ValueError in f", first) != fingerprint("ValueError in g", first)
+    assert fingerprint("ValueError in f", first) != fingerprint(
+        "ValueError in f", caught(int, "x")
+    )
+
+
+def test_report_suppresses_duplicates(aggregator):
+    error = caught(raise_value_error, "fail")
+
+    aggregator.report("ValueError in f", "fail 1", error).result(timeout=5)
+    for i in range(2, 5):
+        assert aggregator.report("ValueError in f", f"fail {i}", error) is None
+
+    aggregator.send.assert_called_once()
+    subject, body = aggregator.send.call_args.args
+    assert subject == "ValueError in f"
+    assert body.startswith("fail 1")
+
+
+def test_flush_sends_one_digest(aggregator):
+    error = caught(raise_value_error, "fail")
+    aggregator.report("ValueError in f", "fail", error).result(timeout=5)
+    aggregator.report("ValueError in f", "fail again", error)
+    aggregator.report("ValueError in f", "fail again", error)
+    aggregator.report("Error in start_scheduler", "boom").result(timeout=5)
+    aggregator.report("Error in start_scheduler", "boom")
+    aggregator.send.reset_mock()
+
+    assert aggregator.flush() == 2
+
+    aggregator.send.assert_called_once()
+    subject, body = aggregator.send.call_args.args
+    assert subject == "Error digest: 3 repeated occurrence(s) of 2 error(s)"
+    assert body.index("2x ValueError in f") < body.index("1x Error in start_scheduler")
+    assert "fail again" in body
+
+
+def test_flush_forgets_quiet_errors(aggregator):
+    aggregator.report("Error in start_scheduler", "boom").result(timeout=5)
+    aggregator.report("Error in start_scheduler", "boom")
+
+    assert aggregator.flush() == 1
+    assert aggregator.flush() == 0
+    assert aggregator.report("Error in start_scheduler", "boom") is not None
+
+
+@patch("app.utils.exception_handler.logger")
+@patch("app.utils.error_aggregator.report_error")
+def test_exception_handler_reports_error(mock_report_error, mock_logger):
+    @exception_handler(default_return=False)
+    def failing():
+        raise TimeoutError("SMTP timeout")
+
+    assert failing() is False
+
+    subject, body, error = mock_report_error.call_args.args
+    assert subject == "TimeoutError in failing"
+    assert "SMTP timeout" in body
+    assert isinstance(error, TimeoutError)
@@ -0,0 +1,45 @@
+import pytest
+from flask import Flask
+from app.utils import live_stream
+from app.utils.live_stream import format_event, get_alert_states, publish_alert_states
+
+FIRING = [{"name": "CPU Temperature", "metric": "cpu_temp", "value": 90.0}]
+
+
+@pytest.fixture
+def state_app(tmp_path, monkeypatch):
+    monkeypatch.setattr(live_stream, "_published", None)
+    monkeypatch.setattr(live_stream, "_alert_states", [])
+    monkeypatch.setattr(live_stream, "_cached_states", (None, []))
+    state_app = Flask(__name__)
+    state_app.config["ALERT_STATE_PATH"] = str(tmp_path / "alerts.json")
+    with state_app.app_context():
+        yield state_app
+
+
+def test_format_event():
+    assert format_event("alerts", {"firing": []}) == 'event: alerts\ndata: {"firing":[]}\n\n'
+    assert format_event("samples", [1], "2025-05-20T12:00:00") == (
+        "event: samples\nid: 2025-05-20T12:00:00\ndata: [1]\n\n"
+    )
+
+
+def test_alert_states_shared_through_file(state_app):
+    assert get_alert_states() == []
+
+    assert publish_alert_states(FIRING) is True
+    assert publish_alert_states(list(FIRING)) is False
+    live_stream._alert_states = []
+
+    assert get_alert_states() == FIRING
+
+    publish_alert_states([])
+    assert get_alert_states() == []
+
+
+def test_alert_states_in_process(state_app):
+    state_app.config["ALERT_STATE_PATH"] = None
+
+    publish_alert_states(FIRING)
+
+    assert get_alert_states() == FIRING
@@ -0,0 +1,179 @@
+import threading
+from collections import namedtuple
+from datetime import datetime
+from unittest.mock import patch
+import pytest
+from app.utils import metric_collectors
+from app.utils.metric_collectors import (
+    MetricCollector,
+    DiskIOCollector,
+    OpenFilesCollector,
+    register_collector,
+    unregister_collector,
+    get_collectors,
+    sample_series,
+    collect_metrics,
+)
+
+TIMESTAMP = datetime(2025, 5, 20, 12, 0)
+
+
+class StaticCollector(MetricCollector):
+    name = "static"
+
+    def collect(self):
+        return {"static.a": 1, "static.b": None}
+
+
+class FailingCollector(MetricCollector):
+    name = "failing"
+
+    def collect(self):
+        raise RuntimeError("sensor missing")
+
+
+class BlockingCollector(MetricCollector):
+    name = "blocking"
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = 0
+
+    def collect(self):
+        self.calls += 1
+        self.release.wait(5)
+        return {"blocking": 1.0}
+
+
+@pytest.fixture
+def only_collectors(app):
+    """
+    Replaces the built-in collectors with the ones given to the returned function.
+    """
+    saved = get_collectors()
+    for name in saved:
+        unregister_collector(name)
+
+    def register(*collectors):
+        for collector in collectors:
+            register_collector(collector)
+
+    with app.app_context():
+        yield register
+
+    for name in get_collectors():
+        unregister_collector(name)
+    for collector in saved.values():
+        register_collector(collector)
+
+
+def test_builtin_collectors_registered():
+    assert {"load", "swap", "disk_io", "open_files", "mounts"} <= set(get_collectors())
+
+
+def test_register_collector_requires_name():
+    class Nameless(MetricCollector):
+        pass
+
+    with pytest.raises(ValueError):
+        register_collector(Nameless)
+
+
+def test_collect_metrics_rows(only_collectors):
+    only_collectors(StaticCollector)
+
+    rows = collect_metrics(TIMESTAMP)
+
+    assert rows == [{"series": "static.a", "timestamp": TIMESTAMP, "value": 1.0}]
+
+
+@patch("app.utils.metric_collectors.logger")
+def test_collect_metrics_skips_failing_collector(mock_logger, only_collectors):
+    only_collectors(StaticCollector, FailingCollector)
+
+    rows = collect_metrics(TIMESTAMP)
+
+    assert [row["series"] for row in rows] == ["static.a"]
+    mock_logger.error.assert_called_once_with(
+        "collect_metrics() collector failing failed: sensor missing"
+    )
+
+
+@patch("app.utils.metric_collectors.logger")
+def test_collect_metrics_does_not_wait_for_slow_collector(
+    mock_logger, only_collectors, app
+):
+    blocking = BlockingCollector()
+    only_collectors(StaticCollector, blocking)
+    app.config["METRIC_COLLECTOR_TIMEOUT_S"] = 0.1
+
+    try:
+        first = collect_metrics(TIMESTAMP)
+        second = collect_metrics(TIMESTAMP)
+    finally:
+        blocking.release.set()
+        app.config.pop("METRIC_COLLECTOR_TIMEOUT_S")
+
+    assert [row["series"] for row in first] == ["static.a"]
+    assert [row["series"] for row in second] == ["static.a"]
+    assert blocking.calls == 1
+    mock_logger.warning.assert_any_call(
+        "collect_metrics() collector blocking timed out after 0.1s."
+    )
+    mock_logger.warning.assert_any_call(
+        "collect_metrics() collector blocking is still running, skipped."
+    )
+
+
+def test_sample_series():
+    sample = {
+        "cpu_per_core": [10.0, 20.0],
+        "net_per_nic": {
+            "eth0": {
+                "net_sent_rate": 1.0,
+                "net_recv_rate": 2.0,
+                "net_packets_sent_rate": 3.0,
+                "net_packets_recv_rate": 4.0,
+            }
+        },
+    }
+
+    assert sample_series(sample) == {
+        "cpu.core0": 10.0,
+        "cpu.core1": 20.0,
+        "net.eth0.sent_rate": 1.0,
+        "net.eth0.recv_rate": 2.0,
+        "net.eth0.packets_sent_rate": 3.0,
+        "net.eth0.packets_recv_rate": 4.0,
+    }
+
+
+def test_disk_io_collector_rates():
+    DiskIO = namedtuple("DiskIO", ["read_bytes", "write_bytes", "read_count", "write_count"])
+    collector = DiskIOCollector()
+
+    with patch(
+        "app.utils.metric_collectors.psutil.disk_io_counters",
+        side_effect=[DiskIO(100, 200, 1, 2), DiskIO(1100, 2200, 11, 22)],
+    ), patch("app.utils.metric_collectors.time.monotonic", side_effect=[10.0, 20.0]):
+        first = collector.collect()
+        second = collector.collect()
+
+    assert first == {}
+    assert second == {
+        "disk_io.read_rate": 100.0,
+        "disk_io.write_rate": 200.0,
+        "disk_io.read_ops_rate": 1.0,
+        "disk_io.write_ops_rate": 2.0,
+    }
+
+
+def test_open_files_collector(tmp_path):
+    file_nr = tmp_path / "file-nr"
+    file_nr.write_text("2048\t48\t9223372036854775807\n")
+
+    with patch.object(metric_collectors, "FILE_NR_PATH", str(file_nr)):
+        assert OpenFilesCollector().collect() == {"open_files": 2000.0}
+
+    with patch.object(metric_collectors, "FILE_NR_PATH", str(tmp_path / "missing")):
+        assert OpenFilesCollector().collect() == {}
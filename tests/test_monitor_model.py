@@ -1,8 +1,28 @@
-from datetime import datetime
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, delete, select
 from app.models import db
 from app.models import Monitor
 
 
+@pytest.fixture
+def monitor_engine():
+    engine = create_engine("sqlite://")
+    Monitor.__table__.create(engine)
+    yield engine
+    engine.dispose()
+
+
+def query_plan(engine, statement) -> str:
+    compiled = statement.compile(dialect=engine.dialect)
+    params = tuple(compiled.params[name] for name in compiled.positiontup)
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {compiled}", params
+        ).fetchall()
+    return " | ".join(row[-1] for row in rows)
+
+
 def test_create_monitor_entry(app):
     with app.app_context():
         timestamp = datetime(2024, 10, 10, 12, 0, 0)
@@ -42,3 +62,36 @@ def test_monitor_default_timestamp(app):
         assert monitor.timestamp is not None
         assert isinstance(monitor.timestamp, datetime)
         assert f"<Monitor {monitor.timestamp}>" == repr(monitor)
+
+
+def test_latest_sample_uses_timestamp_index(monitor_engine):
+    plan = query_plan(
+        monitor_engine,
+        select(Monitor).order_by(Monitor.timestamp.desc()).limit(1),
+    )
+    assert "ix_monitor_timestamp" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_range_scan_uses_timestamp_index(monitor_engine):
+    now = datetime.now()
+    plan = query_plan(
+        monitor_engine,
+        select(Monitor)
+        .where(Monitor.timestamp >= now - timedelta(hours=1))
+        .where(Monitor.timestamp <= now)
+        .order_by(Monitor.timestamp),
+    )
+    assert "SEARCH monitor USING INDEX ix_monitor_timestamp" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_retention_delete_uses_timestamp_index(monitor_engine):
+    expired_ids = (
+        select(Monitor.id)
+        .where(Monitor.timestamp < datetime.now() - timedelta(hours=24))
+        .limit(100)
+        .scalar_subquery()
+    )
+    plan = query_plan(monitor_engine, delete(Monitor).where(Monitor.id.in_(expired_ids)))
+    assert "SEARCH monitor USING COVERING INDEX ix_monitor_timestamp" in plan
@@ -3,6 +3,7 @@ from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
 from app.utils.system_monitor import check_resources
 from app.models import Monitor, Settings
+from app.utils.rules_engine import Rule, RulesEngine
 
 
 @pytest.fixture
@@ -11,22 +12,28 @@ def app_context(app):
         yield
 
 
-@patch("app.utils.check_resources.psutil.cpu_percent", return_value=30.5)
+def cpu_temp_rules_engine():
+    engine = RulesEngine()
+    engine.set_rules([Rule("cpu_temp", "CPU Temperature", "cpu_temp", ">=", 70)])
+    return engine
+
+
+@patch("app.utils.check_resources.sampler.sample_cpu", return_value={"cpu": 30.5})
 @patch("app.utils.check_resources.psutil.virtual_memory")
 @patch("app.utils.check_resources.psutil.disk_usage")
-@patch("app.utils.check_resources.psutil.net_io_counters")
+@patch("app.utils.check_resources.sampler.sample_network")
 @patch("app.utils.check_resources.psutil.sensors_temperatures")
-@patch("app.utils.check_resources.write_to_db")
+@patch("app.utils.check_resources.write_samples_to_db")
 @patch("app.utils.check_resources.remove_old_data")
-@patch("app.utils.check_resources.Settings")
+@patch("app.utils.check_resources.rules_engine", new_callable=cpu_temp_rules_engine)
 @patch("app.utils.check_resources.logger")
-@patch("app.utils.check_resources.sent_user_alert")
+@patch("app.utils.check_resources.enqueue_alert")
 def test_check_resources_normal_flow(
     mock_alert,
     mock_logger,
-    mock_settings,
+    mock_rules_engine,
     mock_remove_old_data,
-    mock_write_to_db,
+    mock_write_samples_to_db,
     mock_sensors,
     mock_net_io,
     mock_disk_usage,
@@ -36,13 +43,10 @@ def test_check_resources_normal_flow(
 ):
     mock_virtual_memory.return_value.percent = 40.1
     mock_disk_usage.return_value.percent = 50.2
-    mock_net_io.return_value.bytes_sent = 1024 * 1024 * 10  # 10 MB
-    mock_net_io.return_value.bytes_recv = 1024 * 1024 * 20  # 20 MB
+    mock_net_io.return_value = {"net_sent": 10.0, "net_recv": 20.0}
 
     mock_sensors.return_value = {"coretemp": [MagicMock(current=75.0)]}
 
-    mock_settings.query.first.return_value = MagicMock(cpu_alert_temp=70)
-
     result = check_resources.check_resources()
 
     cpu, ram, disk, net_sent, net_recv, cpu_temp = result
@@ -54,7 +58,7 @@ def test_check_resources_normal_flow(
     assert abs(net_recv - 20.0) < 0.01
     assert cpu_temp == 75.0
 
-    mock_write_to_db.assert_called_once()
+    mock_write_samples_to_db.assert_called_once()
     mock_remove_old_data.assert_called_once()
     mock_logger.info.assert_called_with("check_resources() loop completed.")
 
@@ -62,34 +66,31 @@ def test_check_resources_normal_flow(
 
 
 @patch("app.utils.check_resources.psutil.sensors_temperatures")
-@patch("app.utils.check_resources.Settings")
-@patch("app.utils.check_resources.sent_user_alert")
-@patch("app.utils.check_resources.write_to_db")
+@patch("app.utils.check_resources.rules_engine", new_callable=cpu_temp_rules_engine)
+@patch("app.utils.check_resources.enqueue_alert")
+@patch("app.utils.check_resources.write_samples_to_db")
 @patch("app.utils.check_resources.remove_old_data")
 @patch("app.utils.check_resources.logger")
 def test_check_resources_no_cpu_temp(
     mock_logger,
     mock_remove_old_data,
-    mock_write_to_db,
-    mock_sent_user_alert,
-    mock_settings,
+    mock_write_samples_to_db,
+    mock_enqueue_alert,
+    mock_rules_engine,
     mock_sensors,
     app_context,
 ):
     mock_sensors.return_value = {}
 
-    mock_settings.query.first.return_value = MagicMock(cpu_alert_temp=70)
-
-    with patch("app.utils.check_resources.psutil.cpu_percent", return_value=10), patch(
+    with patch("app.utils.check_resources.sampler.sample_cpu", return_value={"cpu": 10}), patch(
         "app.utils.check_resources.psutil.virtual_memory"
     ) as vm, patch("app.utils.check_resources.psutil.disk_usage") as du, patch(
-        "app.utils.check_resources.psutil.net_io_counters"
+        "app.utils.check_resources.sampler.sample_network"
     ) as net_io:
 
         vm.return_value.percent = 20
         du.return_value.percent = 30
-        net_io.return_value.bytes_sent = 0
-        net_io.return_value.bytes_recv = 0
+        net_io.return_value = {"net_sent": 0, "net_recv": 0}
 
         result = check_resources.check_resources()
 
@@ -97,51 +98,110 @@ def test_check_resources_no_cpu_temp(
 
     assert cpu_temp == "Brak danych"
 
-    mock_sent_user_alert.assert_not_called()
+    mock_enqueue_alert.assert_not_called()
 
-    mock_write_to_db.assert_called_once()
+    mock_write_samples_to_db.assert_called_once()
     mock_remove_old_data.assert_called_once()
     mock_logger.info.assert_called_with("check_resources() loop completed.")
 
 
 @patch("app.utils.check_resources.db")
-@patch("app.utils.check_resources.Monitor")
 @patch("app.utils.check_resources.logger")
-def test_write_to_db(mock_logger, mock_monitor_class, mock_db, app_context):
-    data = [datetime(2025, 5, 20, 12, 0), 10.1, 20.2, 30.3, 1.1, 2.2, 50.0]
-
-    instance = MagicMock()
-    mock_monitor_class.return_value = instance
-
-    check_resources.write_to_db(data)
-
-    mock_monitor_class.assert_called_once_with(
-        timestamp=data[0],
-        cpu=data[1],
-        ram=data[2],
-        disk=data[3],
-        net_sent=data[4],
-        net_recv=data[5],
-        cpu_temp=data[6],
+def test_write_samples_to_db(mock_logger, mock_db, app_context):
+    samples = [
+        {
+            "timestamp": datetime(2025, 5, 20, 12, 0, second),
+            "cpu": 10.1,
+            "ram": 20.2,
+            "disk": 30.3,
+            "net_sent": 1.1,
+            "net_recv": 2.2,
+            "cpu_temp": 50.0,
+        }
+        for second in range(3)
+    ]
+
+    check_resources.write_samples_to_db(samples)
+
+    mock_db.session.execute.assert_called_once()
+    assert mock_db.session.execute.call_args.args[1] == samples
+    mock_db.session.commit.assert_called_once()
+    mock_logger.info.assert_called_with(
+        "write_samples_to_db() 3 samples written to database"
     )
-    mock_db.session.add.assert_called_once_with(instance)
+
+
+@patch("app.utils.check_resources.db")
+@patch("app.utils.check_resources.logger")
+def test_write_samples_to_db_with_metrics(mock_logger, mock_db, app_context):
+    timestamp = datetime(2025, 5, 20, 12, 0)
+    metrics = [
+        {"series": "load.1", "timestamp": timestamp, "value": 0.5},
+        {"series": "swap.percent", "timestamp": timestamp, "value": 12.0},
+    ]
+    sample = {
+        "timestamp": timestamp,
+        "cpu": 10.1,
+        "cpu_per_core": [10.1],
+        "ram": 20.2,
+        "disk": 30.3,
+        "net_sent": 1.1,
+        "net_recv": 2.2,
+        "cpu_temp": None,
+        "metrics": metrics,
+    }
+
+    check_resources.write_samples_to_db([sample])
+
+    assert mock_db.session.execute.call_count == 2
+    monitor_rows = mock_db.session.execute.call_args_list[0].args[1]
+    assert "cpu_per_core" not in monitor_rows[0]
+    assert "metrics" not in monitor_rows[0]
+    assert mock_db.session.execute.call_args_list[1].args[1] == metrics
     mock_db.session.commit.assert_called_once()
-    mock_logger.info.assert_called_with("write_to_db() New data written to database")
+    mock_logger.info.assert_called_with(
+        "write_samples_to_db() 1 samples written to database with 2 metric values"
+    )
 
 
-@patch("app.utils.check_resources.Monitor")
+@patch("app.utils.check_resources.db")
+def test_write_samples_to_db_empty(mock_db, app_context):
+    check_resources.write_samples_to_db([])
+
+    mock_db.session.execute.assert_not_called()
+    mock_db.session.commit.assert_not_called()
+
+
+@patch("app.utils.check_resources.Settings")
 @patch("app.utils.check_resources.db")
 @patch("app.utils.check_resources.logger")
-def test_remove_old_data(mock_logger, mock_db, mock_monitor_class, app_context):
-    cutoff = datetime.now() - timedelta(hours=24)
-    old_record = MagicMock()
-    mock_monitor_class.query.filter.return_value.all.return_value = [old_record]
+def test_remove_old_data(mock_logger, mock_db, mock_settings, app_context):
+    mock_settings.query.first.return_value = MagicMock(data_retention_hrs=24)
+    mock_db.session.execute.return_value.rowcount = 3
 
-    check_resources.remove_old_data()
+    removed = check_resources.remove_old_data()
 
-    mock_monitor_class.query.filter.assert_called()
-    mock_db.session.delete.assert_called_once_with(old_record)
-    mock_db.session.commit.assert_called_once()
+    assert removed == 6
+    assert mock_db.session.execute.call_count == 2
+    mock_db.session.delete.assert_not_called()
+    assert mock_db.session.commit.call_count == 2
     mock_logger.info.assert_called_with(
-        "remove_old_data() Data older than 24 hours removed from database."
+        "remove_old_data() 3 records and 3 metric samples older than 24 hours removed from database."
     )
+
+
+@patch("app.utils.check_resources.RETENTION_DELETE_CHUNK_SIZE", 2)
+@patch("app.utils.check_resources.Settings")
+@patch("app.utils.check_resources.db")
+@patch("app.utils.check_resources.logger")
+def test_remove_old_data_in_chunks(mock_logger, mock_db, mock_settings, app_context):
+    mock_settings.query.first.return_value = MagicMock(data_retention_hrs=48)
+    first, second = MagicMock(rowcount=2), MagicMock(rowcount=1)
+    metrics = MagicMock(rowcount=0)
+    mock_db.session.execute.side_effect = [first, second, metrics]
+
+    removed = check_resources.remove_old_data()
+
+    assert removed == 3
+    assert mock_db.session.execute.call_count == 3
+    assert mock_db.session.commit.call_count == 3
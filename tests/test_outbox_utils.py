@@ -0,0 +1,116 @@
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from flask import Flask
+from sqlalchemy import select
+from app.models import db, AlertOutbox
+from app.utils.outbox_utils import enqueue_alert, retry_delay, dispatch_alerts
+
+NOW = datetime(2025, 5, 20, 12, 0)
+
+
+@pytest.fixture
+def outbox_app():
+    outbox_app = Flask(__name__)
+    outbox_app.config.update(
+        SQLALCHEMY_DATABASE_URI="sqlite://",
+        ALERT_RETRY_BASE_S=30,
+        ALERT_RETRY_MAX_S=3600,
+        ALERT_MAX_ATTEMPTS=3,
+    )
+    db.init_app(outbox_app)
+    with outbox_app.app_context():
+        db.create_all()
+        yield outbox_app
+        db.session.remove()
+
+
+def add_alert(subject="CPU Temperature Alert.", next_attempt_at=NOW, **kwargs):
+    alert = AlertOutbox(
+        subject=subject, body="cpu_temp = 90", next_attempt_at=next_attempt_at, **kwargs
+    )
+    db.session.add(alert)
+    db.session.commit()
+    return alert
+
+
+def test_enqueue_alert(outbox_app):
+    alert = enqueue_alert("CPU Temperature Alert.", "cpu_temp = 90")
+
+    stored = db.session.get(AlertOutbox, alert.id)
+    assert stored.attempts == 0
+    assert stored.sent_at is None
+    assert stored.next_attempt_at is not None
+
+
+def test_retry_delay(outbox_app):
+    assert retry_delay(1) == timedelta(seconds=30)
+    assert retry_delay(2) == timedelta(seconds=60)
+    assert retry_delay(4) == timedelta(seconds=240)
+    assert retry_delay(20) == timedelta(seconds=3600)
+
+
+@patch("app.utils.system_monitor.sent_user_alert", return_value=True)
+def test_dispatch_alerts_delivers_due_alerts(mock_sent_user_alert, outbox_app):
+    due = add_alert("due")
+    later = add_alert("later", next_attempt_at=NOW + timedelta(minutes=5))
+
+    assert dispatch_alerts(NOW) == 1
+
+    mock_sent_user_alert.assert_called_once_with("due", "cpu_temp = 90")
+    assert db.session.get(AlertOutbox, due.id).sent_at is not None
+    assert db.session.get(AlertOutbox, due.id).next_attempt_at is None
+    assert db.session.get(AlertOutbox, later.id).sent_at is None
+
+
+@patch("app.utils.outbox_utils.logger")
+@patch("app.utils.system_monitor.sent_user_alert")
+def test_dispatch_alerts_retries_with_backoff(mock_sent_user_alert, mock_logger, outbox_app):
+    mock_sent_user_alert.side_effect = [False, ConnectionError("SMTP down"), True]
+    alert = add_alert()
+
+    assert dispatch_alerts(NOW) == 0
+    stored = db.session.get(AlertOutbox, alert.id)
+    assert stored.attempts == 1
+    assert stored.next_attempt_at == NOW + timedelta(seconds=30)
+    assert stored.last_error == "Not delivered to every receiver."
+
+    assert dispatch_alerts(NOW + timedelta(seconds=10)) == 0
+    assert mock_sent_user_alert.call_count == 1
+
+    retry_time = NOW + timedelta(seconds=30)
+    assert dispatch_alerts(retry_time) == 0
+    stored = db.session.get(AlertOutbox, alert.id)
+    assert stored.attempts == 2
+    assert stored.next_attempt_at == retry_time + timedelta(seconds=60)
+    assert stored.last_error == "SMTP down"
+
+    assert dispatch_alerts(retry_time + timedelta(seconds=60)) == 1
+    stored = db.session.get(AlertOutbox, alert.id)
+    assert stored.sent_at is not None
+    assert stored.last_error is None
+
+
+@patch("app.utils.outbox_utils.logger")
+@patch("app.utils.system_monitor.sent_user_alert", return_value=False)
+def test_dispatch_alerts_gives_up(mock_sent_user_alert, mock_logger, outbox_app):
+    alert = add_alert(attempts=2)
+
+    dispatch_alerts(NOW)
+
+    stored = db.session.get(AlertOutbox, alert.id)
+    assert stored.attempts == 3
+    assert stored.next_attempt_at is None
+    assert stored.sent_at is None
+    mock_logger.error.assert_called_once()
+
+
+@patch("app.utils.system_monitor.sent_user_alert", return_value=True)
+def test_dispatch_alerts_removes_old_sent_alerts(mock_sent_user_alert, outbox_app):
+    add_alert(next_attempt_at=None, sent_at=NOW - timedelta(days=8))
+    recent_id = add_alert(next_attempt_at=None, sent_at=NOW - timedelta(days=1)).id
+
+    dispatch_alerts(NOW)
+
+    assert db.session.scalars(select(AlertOutbox.id)).all() == [recent_id]
+    mock_sent_user_alert.assert_not_called()
@@ -0,0 +1,150 @@
+from collections import namedtuple
+from unittest.mock import patch
+from app.utils.resource_sampler import ResourceSampler
+
+CpuTimes = namedtuple(
+    "CpuTimes", ["user", "nice", "system", "idle", "iowait", "steal", "guest", "guest_nice"]
+)
+
+
+def cpu_times(user, idle, iowait=0.0, steal=0.0, guest=0.0):
+    return CpuTimes(user, 0.0, 0.0, idle, iowait, steal, guest, 0.0)
+
+
+def sample(sampler, total, per_core):
+    with patch(
+        "app.utils.resource_sampler.psutil.cpu_times",
+        side_effect=lambda percpu=False: per_core if percpu else total,
+    ):
+        return sampler.sample_cpu()
+
+
+def test_first_sample_reports_average_since_boot():
+    sampler = ResourceSampler()
+
+    result = sample(
+        sampler,
+        cpu_times(user=25.0, idle=75.0),
+        [cpu_times(user=10.0, idle=40.0), cpu_times(user=15.0, idle=35.0)],
+    )
+
+    assert result["cpu"] == 25.0
+    assert result["cpu_per_core"] == [20.0, 30.0]
+
+
+def test_sample_uses_interval_deltas():
+    sampler = ResourceSampler()
+    sample(
+        sampler,
+        cpu_times(user=100.0, idle=100.0),
+        [cpu_times(user=50.0, idle=50.0), cpu_times(user=50.0, idle=50.0)],
+    )
+
+    result = sample(
+        sampler,
+        cpu_times(user=130.0, idle=150.0, iowait=10.0, steal=10.0),
+        [
+            cpu_times(user=80.0, idle=60.0, iowait=10.0),
+            cpu_times(user=50.0, idle=90.0, steal=10.0),
+        ],
+    )
+
+    assert result["cpu"] == 40.0
+    assert result["cpu_iowait"] == 10.0
+    assert result["cpu_steal"] == 10.0
+    assert result["cpu_per_core"] == [60.0, 20.0]
+
+
+def test_guest_time_is_not_counted_twice():
+    sampler = ResourceSampler()
+
+    result = sample(sampler, cpu_times(user=50.0, idle=50.0, guest=20.0), [])
+
+    assert result["cpu"] == 50.0
+
+
+def test_sample_without_elapsed_time_returns_zero():
+    sampler = ResourceSampler()
+    times = cpu_times(user=10.0, idle=10.0)
+    sample(sampler, times, [times])
+
+    result = sample(sampler, times, [times])
+
+    assert result["cpu"] == 0.0
+    assert result["cpu_per_core"] == [0.0]
+
+
+def test_missing_iowait_and_steal_fields():
+    Times = namedtuple("Times", ["user", "system", "idle"])
+    sampler = ResourceSampler()
+
+    result = sample(sampler, Times(30.0, 20.0, 50.0), [])
+
+    assert result["cpu"] == 50.0
+    assert result["cpu_iowait"] == 0.0
+    assert result["cpu_steal"] == 0.0
+
+
+NetIO = namedtuple("NetIO", ["bytes_sent", "bytes_recv", "packets_sent", "packets_recv"])
+
+
+def sample_network(sampler, counters, now):
+    with patch(
+        "app.utils.resource_sampler.psutil.net_io_counters", return_value=counters
+    ), patch("app.utils.resource_sampler.time.monotonic", return_value=now):
+        return sampler.sample_network()
+
+
+def test_first_network_sample_has_no_rates():
+    sampler = ResourceSampler()
+
+    result = sample_network(
+        sampler, {"eth0": NetIO(1024 * 1024, 2 * 1024 * 1024, 10, 20)}, 100.0
+    )
+
+    assert result["net_sent"] == 1.0
+    assert result["net_recv"] == 2.0
+    assert result["net_sent_rate"] is None
+    assert result["net_packets_recv_rate"] is None
+    assert result["net_per_nic"] == {}
+
+
+def test_network_rates_per_interface():
+    sampler = ResourceSampler()
+    sample_network(
+        sampler, {"eth0": NetIO(1000, 2000, 10, 20), "lo": NetIO(0, 0, 0, 0)}, 100.0
+    )
+
+    result = sample_network(
+        sampler,
+        {
+            "eth0": NetIO(6000, 12000, 60, 120),
+            "lo": NetIO(500, 500, 5, 5),
+            "wlan0": NetIO(10**6, 10**6, 1, 1),
+        },
+        105.0,
+    )
+
+    assert result["net_per_nic"]["eth0"] == {
+        "net_sent_rate": 1000.0,
+        "net_recv_rate": 2000.0,
+        "net_packets_sent_rate": 10.0,
+        "net_packets_recv_rate": 20.0,
+    }
+    assert "wlan0" not in result["net_per_nic"]
+    assert result["net_sent_rate"] == 1100.0
+    assert result["net_recv_rate"] == 2100.0
+    assert result["net_packets_sent_rate"] == 11.0
+    assert result["net_packets_recv_rate"] == 21.0
+
+
+def test_network_counter_wrap_and_reset():
+    sampler = ResourceSampler()
+    sample_network(
+        sampler, {"eth0": NetIO(2**32 - 100, 2**40, 0, 0)}, 100.0
+    )
+
+    result = sample_network(sampler, {"eth0": NetIO(100, 50, 0, 0)}, 101.0)
+
+    assert result["net_sent_rate"] == 200.0
+    assert result["net_recv_rate"] == 50.0
@@ -0,0 +1,111 @@
+import pytest
+from datetime import datetime, timedelta
+from flask import Flask
+from app.models import db, Monitor, MonitorRollup
+from app.utils.rollup_utils import (
+    floor_time,
+    aggregate_bucket,
+    rollup_tier,
+    prune_tier,
+    select_rollup_tier,
+    get_rollup_series,
+)
+
+TIERS = [(60, 7 * 24), (15 * 60, 90 * 24), (60 * 60, 2 * 365 * 24)]
+
+
+@pytest.fixture
+def rollup_app():
+    rollup_app = Flask(__name__)
+    rollup_app.config.update(
+        SQLALCHEMY_DATABASE_URI="sqlite://",
+        ROLLUP_TIERS=TIERS,
+    )
+    db.init_app(rollup_app)
+    with rollup_app.app_context():
+        db.create_all()
+        yield rollup_app
+        db.session.remove()
+
+
+def add_samples(start, count, step=timedelta(seconds=10)):
+    for i in range(count):
+        db.session.add(
+            Monitor(
+                timestamp=start + step * i,
+                cpu=float(i),
+                ram=50.0,
+                disk=30.0,
+                net_sent=1.0,
+                net_recv=2.0,
+                cpu_temp=60.0,
+            )
+        )
+    db.session.commit()
+
+
+def test_floor_time():
+    timestamp = datetime(2025, 5, 20, 12, 17, 42)
+    assert floor_time(timestamp, 60) == datetime(2025, 5, 20, 12, 17)
+    assert floor_time(timestamp, 900) == datetime(2025, 5, 20, 12, 15)
+    assert floor_time(timestamp, 3600) == datetime(2025, 5, 20, 12, 0)
+
+
+def test_aggregate_bucket():
+    stats = aggregate_bucket([float(i) for i in range(1, 21)] + ["Brak danych"])
+    assert stats == {"count": 20, "min": 1.0, "max": 20.0, "avg": 10.5, "p95": 19.0}
+    assert aggregate_bucket(["Brak danych", None]) is None
+
+
+def test_rollup_tier_aggregates_complete_buckets(rollup_app):
+    start = datetime(2025, 5, 20, 12, 0)
+    add_samples(start, 18)
+
+    created = rollup_tier(60, start + timedelta(minutes=4))
+
+    rows = MonitorRollup.query.filter_by(metric="cpu").order_by(MonitorRollup.bucket_start).all()
+    assert [row.bucket_start for row in rows] == [start, start + timedelta(minutes=1)]
+    assert [row.count for row in rows] == [6, 6]
+    assert rows[0].min == 0.0
+    assert rows[0].max == 5.0
+    assert rows[0].avg == 2.5
+    assert created == 12
+
+    assert rollup_tier(60, start + timedelta(minutes=4)) == 0
+
+
+def test_prune_tier(rollup_app):
+    start = datetime(2025, 5, 20, 12, 0)
+    add_samples(start, 18)
+    rollup_tier(60, start + timedelta(minutes=4))
+
+    removed = prune_tier(60, start + timedelta(minutes=1))
+
+    assert removed == 6
+    assert MonitorRollup.query.count() == 6
+
+
+def test_get_rollup_series(rollup_app):
+    start = datetime(2025, 5, 20, 12, 0)
+    add_samples(start, 18)
+    rollup_tier(60, start + timedelta(minutes=4))
+
+    timestamps, series = get_rollup_series(60, start, None, "max")
+
+    assert timestamps == [start, start + timedelta(minutes=1)]
+    assert series["cpu_usage"] == [5.0, 11.0]
+    assert series["temperature"] == [60.0, 60.0]
+
+
+def test_select_rollup_tier(rollup_app):
+    now = datetime(2025, 5, 20, 12, 0)
+
+    assert select_rollup_tier(None, None, 300, 24, now) is None
+    assert select_rollup_tier(now - timedelta(hours=1), None, 300, 24, now) is None
+    assert select_rollup_tier(now - timedelta(hours=1), None, None, 24, now) is None
+    assert select_rollup_tier(now - timedelta(hours=24), None, 300, 24, now) == 60
+    assert select_rollup_tier(now - timedelta(days=7), None, 300, 24, now) == 900
+    assert select_rollup_tier(now - timedelta(days=3), None, None, 24, now) == 60
+    assert select_rollup_tier(now - timedelta(days=30), None, 300, 24, now) == 3600
+    assert select_rollup_tier(now - timedelta(days=30), None, None, 24, now) == 900
+    assert select_rollup_tier(now - timedelta(days=1000), None, None, 24, now) == 3600
@@ -0,0 +1,144 @@
+import pytest
+from unittest.mock import patch
+from datetime import datetime
+from flask import Flask
+from app.models import db, AlertRule, Settings
+from app.utils.rules_engine import Rule, RulesEngine, sample_values
+from app.utils.system_monitor import check_alerts
+
+NOW = datetime(2025, 5, 20, 12, 0)
+
+
+@pytest.fixture
+def app_context(app):
+    with app.app_context():
+        yield
+
+
+@pytest.fixture
+def rules_app():
+    rules_app = Flask(__name__)
+    rules_app.config.update(SQLALCHEMY_DATABASE_URI="sqlite://")
+    db.init_app(rules_app)
+    with rules_app.app_context():
+        db.create_all()
+        db.session.add(Settings(cpu_alert_temp=80))
+        db.session.commit()
+        yield rules_app
+        db.session.remove()
+
+
+def make_engine(*rules):
+    engine = RulesEngine()
+    engine.set_rules(list(rules))
+    return engine
+
+
+def feed(engine, metric, values):
+    return [
+        [(t.fired, t.value) for t in engine.evaluate({"timestamp": NOW, metric: value})]
+        for value in values
+    ]
+
+
+def test_rule_fires_after_consecutive_samples(app_context):
+    engine = make_engine(Rule("ram", "RAM", "ram", ">", 90, for_samples=3))
+
+    assert feed(engine, "ram", [95, 95, 50, 95, 95, 95, 95]) == [
+        [], [], [], [], [], [(True, 95)], [],
+    ]
+
+
+def test_rule_rolling_average_ignores_spike(app_context):
+    engine = make_engine(Rule("cpu", "CPU", "cpu", ">=", 80, avg_window=3))
+
+    assert feed(engine, "cpu", [10, 100, 10, 90, 90, 90]) == [
+        [], [], [], [], [], [(True, 90)],
+    ]
+
+
+def test_rule_hysteresis(app_context):
+    engine = make_engine(Rule("temp", "CPU Temperature", "cpu_temp", ">=", 80, hysteresis=2))
+
+    assert feed(engine, "cpu_temp", [81, 79, 80.5, 78.5, 77.9, 80]) == [
+        [(True, 81)], [], [], [], [(False, 77.9)], [(True, 80)],
+    ]
+
+
+def test_rules_engine_firing(app_context):
+    engine = make_engine(Rule("temp", "CPU Temperature", "cpu_temp", ">=", 80, hysteresis=2))
+
+    feed(engine, "cpu_temp", [81])
+    assert engine.firing() == [
+        {
+            "name": "CPU Temperature",
+            "metric": "cpu_temp",
+            "operator": ">=",
+            "threshold": 80,
+            "value": 81,
+            "since": NOW.isoformat(),
+        }
+    ]
+
+    feed(engine, "cpu_temp", [70])
+    assert engine.firing() == []
+
+
+def test_rule_below_threshold(app_context):
+    engine = make_engine(Rule("disk", "Free disk", "disk_free", "<", 10, hysteresis=5))
+
+    assert feed(engine, "disk_free", [9, 12, 16]) == [[(True, 9)], [], [(False, 16)]]
+
+
+def test_rule_skips_missing_values(app_context):
+    engine = make_engine(Rule("net", "Upload", "net_sent_rate", ">", 100, for_samples=2))
+
+    assert feed(engine, "net_sent_rate", [200, None, 200]) == [[], [], [(True, 200)]]
+
+
+def test_rule_metric_collector_series(app_context):
+    engine = make_engine(Rule("load", "Load", "load.1m", ">", 4))
+    sample = {"timestamp": NOW, "metrics": [{"series": "load.1m", "timestamp": NOW, "value": 5.0}]}
+
+    assert sample_values(sample) == {"load.1m": 5.0}
+    assert [t.fired for t in engine.evaluate(sample)] == [True]
+
+
+def test_set_rules_keeps_state_of_unchanged_rules(app_context):
+    rule = Rule("ram", "RAM", "ram", ">", 90, for_samples=2)
+    engine = make_engine(rule)
+    feed(engine, "ram", [95])
+
+    engine.set_rules([rule, Rule("x", "Bad", "ram", "=>", 1)])
+    assert feed(engine, "ram", [95]) == [[(True, 95)]]
+
+    engine.set_rules([Rule("ram", "RAM", "ram", ">", 90, for_samples=3)])
+    assert feed(engine, "ram", [95, 95]) == [[], []]
+
+
+def test_reload_uses_settings_cpu_temp_rule(rules_app):
+    engine = RulesEngine()
+    engine.reload()
+    assert [(r.metric, r.threshold) for r in engine._rules] == [("cpu_temp", 80)]
+
+    db.session.add(AlertRule(name="Hot CPU", metric="cpu_temp", threshold=70, for_samples=3))
+    db.session.add(AlertRule(name="RAM", metric="ram", threshold=90, enabled=False))
+    db.session.commit()
+    engine.reload()
+
+    assert [(r.name, r.threshold, r.for_samples) for r in engine._rules] == [("Hot CPU", 70, 3)]
+
+
+@patch("app.utils.system_monitor.enqueue_alert")
+def test_check_alerts_enqueues_transitions(mock_enqueue_alert, app_context):
+    rule = Rule("temp", "CPU Temperature", "cpu_temp", ">=", 70, hysteresis=2)
+    with patch("app.utils.system_monitor.rules_engine", make_engine(rule)):
+        check_alerts({"timestamp": NOW, "cpu_temp": 75.0})
+        check_alerts({"timestamp": NOW, "cpu_temp": 76.0})
+        check_alerts({"timestamp": NOW, "cpu_temp": 60.0})
+
+    assert [c.args[0] for c in mock_enqueue_alert.call_args_list] == [
+        "CPU Temperature Alert.",
+        "CPU Temperature Resolved.",
+    ]
+    assert "Current cpu_temp = 75.0\nLimit = >= 70" in mock_enqueue_alert.call_args_list[0].args[1]
@@ -0,0 +1,139 @@
+import math
+import pytest
+from datetime import datetime, timedelta
+from app.utils.sample_buffer import SampleRingBuffer, SharedSampleRingBuffer
+
+START = datetime(2025, 5, 20, 12, 0)
+
+
+def make_sample(second, cpu=None, cpu_temp=50.0):
+    return {
+        "timestamp": START + timedelta(seconds=second),
+        "cpu": float(second) if cpu is None else cpu,
+        "cpu_temp": cpu_temp,
+        "cpu_per_core": [1.0, 2.0],
+    }
+
+
+@pytest.fixture
+def sample_buffer():
+    sample_buffer = SampleRingBuffer(4, ["cpu", "cpu_temp"])
+    for second in range(6):
+        sample_buffer.append(make_sample(second, cpu_temp=None if second == 5 else 50.0))
+    return sample_buffer
+
+
+def test_ring_buffer_keeps_newest_samples(sample_buffer):
+    assert len(sample_buffer) == 4
+    assert sample_buffer.oldest_timestamp() == START + timedelta(seconds=2)
+    assert sample_buffer.latest() == {
+        "timestamp": START + timedelta(seconds=5),
+        "cpu": 5.0,
+        "cpu_temp": None,
+    }
+
+
+def test_ring_buffer_empty():
+    sample_buffer = SampleRingBuffer(4, ["cpu"])
+
+    assert sample_buffer.latest() is None
+    assert sample_buffer.oldest_timestamp() is None
+    assert not sample_buffer.covers(START)
+    assert sample_buffer.average("cpu", 60) is None
+    assert sample_buffer.series() == ([], {"cpu": []})
+
+
+def test_ring_buffer_covers(sample_buffer):
+    assert sample_buffer.covers(START + timedelta(seconds=2))
+    assert not sample_buffer.covers(START + timedelta(seconds=1))
+    assert not sample_buffer.covers(None)
+
+
+def test_ring_buffer_average(sample_buffer):
+    now = START + timedelta(seconds=5)
+
+    assert sample_buffer.average("cpu", 2, now=now) == 4.0
+    assert sample_buffer.average("cpu", 60, now=now) == 3.5
+    assert sample_buffer.average("cpu_temp", 60, now=now) == 50.0
+    assert sample_buffer.average("cpu_temp", 0, now=now) is None
+
+
+def test_ring_buffer_series(sample_buffer):
+    timestamps, series = sample_buffer.series(
+        start=START + timedelta(seconds=3), end=START + timedelta(seconds=4)
+    )
+    assert timestamps == [START + timedelta(seconds=3), START + timedelta(seconds=4)]
+    assert series == {"cpu": [3.0, 4.0], "cpu_temp": [50.0, 50.0]}
+
+    timestamps, series = sample_buffer.series(after=START + timedelta(seconds=4))
+    assert timestamps == [START + timedelta(seconds=5)]
+    assert series["cpu_temp"] == [None]
+
+
+def test_ring_buffer_footprint():
+    sample_buffer = SampleRingBuffer(720, ["cpu", "ram", "disk"])
+
+    assert all(values.itemsize == 8 for values in sample_buffer._values.values())
+    assert sum(len(values) for values in sample_buffer._values.values()) == 3 * 720
+    assert math.isnan(sample_buffer._timestamps[0])
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return str(tmp_path / "samples.bin")
+
+
+def test_shared_buffer_reader_sees_writer_samples(store_path):
+    writer = SharedSampleRingBuffer(store_path, 4, ["cpu", "cpu_temp"], writable=True)
+    reader = SharedSampleRingBuffer(store_path, 4, ["cpu", "cpu_temp"])
+    assert reader.latest() is None
+
+    for second in range(6):
+        writer.append(make_sample(second))
+
+    assert len(reader) == 4
+    assert reader.oldest_timestamp() == START + timedelta(seconds=2)
+    assert reader.latest()["cpu"] == 5.0
+    assert reader.series(after=START + timedelta(seconds=3))[1] == {
+        "cpu": [4.0, 5.0],
+        "cpu_temp": [50.0, 50.0],
+    }
+    with pytest.raises(PermissionError):
+        reader.append(make_sample(6))
+
+    writer.close()
+    reader.close()
+
+
+def test_shared_buffer_survives_writer_restart(store_path):
+    writer = SharedSampleRingBuffer(store_path, 4, ["cpu"], writable=True)
+    writer.append(make_sample(0))
+    writer.close()
+
+    writer = SharedSampleRingBuffer(store_path, 4, ["cpu"], writable=True)
+    writer.append(make_sample(1))
+
+    assert writer.series()[1] == {"cpu": [0.0, 1.0]}
+    writer.close()
+
+
+def test_shared_buffer_layout_change(store_path):
+    reader = SharedSampleRingBuffer(store_path, 4, ["cpu"])
+    old_writer = SharedSampleRingBuffer(store_path, 8, ["cpu"], writable=True)
+    old_writer.append(make_sample(0))
+
+    assert len(reader) == 0
+
+    writer = SharedSampleRingBuffer(store_path, 4, ["cpu"], writable=True)
+    writer.append(make_sample(1))
+
+    assert reader.latest()["cpu"] == 1.0
+    assert len(old_writer) == 0
+
+
+def test_shared_buffer_missing_file(store_path):
+    reader = SharedSampleRingBuffer(store_path, 4, ["cpu"])
+
+    assert len(reader) == 0
+    assert reader.average("cpu", 60) is None
+    assert reader.series() == ([], {"cpu": []})
@@ -11,6 +11,7 @@ def test_create_settings_with_defaults(app):
         assert settings.id is not None
         assert settings.cpu_alert_temp == 75
         assert settings.alerts_frequency_hrs == 1
+        assert settings.data_retention_hrs == 24
         assert "<Limit id=" in repr(settings)
 
 
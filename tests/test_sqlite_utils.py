@@ -0,0 +1,47 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from app.utils.sqlite_utils import (
+    DEFAULT_SQLITE_PRAGMAS,
+    configure_sqlite_engine,
+    create_read_engine,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pulse.db'}")
+    configure_sqlite_engine(engine, DEFAULT_SQLITE_PRAGMAS)
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE monitor (id INTEGER PRIMARY KEY, cpu FLOAT)"))
+        connection.execute(text("INSERT INTO monitor (cpu) VALUES (42.0)"))
+    yield engine
+    engine.dispose()
+
+
+def test_configure_sqlite_engine(engine):
+    with engine.connect() as connection:
+        assert connection.scalar(text("PRAGMA journal_mode")) == "wal"
+        assert connection.scalar(text("PRAGMA synchronous")) == 1
+        assert connection.scalar(text("PRAGMA busy_timeout")) == 5000
+        assert connection.scalar(text("PRAGMA cache_size")) == -16000
+
+
+def test_read_engine_is_read_only(engine):
+    read_engine = create_read_engine(engine, DEFAULT_SQLITE_PRAGMAS, pool_size=2)
+
+    with read_engine.connect() as connection:
+        assert connection.scalar(text("SELECT cpu FROM monitor")) == 42.0
+        assert connection.scalar(text("PRAGMA query_only")) == 1
+        with pytest.raises(OperationalError):
+            connection.execute(text("DELETE FROM monitor"))
+
+    with engine.begin() as connection:
+        connection.execute(text("INSERT INTO monitor (cpu) VALUES (43.0)"))
+    with read_engine.connect() as connection:
+        assert connection.scalar(text("SELECT count(*) FROM monitor")) == 2
+    read_engine.dispose()
+
+
+def test_read_engine_needs_database_file():
+    assert create_read_engine(create_engine("sqlite://"), DEFAULT_SQLITE_PRAGMAS, 2) is None
@@ -1,9 +1,11 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock, ANY
 from datetime import datetime, timedelta
 from app.utils.telegram_utils import (
+    TelegramClient,
     init_telegram_bot,
     send_telegram,
+    send_telegram_many,
     filter_users_and_send_alert_telegram,
 )
 from app.models import User, Settings
@@ -22,7 +24,7 @@ def test_init_telegram_bot_success(mock_bot_class):
     mock_bot_class.return_value = "bot_instance"
     bot = init_telegram_bot()
     assert bot == "bot_instance"
-    mock_bot_class.assert_called_once_with(token="fake_token")
+    mock_bot_class.assert_called_once_with(token="fake_token", request=ANY)
 
 
 @patch("app.utils.telegram_utils.os.environ", {})
@@ -33,29 +35,79 @@ def test_init_telegram_bot_missing_env_var(mock_logger):
     mock_logger.error.assert_called()
 
 
-@patch("app.utils.telegram_utils.init_telegram_bot")
-@patch("app.utils.telegram_utils.asyncio")
-@patch("app.utils.telegram_utils.logger")
-def test_send_telegram_success(mock_logger, mock_asyncio, mock_init_bot):
-    mock_bot = MagicMock()
-    mock_init_bot.return_value = mock_bot
+@pytest.fixture
+def telegram_client():
+    bot = MagicMock()
+    bot.send_message = AsyncMock()
+    bot.request.shutdown = AsyncMock()
+    client = TelegramClient(bot)
+    yield client
+    client.close()
 
-    mock_asyncio.run = MagicMock()
+
+@patch("app.utils.telegram_utils.get_telegram_client")
+@patch("app.utils.telegram_utils.logger")
+def test_send_telegram_success(mock_logger, mock_get_client):
+    mock_client = MagicMock()
+    mock_get_client.return_value = mock_client
 
     result = send_telegram("chat_id_123", "Hello Telegram")
     assert result is True
-    mock_asyncio.run.assert_called_once()
+    mock_client.send.assert_called_once_with("chat_id_123", "Hello Telegram")
     mock_logger.info.assert_called()
 
 
-@patch("app.utils.telegram_utils.init_telegram_bot")
-def test_send_telegram_no_bot(mock_init_bot):
-    mock_init_bot.return_value = None
+@patch("app.utils.telegram_utils.get_telegram_client")
+def test_send_telegram_no_bot(mock_get_client):
+    mock_get_client.return_value = None
     result = send_telegram("chat_id_123", "Hello Telegram")
     assert result is False
 
 
+@patch("app.utils.telegram_utils.get_telegram_client")
+def test_send_telegram_many_no_bot(mock_get_client):
+    mock_get_client.return_value = None
+    assert send_telegram_many(["chat1", "chat2"], "Hello") == {
+        "chat1": False,
+        "chat2": False,
+    }
+
+
+def test_telegram_client_reuses_bot_and_loop(telegram_client):
+    telegram_client.send("chat1", "first")
+    telegram_client.send("chat2", "second")
+
+    assert telegram_client.bot.send_message.await_count == 2
+    telegram_client.bot.send_message.assert_awaited_with(chat_id="chat2", text="second")
+    assert telegram_client._thread.is_alive()
+
+
+@patch("app.utils.telegram_utils.logger")
+def test_telegram_client_send_many(mock_logger, telegram_client):
+    async def send_message(chat_id, text):
+        if chat_id == "blocked":
+            raise RuntimeError("Forbidden: bot was blocked by the user")
+
+    telegram_client.bot.send_message.side_effect = send_message
+
+    results = telegram_client.send_many(["chat1", "blocked", "chat2"], "Alert")
+
+    assert results == {"chat1": True, "blocked": False, "chat2": True}
+    assert telegram_client.bot.send_message.await_count == 3
+    mock_logger.error.assert_called_once()
+
+
+def test_telegram_client_close(telegram_client):
+    telegram_client.close()
+    telegram_client.close()
+
+    telegram_client.bot.request.shutdown.assert_awaited_once()
+    assert not telegram_client._thread.is_alive()
+
+
 @patch("app.utils.telegram_utils.send_telegram")
+@patch("app.utils.telegram_utils.db")
+@patch("app.utils.telegram_utils.mark_alerts_sent")
 @patch("app.utils.telegram_utils.send_admin_email")
 @patch("app.utils.telegram_utils.User")
 @patch("app.utils.telegram_utils.Settings")
@@ -65,6 +117,8 @@ def test_filter_users_and_send_alert_telegram(
     mock_settings,
     mock_user,
     mock_send_admin_email,
+    mock_mark_alerts_sent,
+    mock_db,
     mock_send_telegram,
     app_context,
 ):
@@ -73,14 +127,12 @@ def test_filter_users_and_send_alert_telegram(
     user1 = MagicMock()
     user1.email = "user1@example.com"
     user1.telegram_chat_id = "chat1"
-    user1.last_alert_time = None
-    user1.update_last_alert_time = MagicMock()
+    user1.last_telegram_alert_time = None
 
     user2 = MagicMock()
     user2.email = "user2@example.com"
     user2.telegram_chat_id = "chat2"
-    user2.last_alert_time = datetime.now() - timedelta(minutes=30)
-    user2.update_last_alert_time = MagicMock()
+    user2.last_telegram_alert_time = datetime.now() - timedelta(minutes=30)
 
     mock_user.query.filter_by.return_value.all.return_value = [user1, user2]
 
@@ -89,11 +141,14 @@ def test_filter_users_and_send_alert_telegram(
     filter_users_and_send_alert_telegram("Trade alert")
 
     mock_send_telegram.assert_called_once_with(chat_id="chat1", msg="Trade alert")
-    user1.update_last_alert_time.assert_called_once()
+    mock_mark_alerts_sent.assert_called_once_with("telegram", [user1])
+    mock_db.session.commit.assert_called_once()
     mock_logger.warning.assert_called_once()
 
 
 @patch("app.utils.telegram_utils.send_telegram")
+@patch("app.utils.telegram_utils.db")
+@patch("app.utils.telegram_utils.mark_alerts_sent")
 @patch("app.utils.telegram_utils.send_admin_email")
 @patch("app.utils.telegram_utils.User")
 @patch("app.utils.telegram_utils.Settings")
@@ -103,6 +158,8 @@ def test_filter_users_and_send_alert_telegram_send_failure(
     mock_settings,
     mock_user,
     mock_send_admin_email,
+    mock_mark_alerts_sent,
+    mock_db,
     mock_send_telegram,
     app_context,
 ):
@@ -111,8 +168,7 @@ def test_filter_users_and_send_alert_telegram_send_failure(
     user = MagicMock()
     user.email = "user@example.com"
     user.telegram_chat_id = "chat_id"
-    user.last_alert_time = None
-    user.update_last_alert_time = MagicMock()
+    user.last_telegram_alert_time = None
 
     mock_user.query.filter_by.return_value.all.return_value = [user]
     mock_send_telegram.return_value = False
@@ -121,4 +177,4 @@ def test_filter_users_and_send_alert_telegram_send_failure(
 
     mock_logger.error.assert_called_once()
     mock_send_admin_email.assert_called_once()
-    user.update_last_alert_time.assert_not_called()
+    mock_mark_alerts_sent.assert_called_once_with("telegram", [])